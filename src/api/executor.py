@@ -0,0 +1,228 @@
+"""
+Executor limitado para o trabalho bloqueante da API.
+
+Os handlers são ``async``, mas o parsing de PDF é bloqueante. Este módulo
+executa esse trabalho em um pool de threads (ou processos), fora do event
+loop, com controle de admissão: no máximo ``max_workers`` parsings em
+execução e ``max_fila`` aguardando. Acima disso a requisição é recusada com
+503 e ``Retry-After``; parsings que passam do tempo limite retornam 504.
+
+Configuração por variáveis de ambiente:
+
+- ``BOLETO_API_MAX_WORKERS``: parsings simultâneos (padrão: 4)
+- ``BOLETO_API_MAX_FILA``: parsings aguardando na fila (padrão: 16)
+- ``BOLETO_API_TIMEOUT``: tempo limite por requisição, em segundos (padrão: 60)
+- ``BOLETO_API_RETRY_AFTER``: valor do Retry-After, em segundos (padrão: 1)
+- ``BOLETO_API_USAR_PROCESSOS``: "1" para usar processos em vez de threads
+- ``BOLETO_API_CACHE_MB``: tamanho do cache de resultados em memória, em MB
+  (padrão: 64; 0 desativa)
+- ``BOLETO_API_CACHE_DISCO``: arquivo SQLite da camada em disco do cache
+- ``BOLETO_API_CACHE_TTL``: validade dos resultados em cache, em segundos
+  (padrão: 0, sem expiração)
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from ..parser import BoletoParser, CacheResultados
+from ..utils.logger import get_logger
+
+logger = get_logger("api_executor")
+
+
+class ServicoSobrecarregadoError(Exception):
+    """Limite de parsings em execução e na fila foi atingido"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Servidor sobrecarregado, tente novamente mais tarde")
+        self.retry_after = retry_after
+
+
+class TempoEsgotadoError(Exception):
+    """O parsing excedeu o tempo limite da requisição"""
+
+
+class ExecutorParsing:
+    """Executor com limite de concorrência, fila e tempo limite"""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_fila: int = 16,
+        timeout: Optional[float] = 60.0,
+        retry_after: int = 1,
+        usar_processos: bool = False,
+    ):
+        """
+        Inicializa o executor
+
+        Args:
+            max_workers: Número máximo de tarefas em execução
+            max_fila: Número máximo de tarefas aguardando um worker
+            timeout: Tempo limite por tarefa, em segundos (None = sem limite)
+            retry_after: Segundos sugeridos no cabeçalho Retry-After
+            usar_processos: Usa ProcessPoolExecutor em vez de threads
+        """
+        self.max_workers = max_workers
+        self.max_fila = max_fila
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.usar_processos = usar_processos
+        self._em_andamento = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+
+    @classmethod
+    def do_ambiente(cls) -> "ExecutorParsing":
+        """Cria o executor a partir das variáveis de ambiente BOLETO_API_*"""
+        timeout = float(os.environ.get("BOLETO_API_TIMEOUT", "60"))
+        return cls(
+            max_workers=int(os.environ.get("BOLETO_API_MAX_WORKERS", "4")),
+            max_fila=int(os.environ.get("BOLETO_API_MAX_FILA", "16")),
+            timeout=timeout if timeout > 0 else None,
+            retry_after=int(os.environ.get("BOLETO_API_RETRY_AFTER", "1")),
+            usar_processos=os.environ.get("BOLETO_API_USAR_PROCESSOS") == "1",
+        )
+
+    @property
+    def em_andamento(self) -> int:
+        """Tarefas admitidas (em execução ou na fila)"""
+        return self._em_andamento
+
+    def _obter_executor(self) -> Executor:
+        """Cria o pool no primeiro uso"""
+        with self._lock:
+            if self._executor is None:
+                tipo = (
+                    ProcessPoolExecutor if self.usar_processos else ThreadPoolExecutor
+                )
+                self._executor = tipo(max_workers=self.max_workers)
+            return self._executor
+
+    def _admitir(self) -> None:
+        """Reserva uma vaga ou recusa a tarefa se o limite foi atingido"""
+        with self._lock:
+            if self._em_andamento >= self.max_workers + self.max_fila:
+                logger.warning(
+                    "Requisição recusada por sobrecarga",
+                    em_andamento=self._em_andamento,
+                )
+                raise ServicoSobrecarregadoError(self.retry_after)
+            self._em_andamento += 1
+
+    def _liberar(self, _futuro: Any = None) -> None:
+        """Libera a vaga quando a tarefa termina de fato"""
+        with self._lock:
+            self._em_andamento -= 1
+
+    async def executar(self, funcao: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa uma função bloqueante fora do event loop
+
+        Args:
+            funcao: Função a executar (precisa ser serializável com processos)
+            *args: Argumentos da função
+
+        Returns:
+            Resultado da função
+
+        Raises:
+            ServicoSobrecarregadoError: Se não houver vaga no executor
+            TempoEsgotadoError: Se a tarefa exceder o tempo limite
+        """
+        self._admitir()
+        try:
+            futuro = self._obter_executor().submit(funcao, *args)
+        except Exception:
+            self._liberar()
+            raise
+        # A vaga só é liberada quando a tarefa termina, mesmo após timeout
+        futuro.add_done_callback(self._liberar)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(futuro), self.timeout)
+        except asyncio.TimeoutError:
+            logger.error("Tempo limite excedido", timeout=self.timeout)
+            raise TempoEsgotadoError(
+                f"Tempo limite de {self.timeout}s excedido ao processar o arquivo"
+            )
+
+    def fechar(self) -> None:
+        """Encerra o pool de workers"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# === TAREFAS EXECUTADAS NOS WORKERS ===
+
+_parser: Optional[BoletoParser] = None
+_parser_lock = threading.Lock()
+
+
+def cache_do_ambiente() -> Optional[CacheResultados]:
+    """Cria o cache de resultados a partir das variáveis BOLETO_API_CACHE_*"""
+    max_mb = float(os.environ.get("BOLETO_API_CACHE_MB", "64"))
+    caminho_disco = os.environ.get("BOLETO_API_CACHE_DISCO") or None
+    if max_mb <= 0 and caminho_disco is None:
+        return None
+    ttl = float(os.environ.get("BOLETO_API_CACHE_TTL", "0"))
+    return CacheResultados(
+        max_bytes=int(max(max_mb, 0) * 1024 * 1024),
+        caminho_disco=caminho_disco,
+        ttl=ttl if ttl > 0 else None,
+    )
+
+
+def _parser_do_worker() -> BoletoParser:
+    """Parser compartilhado pelas threads do processo (o parser é reentrante)"""
+    global _parser
+    with _parser_lock:
+        if _parser is None:
+            _parser = BoletoParser(
+                cache=cache_do_ambiente(),
+                paginas=os.environ.get("BOLETO_API_PAGINAS"),
+            )
+        return _parser
+
+
+def estatisticas_cache() -> Optional[dict]:
+    """
+    Contadores do cache de resultados deste processo
+
+    Returns:
+        Contadores, ou None sem cache ou com BOLETO_API_USAR_PROCESSOS=1
+        (cada processo worker tem o próprio cache e o processo principal
+        não faz parsing)
+    """
+    if executor.usar_processos:
+        return None
+    cache = _parser_do_worker().cache
+    return cache.estatisticas() if cache is not None else None
+
+
+def parse_pdf(conteudo: bytes, campos: Optional[Tuple[str, ...]] = None) -> dict:
+    """
+    Faz o parsing do PDF e retorna o resultado serializado
+
+    Com seleção de campos, o resultado traz os campos pedidos e o tipo do
+    boleto.
+    """
+    return _parser_do_worker().parse(conteudo, campos).model_dump()
+
+
+def parse_pagamento_pdf(conteudo: bytes) -> dict:
+    """Extrai apenas os dados para pagamento e retorna o resultado serializado"""
+    return _parser_do_worker().parse_pagamento(conteudo).model_dump()
+
+
+def extrair_texto_pdf(conteudo: bytes) -> str:
+    """Extrai o texto bruto do PDF"""
+    return _parser_do_worker().extrair_texto_pdf(conteudo)
+
+
+executor = ExecutorParsing.do_ambiente()
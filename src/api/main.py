@@ -1,5 +1,7 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
+from .executor import ServicoSobrecarregadoError, TempoEsgotadoError, executor
 from .routes_decode import router as decode_router
 from .routes_extract_text import router as extract_text_router
 from .routes_health import router as health_router
@@ -17,3 +19,27 @@ app.include_router(decode_router)
 app.include_router(validate_router)
 app.include_router(extract_text_router)
 app.include_router(health_router)
+
+
+@app.exception_handler(ServicoSobrecarregadoError)
+async def servico_sobrecarregado_handler(
+    request: Request, exc: ServicoSobrecarregadoError
+):
+    """Responde 503 com Retry-After quando o executor está saturado"""
+    return JSONResponse(
+        status_code=503,
+        content={"success": False, "error": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(TempoEsgotadoError)
+async def tempo_esgotado_handler(request: Request, exc: TempoEsgotadoError):
+    """Responde 504 quando o processamento excede o tempo limite"""
+    return JSONResponse(status_code=504, content={"success": False, "error": str(exc)})
+
+
+@app.on_event("shutdown")
+def encerrar_executor():
+    """Encerra o pool de workers do executor"""
+    executor.fechar()
@@ -1,19 +1,135 @@
-from fastapi import APIRouter
+import json
+import os
+from typing import Any, Dict, Iterator, List
 
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from ..core import Digitavel, FalhaDigitavel
 from ..parser import BoletoDecoder
 from .schemas import DecodeResponse
 
 router = APIRouter()
 decoder = BoletoDecoder()
 
+# Limite de linhas por requisição nos endpoints em lote
+MAX_LINHAS_LOTE = int(os.environ.get("BOLETO_API_LOTE_MAX", "5000"))
+_TAMANHO_BLOCO = 1000
+
 
 @router.post("/decode", response_model=DecodeResponse)
 async def decode_digitavel(digitavel: str):
     """
-    Decodifica um código digitável de boleto bancário.
+    Decodifica um código digitável (47 dígitos) ou código de barras (44).
     """
     try:
         dados = decoder.decodificar_digitavel(digitavel)
         return DecodeResponse(success=True, data=dados)
     except Exception as e:
         return DecodeResponse(success=False, error=str(e))
+
+
+@router.post("/decode/batch")
+async def decode_digitavel_lote(request: Request):
+    """
+    Decodifica e valida vários códigos digitáveis em uma chamada.
+
+    Aceita um array JSON ou NDJSON (uma linha por código; strings ou objetos
+    com a chave "digitavel"). Cada código pode ser a linha digitável (47
+    dígitos) ou o código de barras (44). Responde em NDJSON, um resultado por linha,
+    na ordem da entrada.
+    """
+    linhas = await _ler_linhas(request)
+    return _responder_ndjson(_decodificar_blocos(linhas))
+
+
+@router.post("/validate-digitavel/batch")
+async def validate_digitavel_lote(request: Request):
+    """
+    Valida os DVs de vários códigos digitáveis em uma chamada.
+
+    Mesmo formato de entrada de /decode/batch; a resposta NDJSON traz, para
+    cada código, se é válido e quais verificações falharam.
+    """
+    linhas = await _ler_linhas(request)
+    return _responder_ndjson(_validar_blocos(linhas))
+
+
+async def _ler_linhas(request: Request) -> List[str]:
+    """Lê os códigos do corpo (array JSON ou NDJSON)"""
+    corpo = (await request.body()).decode("utf-8", "replace").strip()
+    ndjson = "ndjson" in request.headers.get("content-type", "")
+    try:
+        if corpo.startswith("[") and not ndjson:
+            itens = json.loads(corpo)
+        else:
+            itens = [json.loads(linha) for linha in corpo.splitlines() if linha.strip()]
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Corpo inválido: {e}")
+
+    if len(itens) > MAX_LINHAS_LOTE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Máximo de {MAX_LINHAS_LOTE} códigos por requisição",
+        )
+    linhas = []
+    for item in itens:
+        if isinstance(item, dict):
+            item = item.get("digitavel")
+        if not isinstance(item, str):
+            raise HTTPException(
+                status_code=400,
+                detail="Cada item deve ser uma string ou objeto com 'digitavel'",
+            )
+        linhas.append(item)
+    return linhas
+
+
+def _descrever_falhas(codigo: int) -> List[str]:
+    """Nomes das verificações que falharam"""
+    return [
+        falha.name.lower()
+        for falha in FalhaDigitavel
+        if falha and int(codigo) & falha == falha
+    ]
+
+
+def _blocos(linhas: List[str]) -> Iterator[List[str]]:
+    """Divide o lote para começar a responder antes de processar tudo"""
+    for inicio in range(0, len(linhas), _TAMANHO_BLOCO):
+        yield linhas[inicio : inicio + _TAMANHO_BLOCO]
+
+
+def _validar_blocos(linhas: List[str]) -> Iterator[Dict[str, Any]]:
+    """Resultados da validação vetorizada, bloco a bloco"""
+    indice = 0
+    for bloco in _blocos(linhas):
+        resultado = Digitavel.validar_lote(bloco)
+        for linha, valido, falha in zip(bloco, resultado.validos, resultado.falhas):
+            yield {
+                "indice": indice,
+                "digitavel": linha,
+                "valido": bool(valido),
+                "falhas": _descrever_falhas(falha),
+            }
+            indice += 1
+
+
+def _decodificar_blocos(linhas: List[str]) -> Iterator[Dict[str, Any]]:
+    """Validação vetorizada seguida da decodificação de cada código"""
+    validacoes = _validar_blocos(linhas)
+    for validacao, (dados, erro) in zip(validacoes, decoder.decodificar_lote(linhas)):
+        yield {
+            **validacao,
+            "success": erro is None,
+            "data": dados,
+            "error": erro,
+        }
+
+
+def _responder_ndjson(resultados: Iterator[Dict[str, Any]]) -> StreamingResponse:
+    """Envia cada resultado como uma linha JSON"""
+    return StreamingResponse(
+        (json.dumps(r, ensure_ascii=False) + "\n" for r in resultados),
+        media_type="application/x-ndjson",
+    )
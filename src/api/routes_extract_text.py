@@ -1,11 +1,14 @@
-from pathlib import Path
-
 from fastapi import APIRouter, File, HTTPException, UploadFile
 
-from ..parser import BoletoParser
+from ..parser import detectar_tipo
+from .executor import (
+    ServicoSobrecarregadoError,
+    TempoEsgotadoError,
+    executor,
+    extrair_texto_pdf,
+)
 
 router = APIRouter()
-parser = BoletoParser()
 
 
 @router.post("/extract-text")
@@ -16,15 +19,15 @@ async def extract_text(file: UploadFile = File(...)):
     try:
         if not file.filename.lower().endswith(".pdf"):
             raise HTTPException(status_code=400, detail="Arquivo deve ser um PDF")
-        temp_file = Path(f"/tmp/{file.filename}")
-        with open(temp_file, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        try:
-            texto = parser.extrair_texto_pdf(str(temp_file))
-            return {"success": True, "texto": texto, "tamanho": len(texto)}
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        content = await file.read()
+        tipo_arquivo = detectar_tipo(content)
+        if not tipo_arquivo.is_pdf:
+            raise HTTPException(
+                status_code=400, detail=f"Arquivo não é um PDF válido: {tipo_arquivo}"
+            )
+        texto = await executor.executar(extrair_texto_pdf, content)
+        return {"success": True, "texto": texto, "tamanho": len(texto)}
+    except (ServicoSobrecarregadoError, TempoEsgotadoError):
+        raise
     except Exception as e:
         return {"success": False, "error": str(e)}
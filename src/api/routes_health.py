@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from .executor import estatisticas_cache
+
 router = APIRouter()
 
 
@@ -21,4 +23,8 @@ async def root():
 @router.get("/health")
 async def health_check():
     """Health check da API"""
-    return {"status": "healthy", "service": "boleto-parser-api"}
+    return {
+        "status": "healthy",
+        "service": "boleto-parser-api",
+        "cache": estatisticas_cache(),
+    }
@@ -1,34 +1,67 @@
-from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 
-from ..parser import BoletoParser
+from ..parser import MODOS_PARSING, detectar_tipo
+from ..parser.resultado import validar_campos
+from .executor import (
+    ServicoSobrecarregadoError,
+    TempoEsgotadoError,
+    executor,
+    parse_pagamento_pdf,
+    parse_pdf,
+)
 from .schemas import ParseResponse
 
 router = APIRouter()
-parser = BoletoParser()
 
 
 @router.post("/parse", response_model=ParseResponse)
-async def parse_boleto(file: UploadFile = File(...)):
+async def parse_boleto(
+    file: UploadFile = File(...),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a extrair, separados por vírgula (padrão: todos)",
+    ),
+    mode: str = Query(
+        "completo",
+        description=(
+            "completo: todos os campos; pagamento: apenas banco, valor, "
+            "vencimento e códigos, lidos da linha digitável"
+        ),
+    ),
+):
     """
     Parse um arquivo PDF de boleto bancário e retorna dados estruturados.
+
+    Com ``fields``, apenas os extratores dos campos pedidos são executados.
+    Com ``mode=pagamento``, só a linha digitável é localizada e decodificada.
     """
     try:
+        if mode not in MODOS_PARSING:
+            raise ValueError(
+                f"Modo desconhecido: {mode} (use {', '.join(MODOS_PARSING)})"
+            )
+        if mode == "pagamento" and fields is not None:
+            raise ValueError("'fields' não se aplica ao modo pagamento")
+        campos = validar_campos(fields)
         if not file.filename.lower().endswith(".pdf"):
             raise HTTPException(status_code=400, detail="Arquivo deve ser um PDF")
-        temp_file = Path(f"/tmp/{file.filename}")
-        with open(temp_file, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        try:
-            dados = parser.parse(str(temp_file))
-            dados_dict = dados.model_dump()
-            return ParseResponse(
-                success=True, data=dados_dict, tipo_boleto=dados.tipo_boleto
+        content = await file.read()
+        tipo_arquivo = detectar_tipo(content)
+        if not tipo_arquivo.is_pdf:
+            raise HTTPException(
+                status_code=400, detail=f"Arquivo não é um PDF válido: {tipo_arquivo}"
             )
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        if mode == "pagamento":
+            dados_dict = await executor.executar(parse_pagamento_pdf, content)
+            return ParseResponse(success=True, data=dados_dict)
+        dados_dict = await executor.executar(parse_pdf, content, campos)
+        tipo_boleto = dados_dict["tipo_boleto"]
+        if campos is not None and "tipo_boleto" not in campos:
+            del dados_dict["tipo_boleto"]  # "data" traz só os campos pedidos
+        return ParseResponse(success=True, data=dados_dict, tipo_boleto=tipo_boleto)
+    except (ServicoSobrecarregadoError, TempoEsgotadoError):
+        raise
     except Exception as e:
         return ParseResponse(success=False, error=str(e))
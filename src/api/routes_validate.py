@@ -1,11 +1,14 @@
-from pathlib import Path
-
 from fastapi import APIRouter, File, HTTPException, UploadFile
 
-from ..parser import BoletoParser
+from ..parser import detectar_tipo
+from .executor import (
+    ServicoSobrecarregadoError,
+    TempoEsgotadoError,
+    executor,
+    extrair_texto_pdf,
+)
 
 router = APIRouter()
-parser = BoletoParser()
 
 
 @router.post("/validate")
@@ -16,35 +19,31 @@ async def validate_boleto(file: UploadFile = File(...)):
     try:
         if not file.filename.lower().endswith(".pdf"):
             raise HTTPException(status_code=400, detail="Arquivo deve ser um PDF")
-        temp_file = Path(f"/tmp/{file.filename}")
-        with open(temp_file, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        try:
-            tipo_arquivo = parser.detectar_tipo_arquivo(str(temp_file))
-            if "PDF" not in tipo_arquivo:
-                return {
-                    "valid": False,
-                    "error": f"Arquivo não é um PDF válido: {tipo_arquivo}",
-                }
-            texto = parser.extrair_texto_pdf(str(temp_file))
-            elementos_boleto = [
-                "Beneficiário",
-                "Pagador",
-                "Vencimento",
-                "Valor",
-                "CNPJ",
-            ]
-            encontrados = [e for e in elementos_boleto if e in texto]
-            is_valid = len(encontrados) >= 3
+        content = await file.read()
+        tipo_arquivo = detectar_tipo(content, usar_libmagic=True)
+        if not tipo_arquivo.is_pdf:
             return {
-                "valid": is_valid,
-                "tipo_arquivo": tipo_arquivo,
-                "elementos_encontrados": encontrados,
-                "total_elementos": len(encontrados),
+                "valid": False,
+                "error": f"Arquivo não é um PDF válido: {tipo_arquivo}",
             }
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        texto = await executor.executar(extrair_texto_pdf, content)
+        elementos_boleto = [
+            "Beneficiário",
+            "Pagador",
+            "Vencimento",
+            "Valor",
+            "CNPJ",
+        ]
+        encontrados = [e for e in elementos_boleto if e in texto]
+        is_valid = len(encontrados) >= 3
+        return {
+            "valid": is_valid,
+            "tipo_arquivo": str(tipo_arquivo),
+            "deteccao_arquivo": tipo_arquivo.to_dict(),
+            "elementos_encontrados": encontrados,
+            "total_elementos": len(encontrados),
+        }
+    except (ServicoSobrecarregadoError, TempoEsgotadoError):
+        raise
     except Exception as e:
         return {"valid": False, "error": str(e)}
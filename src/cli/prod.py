@@ -1,5 +1,208 @@
+import time
+from pathlib import Path
+from typing import Optional
+
 import typer
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+
+from ..models import BoletoData, DadosPagamento
+from ..parser import MODOS_PARSING
+from ..parser.extracao_texto import ESTRATEGIAS_PAGINAS, SelecaoPaginas
+from ..parser.lote import Checkpoint, coletar_arquivos, processar_lote
+from ..parser.saida import (
+    ESCRITORES,
+    FORMATOS,
+    POLITICAS_FSYNC,
+    Projecao,
+    criar_escritor,
+    detectar_formato,
+)
 
 prod_app = typer.Typer(help="Comandos de produção")
+console = Console()
+
+
+@prod_app.command("parse-batch")
+def parse_batch(
+    entrada: str = typer.Argument(
+        ..., help="Diretório, padrão glob ('boletos/**/*.pdf') ou manifesto"
+    ),
+    saida: Path = typer.Option(
+        Path("resultados.jsonl"), "--saida", "-o", help="Arquivo de saída"
+    ),
+    formato: Optional[str] = typer.Option(
+        None, "--formato", "-f", help=f"Formato da saída: {', '.join(FORMATOS)}"
+    ),
+    padrao: str = typer.Option(
+        "*.pdf", "--padrao", "-p", help="Padrão dos arquivos dentro do diretório"
+    ),
+    manifesto: bool = typer.Option(
+        False, "--manifesto", help="Entrada é um arquivo com um caminho por linha"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Processos em paralelo (padrão: nº de CPUs)"
+    ),
+    checkpoint: Optional[Path] = typer.Option(
+        None,
+        "--checkpoint",
+        help="Arquivo de checkpoint; arquivos já registrados são pulados",
+    ),
+    campos: Optional[str] = typer.Option(
+        None,
+        "--campos",
+        help="Campos gravados, separados por vírgula (ex.: 'vencimento,valores')",
+    ),
+    excluir: Optional[str] = typer.Option(
+        None,
+        "--excluir",
+        help=(
+            "Campos omitidos, separados por vírgula ('' para gravar todos; "
+            "padrão no modo completo: 'texto_extraido')"
+        ),
+    ),
+    buffer: Optional[int] = typer.Option(
+        None, "--buffer", help="Registros mantidos em memória antes de gravar"
+    ),
+    fsync: str = typer.Option(
+        "nunca", "--fsync", help=f"Quando sincronizar: {', '.join(POLITICAS_FSYNC)}"
+    ),
+    paginas: str = typer.Option(
+        "todas",
+        "--paginas",
+        help=(
+            "Páginas convertidas em texto: "
+            f"{', '.join(e for e in ESTRATEGIAS_PAGINAS if e != 'intervalo')} "
+            "ou intervalo (ex.: '2-5', '-1')"
+        ),
+    ),
+    modo: str = typer.Option(
+        "completo",
+        "--modo",
+        "-m",
+        help=(
+            f"{', '.join(MODOS_PARSING)}; 'pagamento' grava só banco, valor, "
+            "vencimento e códigos, lidos da linha digitável"
+        ),
+    ),
+):
+    """Processa um lote de boletos PDF em paralelo, gravando à medida que termina."""
+    try:
+        arquivos = coletar_arquivos(entrada, padrao=padrao, manifesto=manifesto)
+    except FileNotFoundError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+
+    if modo not in MODOS_PARSING:
+        console.print(f"[red]✗[/red] Modo desconhecido: {modo}")
+        raise typer.Exit(1)
+    if excluir is None:
+        excluir = "texto_extraido" if modo == "completo" else ""
+    modelo = DadosPagamento if modo == "pagamento" else BoletoData
+
+    try:
+        projecao = Projecao(campos, excluir, modelo=modelo)
+        selecao = SelecaoPaginas.de_texto(paginas)
+        formato = formato or detectar_formato(saida)
+        if formato not in ESCRITORES:
+            raise ValueError(f"Formato de saída não suportado: {formato}")
+    except ValueError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+    if checkpoint and not ESCRITORES[formato].permite_anexar:
+        console.print(
+            f"[red]✗[/red] --checkpoint não é suportado com saída {formato}: "
+            "o arquivo não pode ser retomado (use jsonl ou csv)"
+        )
+        raise typer.Exit(1)
+
+    registro_checkpoint = Checkpoint(checkpoint) if checkpoint else None
+    if registro_checkpoint is not None:
+        total = len(arquivos)
+        arquivos = [a for a in arquivos if a not in registro_checkpoint]
+        if total != len(arquivos):
+            console.print(
+                f"[blue]Retomando:[/blue] {total - len(arquivos)} arquivo(s) já "
+                "processado(s)"
+            )
+
+    if not arquivos:
+        if registro_checkpoint is not None:
+            registro_checkpoint.fechar()
+        console.print("[yellow]Nenhum arquivo a processar[/yellow]")
+        raise typer.Exit(0)
+
+    def marcar_processados(registros):
+        # Só entram no checkpoint os arquivos cujo resultado já foi gravado
+        for registro in registros:
+            registro_checkpoint.registrar(registro["arquivo"])
+
+    try:
+        escritor = criar_escritor(
+            saida,
+            formato,
+            anexar=registro_checkpoint is not None,
+            projecao=projecao,
+            max_buffer=buffer,
+            fsync=fsync,
+            ao_gravar=marcar_processados if registro_checkpoint is not None else None,
+        )
+    except ValueError as e:
+        if registro_checkpoint is not None:
+            registro_checkpoint.fechar()
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+
+    falhas = 0
+    inicio = time.monotonic()
+    progresso = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("{task.fields[taxa]:.1f} arq/s"),
+        TextColumn("[red]{task.fields[falhas]} falha(s)"),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    )
+    processados = 0
+    try:
+        with escritor, progresso:
+            tarefa = progresso.add_task(
+                "Processando", total=len(arquivos), taxa=0.0, falhas=0
+            )
+            lote = processar_lote(
+                arquivos,
+                workers=workers,
+                projecao=projecao,
+                paginas=selecao,
+                modo=modo,
+            )
+            for registro in lote:
+                escritor.escrever(registro)
+                processados += 1
+                falhas += not registro["sucesso"]
+                decorrido = max(time.monotonic() - inicio, 1e-9)
+                progresso.update(
+                    tarefa,
+                    advance=1,
+                    taxa=processados / decorrido,
+                    falhas=falhas,
+                )
+    finally:
+        if registro_checkpoint is not None:
+            registro_checkpoint.fechar()
 
-# Comandos de produção podem ser adicionados aqui
+    console.print(
+        f"[green]✓[/green] {escritor.escritos} arquivo(s) processado(s) "
+        f"({falhas} falha(s)) em {time.monotonic() - inicio:.1f}s → {saida}"
+    )
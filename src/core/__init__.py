@@ -6,14 +6,33 @@ de boletos bancários conforme especificações da Febraban.
 """
 
 from .boleto import BoletoBancario
-from .digitavel import CamposDigitavel, Digitavel
-from .enums import TipoAceite, TipoCarteira, TipoDocumento, TipoMoeda
+from .codigo_barras import CodigoBarras
+from .correcao import SugestaoCorrecao, sugerir_correcoes
+from .digitavel import (
+    CamposDigitavel,
+    Digitavel,
+    LinhaDigitavel,
+    ResultadoValidacaoLote,
+)
+from .enums import (
+    FalhaDigitavel,
+    TipoAceite,
+    TipoCarteira,
+    TipoDocumento,
+    TipoMoeda,
+)
 from .validators import BoletoValidator, DigitavelValidator
 
 __all__ = [
     "BoletoBancario",
     "Digitavel",
+    "CodigoBarras",
     "CamposDigitavel",
+    "LinhaDigitavel",
+    "ResultadoValidacaoLote",
+    "SugestaoCorrecao",
+    "sugerir_correcoes",
+    "FalhaDigitavel",
     "TipoDocumento",
     "TipoAceite",
     "TipoMoeda",
@@ -0,0 +1,228 @@
+"""
+Código de barras (44 dígitos) de boletos bancários.
+
+Contém o valor CodigoBarras e a conversão em lote entre códigos de barras
+e linhas digitáveis, nos dois sentidos, seguindo o layout de layout.py.
+"""
+
+from typing import Iterable, List, Optional
+
+from ..utils.dv import modulo_10_many, modulo_11
+from ..utils.vencimento import fator_para_data_br
+from .layout import (
+    BARRAS_BANCO,
+    BARRAS_CAMPO5_LINHA,
+    BARRAS_CAMPO_LIVRE,
+    BARRAS_CAMPOS_LINHA,
+    BARRAS_DV_GERAL,
+    BARRAS_FATOR,
+    BARRAS_MOEDA,
+    BARRAS_VALOR,
+    TAMANHO_CODIGO_BARRAS,
+    TAMANHO_LINHA,
+    linha_para_codigo_barras,
+)
+
+# Caracteres removidos na normalização (equivalente a [.\s])
+_REMOVER_SEPARADORES = str.maketrans("", "", ". \t\n\r\x0b\x0c")
+
+
+def normalizar(valor: Optional[str]) -> str:
+    """Remove pontos e espaços de uma linha digitável ou código de barras"""
+    return valor.translate(_REMOVER_SEPARADORES) if valor else ""
+
+
+def eh_codigo_barras(valor: str) -> bool:
+    """Verifica se o valor normalizado tem o formato de código de barras"""
+    return len(valor) == TAMANHO_CODIGO_BARRAS and valor.isascii() and valor.isdigit()
+
+
+def codigos_para_linhas(codigos: Iterable[str]) -> List[Optional[str]]:
+    """
+    Converte vários códigos de barras para linhas digitáveis
+
+    Os DVs dos campos 1, 2 e 3 de todas as linhas são calculados em uma
+    única chamada a modulo_10_many().
+
+    Args:
+        codigos: Códigos de barras (com ou sem pontos e espaços)
+
+    Returns:
+        Linha digitável de cada código, ou None se não tiver 44 dígitos
+    """
+    normalizados = [normalizar(codigo) for codigo in codigos]
+    validos = [codigo for codigo in normalizados if eh_codigo_barras(codigo)]
+    campos: List[str] = []
+    for codigo in validos:
+        for fatias in BARRAS_CAMPOS_LINHA:
+            campos.append("".join([codigo[fatia] for fatia in fatias]))
+    dvs = modulo_10_many(campos)
+
+    linhas: List[Optional[str]] = []
+    i = 0
+    for codigo in normalizados:
+        if not eh_codigo_barras(codigo):
+            linhas.append(None)
+            continue
+        campo1, campo2, campo3 = campos[i : i + 3]
+        dv1, dv2, dv3 = dvs[i : i + 3]
+        linhas.append(
+            f"{campo1}{dv1}{campo2}{dv2}{campo3}{dv3}"
+            + codigo[BARRAS_DV_GERAL]
+            + codigo[BARRAS_CAMPO5_LINHA]
+        )
+        i += 3
+    return linhas
+
+
+def linhas_para_codigos(linhas: Iterable[str]) -> List[Optional[str]]:
+    """
+    Converte várias linhas digitáveis para códigos de barras
+
+    Args:
+        linhas: Linhas digitáveis (com ou sem pontos e espaços)
+
+    Returns:
+        Código de barras de cada linha, ou None se não tiver 47 dígitos
+    """
+    codigos: List[Optional[str]] = []
+    for linha in linhas:
+        linha = normalizar(linha)
+        if len(linha) == TAMANHO_LINHA and linha.isascii() and linha.isdigit():
+            codigos.append(linha_para_codigo_barras(linha))
+        else:
+            codigos.append(None)
+    return codigos
+
+
+def para_linha_digitavel(valor: Optional[str]) -> str:
+    """
+    Normaliza a entrada, convertendo códigos de barras para linha digitável
+
+    Args:
+        valor: Linha digitável ou código de barras
+
+    Returns:
+        Linha digitável normalizada (ou o valor normalizado, se não for um
+        código de barras)
+    """
+    normalizado = normalizar(valor)
+    if eh_codigo_barras(normalizado):
+        return codigos_para_linhas([normalizado])[0]
+    return normalizado
+
+
+class CodigoBarras:
+    """
+    Valor imutável de um código de barras de 44 dígitos.
+
+    Segue o mesmo padrão de LinhaDigitavel: ``__slots__``, normalização
+    com ``str.translate`` e nenhum logger por instância.
+    """
+
+    __slots__ = ("valor",)
+
+    def __init__(self, valor: Optional[str]):
+        """
+        Inicializa o código de barras
+
+        Args:
+            valor: Código de barras (com ou sem pontos e espaços)
+        """
+        object.__setattr__(self, "valor", normalizar(valor))
+
+    @classmethod
+    def da_linha_digitavel(cls, linha: str) -> "CodigoBarras":
+        """
+        Cria o código de barras a partir da linha digitável
+
+        Raises:
+            ValueError: Se a linha não tiver 47 dígitos
+        """
+        codigo = linhas_para_codigos([linha])[0]
+        if codigo is None:
+            raise ValueError(f"Linha digitável deve ter {TAMANHO_LINHA} dígitos")
+        return cls(codigo)
+
+    def __setattr__(self, nome: str, valor: object) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __delattr__(self, nome: str) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __eq__(self, outro: object) -> bool:
+        if isinstance(outro, CodigoBarras):
+            return self.valor == outro.valor
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.valor)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.valor!r})"
+
+    def __str__(self) -> str:
+        return self.valor
+
+    @property
+    def completo(self) -> bool:
+        """Indica se o valor tem o formato de código de barras"""
+        return eh_codigo_barras(self.valor)
+
+    def validar(self) -> bool:
+        """
+        Valida formato (44 dígitos) e DV geral (Módulo 11)
+
+        Returns:
+            True se válido, False caso contrário
+        """
+        if not self.completo:
+            return False
+        sem_dv = self.valor[:BARRAS_DV_GERAL] + self.valor[BARRAS_DV_GERAL + 1 :]
+        return modulo_11(sem_dv) == int(self.valor[BARRAS_DV_GERAL])
+
+    def linha_digitavel(self) -> Optional[str]:
+        """Linha digitável equivalente, com os DVs dos campos calculados"""
+        return codigos_para_linhas([self.valor])[0]
+
+    # === PROPRIEDADES ===
+
+    @property
+    def banco(self) -> Optional[str]:
+        """Retorna o código do banco"""
+        return self.valor[BARRAS_BANCO] if self.completo else None
+
+    @property
+    def moeda(self) -> Optional[str]:
+        """Retorna o código da moeda"""
+        return self.valor[BARRAS_MOEDA] if self.completo else None
+
+    @property
+    def dv_geral(self) -> Optional[str]:
+        """Retorna o DV geral"""
+        return self.valor[BARRAS_DV_GERAL] if self.completo else None
+
+    @property
+    def fator_vencimento(self) -> Optional[str]:
+        """Retorna o fator de vencimento"""
+        return self.valor[BARRAS_FATOR] if self.completo else None
+
+    @property
+    def valor_centavos(self) -> Optional[str]:
+        """Retorna o valor em centavos"""
+        return self.valor[BARRAS_VALOR] if self.completo else None
+
+    @property
+    def valor_documento(self) -> Optional[float]:
+        """Retorna o valor do documento em reais"""
+        return float(self.valor[BARRAS_VALOR]) / 100 if self.completo else None
+
+    @property
+    def data_vencimento(self) -> Optional[str]:
+        """Retorna a data de vencimento (dd/mm/aaaa)"""
+        return fator_para_data_br(self.valor[BARRAS_FATOR]) if self.completo else None
+
+    @property
+    def campo_livre(self) -> Optional[str]:
+        """Retorna o campo livre (25 dígitos)"""
+        return self.valor[BARRAS_CAMPO_LIVRE] if self.completo else None
@@ -0,0 +1,259 @@
+"""
+Correção de erros de digitação na linha digitável.
+
+Procura, entre todas as substituições de um dígito e todas as
+transposições de dois dígitos vizinhos, as linhas cujos quatro DVs
+conferem. Cada posição da linha entra em no máximo uma soma do Módulo 10
+(a do seu campo) e na soma do Módulo 11 (código de barras sem o DV geral):
+as somas da linha digitada são calculadas uma única vez e cada alteração
+é conferida pela diferença das parcelas dos dígitos trocados, sem refazer
+os cálculos.
+
+As verificações que falham na linha digitada limitam a busca: uma
+alteração só é tentada se as posições trocadas participam de todas elas.
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from ..utils.dv import (
+    dv_soma_modulo_10,
+    dv_soma_modulo_11,
+    parcelas_modulo_10,
+    pesos_modulo_11,
+)
+from .enums import FalhaDigitavel
+from .layout import (
+    INDICES_BARRAS_SEM_DV,
+    LINHA_CAMPOS_DV,
+    LINHA_DV_GERAL,
+    LINHA_FATOR,
+    TAMANHO_LINHA,
+)
+
+SUBSTITUICAO = "substituicao"
+TRANSPOSICAO = "transposicao"
+
+_FALHAS_CAMPOS = tuple(
+    int(falha)
+    for falha in (FalhaDigitavel.CAMPO1, FalhaDigitavel.CAMPO2, FalhaDigitavel.CAMPO3)
+)
+_FALHA_DV_GERAL = int(FalhaDigitavel.DV_GERAL)
+_POSICOES_DV_CAMPOS = tuple(posicao_dv for _, posicao_dv in LINHA_CAMPOS_DV)
+_CAMPO_DO_DV = {
+    posicao_dv: campo for campo, posicao_dv in enumerate(_POSICOES_DV_CAMPOS)
+}
+_SEM_PARCELAS = (0,) * 10
+
+
+def _tabelas_posicoes():
+    """Campo, parcelas do Módulo 10, peso do Módulo 11 e verificações por posição"""
+    campos = [-1] * TAMANHO_LINHA
+    parcelas = [_SEM_PARCELAS] * TAMANHO_LINHA
+    pesos = [0] * TAMANHO_LINHA
+    verificacoes = [0] * TAMANHO_LINHA
+
+    for campo, ((fatia, posicao_dv), falha) in enumerate(
+        zip(LINHA_CAMPOS_DV, _FALHAS_CAMPOS)
+    ):
+        posicoes = range(fatia.start, fatia.stop)
+        for posicao, parcelas_posicao in zip(
+            posicoes, parcelas_modulo_10(len(posicoes))
+        ):
+            campos[posicao] = campo
+            parcelas[posicao] = parcelas_posicao
+            verificacoes[posicao] |= falha
+        verificacoes[posicao_dv] |= falha
+
+    for posicao, peso in zip(
+        INDICES_BARRAS_SEM_DV, pesos_modulo_11(len(INDICES_BARRAS_SEM_DV))
+    ):
+        pesos[posicao] = peso
+        verificacoes[posicao] |= _FALHA_DV_GERAL
+    verificacoes[LINHA_DV_GERAL] |= _FALHA_DV_GERAL
+
+    return tuple(campos), tuple(parcelas), tuple(pesos), tuple(verificacoes)
+
+
+# Por posição da linha: campo (0 a 2) cuja soma do Módulo 10 a inclui (-1
+# fora dos campos), parcela de cada dígito nessa soma, peso no Módulo 11
+# (0 fora do código de barras) e verificações (FalhaDigitavel) afetadas
+_CAMPOS, _PARCELAS_10, _PESOS_11, _VERIFICACOES = _tabelas_posicoes()
+
+
+@dataclass(frozen=True)
+class SugestaoCorrecao:
+    """Linha válida a um erro de digitação da linha digitada"""
+
+    linha: str  # Linha corrigida (47 dígitos)
+    tipo: str  # SUBSTITUICAO ou TRANSPOSICAO
+    posicoes: Tuple[int, ...]  # Posições alteradas (a partir de 0)
+    digitado: str  # Dígitos digitados nessas posições
+    corrigido: str  # Dígitos sugeridos nessas posições
+
+
+class _Somas:
+    """Dígitos da linha e somas dos DVs, atualizadas a cada alteração"""
+
+    __slots__ = ("digitos", "campos", "modulo_11")
+
+    def __init__(self, linha: str):
+        self.digitos = [ord(c) - 48 for c in linha]
+        self.campos = [0, 0, 0]
+        self.modulo_11 = 0
+        for posicao, digito in enumerate(self.digitos):
+            campo = _CAMPOS[posicao]
+            if campo >= 0:
+                self.campos[campo] += _PARCELAS_10[posicao][digito]
+            self.modulo_11 += _PESOS_11[posicao] * digito
+
+    def trocar(self, posicao: int, novo: int) -> None:
+        """Troca um dígito, ajustando as somas pela diferença das parcelas"""
+        antigo = self.digitos[posicao]
+        campo = _CAMPOS[posicao]
+        if campo >= 0:
+            parcelas = _PARCELAS_10[posicao]
+            self.campos[campo] += parcelas[novo] - parcelas[antigo]
+        self.modulo_11 += _PESOS_11[posicao] * (novo - antigo)
+        self.digitos[posicao] = novo
+
+    def substituicoes(self, posicao: int) -> Iterator[int]:
+        """
+        Dígitos que, trocados na posição, fazem conferir os DVs de que ela
+        participa
+
+        Na posição de um DV, o único candidato é o DV recalculado; nas
+        demais, cada dígito é conferido pela diferença das parcelas, o DV
+        do campo antes do DV geral.
+        """
+        antigo = self.digitos[posicao]
+        if posicao == LINHA_DV_GERAL:
+            novos = (dv_soma_modulo_11(self.modulo_11),)
+        elif posicao in _CAMPO_DO_DV:
+            novos = (dv_soma_modulo_10(self.campos[_CAMPO_DO_DV[posicao]]),)
+        else:
+            novos = range(10)
+
+        campo = _CAMPOS[posicao]
+        parcelas = _PARCELAS_10[posicao]
+        peso = _PESOS_11[posicao]
+        dv_geral = self.digitos[LINHA_DV_GERAL]
+        for novo in novos:
+            if novo == antigo:
+                continue
+            if campo >= 0:
+                soma = self.campos[campo] + parcelas[novo] - parcelas[antigo]
+                if dv_soma_modulo_10(soma) != self.digitos[_POSICOES_DV_CAMPOS[campo]]:
+                    continue
+            if (
+                peso
+                and dv_soma_modulo_11(self.modulo_11 + peso * (novo - antigo))
+                != dv_geral
+            ):
+                continue
+            yield novo
+
+    def falhas(self) -> int:
+        """Verificações (FalhaDigitavel) que falham na linha atual"""
+        falhas = 0
+        for campo, falha in enumerate(_FALHAS_CAMPOS):
+            dv = dv_soma_modulo_10(self.campos[campo])
+            if dv != self.digitos[_POSICOES_DV_CAMPOS[campo]]:
+                falhas |= falha
+        if dv_soma_modulo_11(self.modulo_11) != self.digitos[LINHA_DV_GERAL]:
+            falhas |= _FALHA_DV_GERAL
+        return falhas
+
+    def confere(self, verificacoes: int) -> bool:
+        """Confere as verificações pedidas, os DVs dos campos primeiro"""
+        for campo, falha in enumerate(_FALHAS_CAMPOS):
+            if (
+                verificacoes & falha
+                and dv_soma_modulo_10(self.campos[campo])
+                != self.digitos[_POSICOES_DV_CAMPOS[campo]]
+            ):
+                return False
+        return not (
+            verificacoes & _FALHA_DV_GERAL
+            and dv_soma_modulo_11(self.modulo_11) != self.digitos[LINHA_DV_GERAL]
+        )
+
+
+def _fator_plausivel(digitos: List[int]) -> bool:
+    """Fator de vencimento zerado (sem vencimento) ou a partir de 1000"""
+    fator = digitos[LINHA_FATOR]
+    return not any(fator) or fator[0] > 0
+
+
+def sugerir_correcoes(linha: str) -> List[SugestaoCorrecao]:
+    """
+    Sugere linhas válidas que diferem da digitada por um único erro
+
+    São testadas todas as substituições de um dígito e as transposições de
+    dígitos vizinhos. As sugestões vêm ordenadas da mais provável para a
+    menos provável: fator de vencimento plausível, transposições antes das
+    substituições (com poucas transposições possíveis, é raro uma conferir
+    os quatro DVs por acaso) e, por fim, a posição na linha.
+
+    Args:
+        linha: Linha digitável normalizada (47 dígitos)
+
+    Returns:
+        Sugestões de correção; lista vazia se a linha já for válida ou se
+        nenhuma alteração única a corrigir
+
+    Raises:
+        ValueError: Se a linha não tiver 47 dígitos
+    """
+    if len(linha) != TAMANHO_LINHA or not (linha.isascii() and linha.isdigit()):
+        raise ValueError(f"Linha digitável deve ter {TAMANHO_LINHA} dígitos")
+
+    somas = _Somas(linha)
+    falhas = somas.falhas()
+    if not falhas:
+        return []
+
+    digitos = somas.digitos
+    encontradas = []
+
+    def registrar(tipo: str, posicoes: Tuple[int, ...], antes: List[int]) -> None:
+        encontradas.append(
+            (
+                not _fator_plausivel(digitos),
+                tipo != TRANSPOSICAO,
+                posicoes,
+                SugestaoCorrecao(
+                    linha="".join(map(str, digitos)),
+                    tipo=tipo,
+                    posicoes=posicoes,
+                    digitado="".join(map(str, antes)),
+                    corrigido="".join(str(digitos[p]) for p in posicoes),
+                ),
+            )
+        )
+
+    # Substituições: só nas posições que participam de todas as falhas
+    for posicao in range(TAMANHO_LINHA):
+        if falhas & ~_VERIFICACOES[posicao]:
+            continue
+        antigo = digitos[posicao]
+        for novo in somas.substituicoes(posicao):
+            somas.trocar(posicao, novo)
+            registrar(SUBSTITUICAO, (posicao,), [antigo])
+            somas.trocar(posicao, antigo)
+
+    # Transposições de dígitos vizinhos diferentes
+    for posicao in range(TAMANHO_LINHA - 1):
+        verificacoes = _VERIFICACOES[posicao] | _VERIFICACOES[posicao + 1]
+        primeiro, segundo = digitos[posicao], digitos[posicao + 1]
+        if primeiro == segundo or falhas & ~verificacoes:
+            continue
+        somas.trocar(posicao, segundo)
+        somas.trocar(posicao + 1, primeiro)
+        if somas.confere(verificacoes):
+            registrar(TRANSPOSICAO, (posicao, posicao + 1), [primeiro, segundo])
+        somas.trocar(posicao, primeiro)
+        somas.trocar(posicao + 1, segundo)
+
+    encontradas.sort(key=lambda item: item[:3])
+    return [sugestao for *_, sugestao in encontradas]
@@ -7,12 +7,147 @@ conforme especificações da Febraban.
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
-
-import regex
+from typing import Iterable, List, Optional, Sequence
 
 from ..utils.dv import modulo_10, modulo_11
 from ..utils.logger import get_logger
+from ..utils.vencimento import fator_para_data_br
+from .codigo_barras import codigos_para_linhas, eh_codigo_barras, normalizar
+from .correcao import SugestaoCorrecao, sugerir_correcoes
+from .enums import FalhaDigitavel
+from .layout import (
+    INDICES_BARRAS_SEM_DV,
+    LINHA_BLOCOS,
+    LINHA_CAMPOS_DV,
+    LINHA_DV_GERAL,
+    LINHA_FATOR,
+    LINHA_VALOR,
+    TAMANHO_LINHA,
+    campo_livre_da_linha,
+    codigo_barras_para_linha,
+    codigo_barras_sem_dv,
+    inserir_dv_geral,
+    linha_para_codigo_barras,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy é opcional
+    np = None
+
+logger = get_logger("digitavel")
+
+# Campos com DV Módulo 10 e a falha correspondente (posições em layout.py)
+_CAMPOS_MODULO_10 = tuple(
+    (falha, posicoes, posicao_dv)
+    for falha, (posicoes, posicao_dv) in zip(
+        (FalhaDigitavel.CAMPO1, FalhaDigitavel.CAMPO2, FalhaDigitavel.CAMPO3),
+        LINHA_CAMPOS_DV,
+    )
+)
+_POSICAO_DV_GERAL = LINHA_DV_GERAL
+
+# Posições da linha digitável que compõem o código de barras sem o DV geral:
+# banco/moeda, fator/valor e campo livre
+_INDICES_CODIGO_BARRAS = list(INDICES_BARRAS_SEM_DV)
+
+
+@dataclass
+class ResultadoValidacaoLote:
+    """
+    Resultado da validação em lote de linhas digitáveis
+
+    Com numpy disponível, ``validos`` e ``falhas`` são arrays (bool e uint8);
+    caso contrário, listas.
+    """
+
+    validos: Sequence[bool]  # Máscara: True se a linha é válida
+    falhas: Sequence[int]  # Combinação de FalhaDigitavel por linha
+
+    def __len__(self) -> int:
+        return len(self.validos)
+
+
+def _normalizar_lote(linhas: Iterable[str]) -> List[bytes]:
+    """
+    Normaliza as linhas do lote para bytes ASCII sem pontos e espaços
+
+    Códigos de barras (44 dígitos) são convertidos para linha digitável,
+    todos de uma vez.
+    """
+    normalizadas = [normalizar(linha) for linha in linhas]
+    posicoes = [i for i, linha in enumerate(normalizadas) if eh_codigo_barras(linha)]
+    convertidas = codigos_para_linhas([normalizadas[i] for i in posicoes])
+    for i, linha in zip(posicoes, convertidas):
+        normalizadas[i] = linha
+    return [linha.encode("ascii", "replace") for linha in normalizadas]
+
+
+def _formato_valido(linha: bytes) -> bool:
+    """Verifica se a linha normalizada tem exatamente 47 dígitos"""
+    return len(linha) == 47 and linha.isascii() and linha.isdigit()
+
+
+def _validar_lote_numpy(normalizadas: List[bytes]) -> ResultadoValidacaoLote:
+    """Validação vetorizada sobre a matriz (N, 47) de dígitos"""
+    total = len(normalizadas)
+    formato_ok = np.fromiter(
+        (_formato_valido(linha) for linha in normalizadas), dtype=bool, count=total
+    )
+    preenchimento = b"0" * 47
+    buffer = b"".join(
+        linha if ok else preenchimento for linha, ok in zip(normalizadas, formato_ok)
+    )
+    digitos = np.frombuffer(buffer, dtype=np.uint8).reshape(total, 47) - ord("0")
+
+    falhas = np.where(formato_ok, 0, int(FalhaDigitavel.FORMATO)).astype(np.uint8)
+
+    # DVs dos campos 1, 2 e 3 (Módulo 10, pesos 2-1 a partir da direita)
+    for falha, posicoes, posicao_dv in _CAMPOS_MODULO_10:
+        bloco = digitos[:, posicoes]
+        tamanho = bloco.shape[1]
+        pesos = np.array(
+            [2 if (tamanho - 1 - i) % 2 == 0 else 1 for i in range(tamanho)],
+            dtype=np.uint8,
+        )
+        produtos = bloco * pesos
+        produtos -= 9 * (produtos > 9).astype(np.uint8)
+        soma = produtos.sum(axis=1, dtype=np.int32)
+        dv = (10 - soma % 10) % 10
+        falhas |= np.where(dv != digitos[:, posicao_dv], int(falha), 0).astype(np.uint8)
+
+    # DV geral (Módulo 11, pesos 2-9 cíclicos sobre o código de barras)
+    codigo_barras = digitos[:, _INDICES_CODIGO_BARRAS].astype(np.int32)
+    tamanho = codigo_barras.shape[1]
+    pesos = np.array([(tamanho - 1 - i) % 8 + 2 for i in range(tamanho)])
+    resto = (codigo_barras @ pesos) % 11
+    dv_geral = np.where(resto == 0, 1, np.where(resto == 1, 0, 11 - resto))
+    falhas |= np.where(
+        dv_geral != digitos[:, _POSICAO_DV_GERAL], int(FalhaDigitavel.DV_GERAL), 0
+    ).astype(np.uint8)
+
+    falhas[~formato_ok] = int(FalhaDigitavel.FORMATO)
+    return ResultadoValidacaoLote(validos=falhas == 0, falhas=falhas)
+
+
+def _validar_lote_python(normalizadas: List[bytes]) -> ResultadoValidacaoLote:
+    """Validação linha a linha, usada quando numpy não está disponível"""
+    validos: List[bool] = []
+    falhas: List[int] = []
+    for linha in normalizadas:
+        falha = FalhaDigitavel.NENHUMA
+        if not _formato_valido(linha):
+            falha = FalhaDigitavel.FORMATO
+        else:
+            for falha_campo, posicoes, posicao_dv in _CAMPOS_MODULO_10:
+                if modulo_10(linha[posicoes]) != linha[posicao_dv] - 48:
+                    falha |= falha_campo
+            codigo_barras = bytes(linha[i] for i in _INDICES_CODIGO_BARRAS)
+            if modulo_11(codigo_barras) != linha[_POSICAO_DV_GERAL] - 48:
+                falha |= FalhaDigitavel.DV_GERAL
+        validos.append(falha == FalhaDigitavel.NENHUMA)
+        falhas.append(int(falha))
+    return ResultadoValidacaoLote(validos=validos, falhas=falhas)
 
 
 @dataclass
@@ -42,7 +177,7 @@ class CamposDigitavel:
     @property
     def campo_livre(self) -> str:
         """Retorna o campo livre completo (25 dígitos) - dados brutos sem interpretação"""
-        return self.bloco_campo1[4:9] + self.bloco_campo2[:9] + self.bloco_campo3[:9]
+        return self.bloco_campo1[4:9] + self.bloco_campo2[:-1] + self.bloco_campo3[:-1]
 
     @property
     def campo1_sem_dv(self) -> str:
@@ -95,13 +230,7 @@ class CamposDigitavel:
     @property
     def data_vencimento(self) -> Optional[str]:
         """Converte fator de vencimento para data (base: 07/10/1997)"""
-        try:
-            fator = int(self.fator_vencimento)
-            data_base = datetime(1997, 10, 7)
-            data_vencimento = data_base + timedelta(days=fator)
-            return data_vencimento.strftime("%d/%m/%Y")
-        except (ValueError, TypeError):
-            return None
+        return fator_para_data_br(self.fator_vencimento)
 
 
 class Digitavel:
@@ -116,7 +245,8 @@ class Digitavel:
         Inicializa o objeto Digitavel
 
         Args:
-            valor: Linha digitável para processar
+            valor: Linha digitável ou código de barras (44 dígitos) para
+                processar
         """
         self.logger = get_logger("digitavel")
         self.valor = self._normalizar(valor)
@@ -130,17 +260,18 @@ class Digitavel:
         """
         Normaliza a linha digitável removendo espaços e pontos
 
+        Códigos de barras (44 dígitos) são convertidos para linha digitável.
+
         Args:
             valor: Valor para normalizar
 
         Returns:
             Valor normalizado
         """
-        if not valor:
-            return ""
-
-        # Normalizar: remover espaços e pontos, mantendo apenas dígitos
-        return regex.sub(r"[.\s]", "", valor)
+        normalizado = normalizar(valor)
+        if eh_codigo_barras(normalizado):
+            return codigos_para_linhas([normalizado])[0]
+        return normalizado
 
     def _extrair_campos(self) -> None:
         """
@@ -154,11 +285,12 @@ class Digitavel:
         Campo 5: 33-46 (14 dígitos)
         """
         try:
-            bloco_campo1 = self.valor[0:10]  # 9 dígitos + DV
-            bloco_campo2 = self.valor[10:21]  # 10 dígitos + DV
-            bloco_campo3 = self.valor[21:32]  # 10 dígitos + DV
-            dv_geral = self.valor[32:33]  # 1 dígito
-            fator_valor_e_valor = self.valor[33:47]  # 14 dígitos
+            # 9 dígitos + DV, 10 dígitos + DV, 10 dígitos + DV
+            bloco_campo1, bloco_campo2, bloco_campo3 = (
+                self.valor[bloco] for bloco in LINHA_BLOCOS
+            )
+            dv_geral = self.valor[LINHA_DV_GERAL]  # 1 dígito
+            fator_valor_e_valor = self.valor[LINHA_FATOR.start : LINHA_VALOR.stop]
 
             self._campos = CamposDigitavel(
                 bloco_campo1=bloco_campo1,
@@ -202,17 +334,17 @@ class Digitavel:
         Valida o DV geral do código de barras usando Módulo 11
 
         Args:
-            codigo_barras: Código de barras para validar
+            codigo_barras: Código de barras (44 dígitos, DV na posição 5)
 
         Returns:
             True se válido, False caso contrário
         """
-        if len(codigo_barras) < 2:
+        if len(codigo_barras) != 44:
             return False
 
         try:
-            codigo_sem_dv = codigo_barras[:-1]
-            dv_esperado = int(codigo_barras[-1])
+            codigo_sem_dv = codigo_barras[:4] + codigo_barras[5:]
+            dv_esperado = int(codigo_barras[4])
             dv_calculado = modulo_11(codigo_sem_dv)
 
             return dv_calculado == dv_esperado
@@ -230,7 +362,11 @@ class Digitavel:
         Returns:
             True se válida, False caso contrário
         """
-        if not self.valor.isdigit() or len(self.valor) != 47 or not self._campos:
+        if (
+            not (self.valor.isascii() and self.valor.isdigit())
+            or len(self.valor) != 47
+            or not self._campos
+        ):
             return False
 
         # Validar DVs dos campos
@@ -265,15 +401,11 @@ class Digitavel:
             return ""
 
         try:
-            # Composição do código de barras (44 dígitos + DV geral)
-            banco_moeda = self.valor[0:4]
-            campo_livre = self._campos.campo_livre
-            fator_valor = self._campos.fator_valor_e_valor
-
-            codigo_sem_dv = banco_moeda + campo_livre + fator_valor
-            dv_geral = modulo_11(codigo_sem_dv)
-
-            return codigo_sem_dv + str(dv_geral)
+            # Banco/moeda, DV geral, fator/valor e campo livre (44 dígitos)
+            linha = self.valor[:TAMANHO_LINHA]
+            if not (linha.isascii() and linha.isdigit()):
+                raise ValueError(f"Linha contém caracteres não numéricos: {linha!r}")
+            return linha_para_codigo_barras(linha)
         except Exception as e:
             self.logger.error("Erro ao gerar código de barras", erro=str(e))
             return ""
@@ -289,43 +421,31 @@ class Digitavel:
             return self.valor
 
         try:
-            # Corrigir campo 2
-            campo2_sem_dv = self._campos.bloco_campo2[:-1]
-            dv_campo2_calculado = modulo_10(campo2_sem_dv)
-            campo2_corrigido = campo2_sem_dv + str(dv_campo2_calculado)
-
-            # Corrigir campo 3
-            campo3_sem_dv = self._campos.bloco_campo3[:-1]
-            dv_campo3_calculado = modulo_10(campo3_sem_dv)
-            campo3_corrigido = campo3_sem_dv + str(dv_campo3_calculado)
-
-            # Corrigir DV geral
-            banco_moeda = self.valor[0:4]
-            campo_livre = (
-                self._campos.bloco_campo1[4:9]
-                + campo2_corrigido[:-1]
-                + campo3_corrigido[:-1]
-            )
-            fator_valor = self._campos.fator_valor_e_valor
-
-            codigo_sem_dv = banco_moeda + campo_livre + fator_valor
-            dv_geral_calculado = modulo_11(codigo_sem_dv)
-            campo4_corrigido = str(dv_geral_calculado)
-
-            # Montar digitável corrigido
-            digitavel_corrigido = (
-                self._campos.bloco_campo1
-                + campo2_corrigido
-                + campo3_corrigido
-                + campo4_corrigido
-                + self._campos.fator_valor_e_valor
-            )
-
-            return digitavel_corrigido
+            # Recalcula o DV geral e, na volta para a linha, os DVs dos campos
+            codigo_sem_dv = codigo_barras_sem_dv(self.valor[:TAMANHO_LINHA])
+            codigo_barras = inserir_dv_geral(codigo_sem_dv, modulo_11(codigo_sem_dv))
+            return codigo_barras_para_linha(codigo_barras)
         except Exception as e:
             self.logger.error("Erro ao corrigir DVs", erro=str(e))
             return self.valor
 
+    def sugerir_correcoes(self) -> List[SugestaoCorrecao]:
+        """
+        Sugere linhas válidas a um erro de digitação da linha atual
+
+        Ao contrário de corrigir_dv(), não assume que os dígitos fora dos
+        DVs estão certos: procura substituições de um dígito e transposições
+        de dígitos vizinhos que fazem os quatro DVs conferirem.
+
+        Returns:
+            Sugestões da mais para a menos provável (vazia se a linha já for
+            válida ou não tiver 47 dígitos)
+        """
+        linha = self.valor[:TAMANHO_LINHA]
+        if len(linha) != TAMANHO_LINHA or not (linha.isascii() and linha.isdigit()):
+            return []
+        return sugerir_correcoes(linha)
+
     # === PROPRIEDADES ===
 
     @property
@@ -365,6 +485,28 @@ class Digitavel:
 
     # === MÉTODOS ESTÁTICOS ===
 
+    @staticmethod
+    def validar_lote(linhas: Iterable[str]) -> ResultadoValidacaoLote:
+        """
+        Valida várias linhas digitáveis de uma vez, sem criar objetos Digitavel
+
+        As linhas são empacotadas em uma matriz (N, 47) de dígitos e os DVs
+        dos três campos (Módulo 10) e o DV geral (Módulo 11, comparado com a
+        posição 33 da linha) são calculados com operações vetorizadas. Sem
+        numpy, o mesmo cálculo é feito linha a linha.
+
+        Args:
+            linhas: Linhas digitáveis (com ou sem pontos e espaços)
+
+        Returns:
+            ResultadoValidacaoLote com a máscara de válidas e os códigos de
+            falha (FalhaDigitavel) de cada linha
+        """
+        normalizadas = _normalizar_lote(linhas)
+        if np is not None:
+            return _validar_lote_numpy(normalizadas)
+        return _validar_lote_python(normalizadas)
+
     @staticmethod
     def gerar_digitavel_valido(
         banco: str = "033", valor: float = 150.00, vencimento_dias: int = 30
@@ -381,46 +523,198 @@ class Digitavel:
             Linha digitável válida
         """
         try:
-            # Data base: 07/10/1997
+            # Data base: 07/10/1997; o fator reinicia em 1000 após 9999
             data_base = datetime(1997, 10, 7)
             data_vencimento = datetime.now() + timedelta(days=vencimento_dias)
-            fator_vencimento = (data_vencimento - data_base).days
+            dias = (data_vencimento - data_base).days
+            fator_vencimento = dias if dias <= 9999 else (dias - 1000) % 9000 + 1000
 
-            # Valor em centavos (10 dígitos)
-            valor_centavos = int(valor * 100)
-            valor_str = f"{valor_centavos:010d}"
-
-            # Fator de vencimento (4 dígitos)
+            # Valor em centavos (10 dígitos) e fator de vencimento (4 dígitos)
+            valor_str = f"{round(valor * 100):010d}"
             fator_str = f"{fator_vencimento:04d}"
 
             # Campo livre dummy (25 dígitos)
             campo_livre = "1" * 25
 
-            # Montar campos para linha digitável (estrutura correta)
-            campo1_base = banco + "9" + campo_livre[:4]  # 3+1+4 = 8 dígitos
-            campo2_base = campo_livre[4:14]  # 10 dígitos
-            campo3_base = campo_livre[14:24]  # 10 dígitos
-
-            # Calcular DVs dos campos 1, 2, 3 (Módulo 10)
-            dv1 = modulo_10(campo1_base)
-            dv2 = modulo_10(campo2_base)
-            dv3 = modulo_10(campo3_base)
-
-            campo1 = campo1_base + str(dv1)  # 9 dígitos
-            campo2 = campo2_base + str(dv2)  # 11 dígitos
-            campo3 = campo3_base + str(dv3)  # 11 dígitos
-
-            # Código de barras sem DV geral (44 dígitos)
-            banco_moeda = banco + "9"
-            codigo_sem_dv = banco_moeda + campo_livre + fator_str + valor_str
-            dv_geral = modulo_11(codigo_sem_dv)
+            # Código de barras sem DV geral (43 dígitos), na ordem Febraban
+            codigo_sem_dv = banco + "9" + fator_str + valor_str + campo_livre
+            codigo_barras = inserir_dv_geral(codigo_sem_dv, modulo_11(codigo_sem_dv))
 
-            # Montar linha digitável (47 dígitos)
-            digitavel_str = (
-                campo1 + campo2 + campo3 + str(dv_geral) + fator_str + valor_str
-            )
-            return digitavel_str
+            # Linha digitável (47 dígitos) com os DVs dos campos
+            return codigo_barras_para_linha(codigo_barras)
         except Exception as e:
             logger = get_logger("digitavel")
             logger.error("Erro ao gerar digitável válido", erro=str(e))
             return ""
+
+
+_NAO_CALCULADO = object()
+
+
+class LinhaDigitavel:
+    """
+    Valor imutável e compacto de uma linha digitável.
+
+    Alternativa leve ao Digitavel para criar muitas instâncias: usa
+    ``__slots__``, normaliza com ``str.translate``, não cria logger por
+    instância e só calcula os campos derivados no primeiro acesso,
+    guardando o resultado.
+    """
+
+    __slots__ = (
+        "valor",
+        "_valor_documento",
+        "_data_vencimento",
+        "_campo_livre",
+        "_codigo_barras",
+    )
+
+    def __init__(self, valor: Optional[str]):
+        """
+        Inicializa a linha digitável
+
+        Args:
+            valor: Linha digitável ou código de barras (com ou sem pontos e
+                espaços)
+        """
+        normalizado = normalizar(valor)
+        if eh_codigo_barras(normalizado):
+            normalizado = codigos_para_linhas([normalizado])[0]
+        object.__setattr__(self, "valor", normalizado)
+        for atributo in self.__slots__[1:]:
+            object.__setattr__(self, atributo, _NAO_CALCULADO)
+
+    def __setattr__(self, nome: str, valor: object) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __delattr__(self, nome: str) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __eq__(self, outro: object) -> bool:
+        if isinstance(outro, LinhaDigitavel):
+            return self.valor == outro.valor
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.valor)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.valor!r})"
+
+    def __str__(self) -> str:
+        return self.valor
+
+    def _cache(self, atributo: str, calcular) -> object:
+        """Retorna o valor em cache ou calcula e guarda no primeiro acesso"""
+        valor = object.__getattribute__(self, atributo)
+        if valor is _NAO_CALCULADO:
+            valor = calcular()
+            object.__setattr__(self, atributo, valor)
+        return valor
+
+    @property
+    def completa(self) -> bool:
+        """Indica se há dígitos suficientes para extrair os campos"""
+        return len(self.valor) >= 47
+
+    def validar(self) -> bool:
+        """
+        Valida formato (47 dígitos), DVs dos campos 1, 2 e 3 e DV geral,
+        sem logging (mesmo critério de Digitavel.validar)
+
+        Returns:
+            True se válida, False caso contrário
+        """
+        if not self.validar_campos():
+            return False
+        valor = self.valor
+        codigo_barras = "".join([valor[i] for i in _INDICES_CODIGO_BARRAS])
+        return modulo_11(codigo_barras) == ord(valor[_POSICAO_DV_GERAL]) - 48
+
+    def validar_campos(self) -> bool:
+        """
+        Valida apenas o formato (47 dígitos) e os DVs dos campos 1, 2 e 3
+
+        Returns:
+            True se os DVs dos campos conferem, False caso contrário
+        """
+        valor = self.valor
+        if len(valor) != 47 or not (valor.isascii() and valor.isdigit()):
+            return False
+        return all(
+            modulo_10(valor[posicoes]) == ord(valor[posicao_dv]) - 48
+            for _, posicoes, posicao_dv in _CAMPOS_MODULO_10
+        )
+
+    # === PROPRIEDADES ===
+
+    @property
+    def banco(self) -> Optional[str]:
+        """Retorna o código do banco"""
+        return self.valor[:3] if self.completa else None
+
+    @property
+    def fator_vencimento(self) -> Optional[str]:
+        """Retorna o fator de vencimento"""
+        return self.valor[LINHA_FATOR] if self.completa else None
+
+    @property
+    def valor_centavos(self) -> Optional[str]:
+        """Retorna o valor em centavos"""
+        return self.valor[LINHA_VALOR] if self.completa else None
+
+    @property
+    def valor_documento(self) -> Optional[float]:
+        """Retorna o valor do documento em reais"""
+        return self._cache("_valor_documento", self._calcular_valor_documento)
+
+    @property
+    def data_vencimento(self) -> Optional[str]:
+        """Retorna a data de vencimento (dd/mm/aaaa)"""
+        return self._cache("_data_vencimento", self._calcular_data_vencimento)
+
+    @property
+    def campo_livre(self) -> Optional[str]:
+        """Retorna o campo livre - dados brutos sem interpretação"""
+        return self._cache("_campo_livre", self._calcular_campo_livre)
+
+    @property
+    def codigo_barras(self) -> Optional[str]:
+        """Retorna o código de barras gerado"""
+        return self._cache("_codigo_barras", self._calcular_codigo_barras)
+
+    # === CÁLCULOS DOS CAMPOS DERIVADOS ===
+
+    def _calcular_valor_documento(self) -> Optional[float]:
+        """Converte o valor em centavos para reais"""
+        if not self.completa:
+            return None
+        try:
+            return float(self.valor[LINHA_VALOR]) / 100
+        except ValueError:
+            return 0.0
+
+    def _calcular_data_vencimento(self) -> Optional[str]:
+        """Converte o fator de vencimento para data (base: 07/10/1997)"""
+        return fator_para_data_br(self.valor[LINHA_FATOR]) if self.completa else None
+
+    def _calcular_campo_livre(self) -> Optional[str]:
+        """Monta o campo livre a partir dos blocos dos campos 1, 2 e 3"""
+        if not self.completa:
+            return None
+        return campo_livre_da_linha(self.valor[:TAMANHO_LINHA])
+
+    def _calcular_codigo_barras(self) -> Optional[str]:
+        """
+        Monta o código de barras reordenando os dígitos da linha
+
+        O DV geral é copiado da linha, sem ser recalculado; use validar()
+        para conferi-lo.
+        """
+        if not self.completa:
+            return None
+        linha = self.valor[:TAMANHO_LINHA]
+        if not (linha.isascii() and linha.isdigit()):
+            logger.debug("Linha com caracteres não numéricos", linha=linha)
+            return ""
+        return linha_para_codigo_barras(linha)
@@ -5,7 +5,7 @@ Este módulo contém todas as enumerações utilizadas no sistema,
 seguindo as especificações da Febraban.
 """
 
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class TipoDocumento(Enum):
@@ -49,3 +49,14 @@ class TipoCarteira(Enum):
     COBRANCA_SIMPLES_ELETRONICA = "7"
     COBRANCA_CAUCIONADA_ELETRONICA_EMISSAO_BANCO = "8"
     COBRANCA_SIMPLES_ELETRONICA_EMISSAO_BANCO = "9"
+
+
+class FalhaDigitavel(IntFlag):
+    """Códigos de falha da validação em lote da linha digitável"""
+
+    NENHUMA = 0
+    FORMATO = 1  # Não contém exatamente 47 dígitos
+    CAMPO1 = 2  # DV do campo 1 (Módulo 10)
+    CAMPO2 = 4  # DV do campo 2 (Módulo 10)
+    CAMPO3 = 8  # DV do campo 3 (Módulo 10)
+    DV_GERAL = 16  # DV geral do código de barras (Módulo 11)
@@ -0,0 +1,162 @@
+"""
+Layout da linha digitável e do código de barras de boletos bancários.
+
+Especificação única (Febraban) das posições de cada campo nos dois
+formatos, usada por Digitavel, LinhaDigitavel e BoletoDecoder.
+
+Código de barras (44 dígitos)::
+
+    BBB M D FFFF VVVVVVVVVV LLLLLLLLLLLLLLLLLLLLLLLLL
+    0   3 4 5    9          19                     44
+
+Linha digitável (47 dígitos)::
+
+    BBBMLLLLL d LLLLLLLLLL d LLLLLLLLLL d D FFFFVVVVVVVVVV
+    0        9 10       20 21       31 32 33            47
+
+B = banco, M = moeda, D = DV geral, F = fator de vencimento, V = valor,
+L = campo livre, d = DVs dos campos 1, 2 e 3 (Módulo 10).
+
+As conversões são feitas por concatenação de fatias pré-calculadas, sem
+conversão dígito a dígito; funcionam com ``str`` e com ``bytes``.
+"""
+
+from typing import Tuple, TypeVar
+
+from ..utils.dv import modulo_10
+
+TAMANHO_LINHA = 47
+TAMANHO_CODIGO_BARRAS = 44
+
+# === CÓDIGO DE BARRAS ===
+
+BARRAS_BANCO = slice(0, 3)
+BARRAS_MOEDA = slice(3, 4)
+BARRAS_DV_GERAL = 4
+BARRAS_FATOR = slice(5, 9)
+BARRAS_VALOR = slice(9, 19)
+BARRAS_CAMPO_LIVRE = slice(19, 44)
+
+# === LINHA DIGITÁVEL ===
+
+LINHA_BANCO = slice(0, 3)
+LINHA_MOEDA = slice(3, 4)
+LINHA_DV_GERAL = 32
+LINHA_FATOR = slice(33, 37)
+LINHA_VALOR = slice(37, 47)
+
+# Blocos dos campos 1, 2 e 3 (com o DV) e posição de cada DV
+LINHA_BLOCOS = (slice(0, 10), slice(10, 21), slice(21, 32))
+LINHA_CAMPOS_DV: Tuple[Tuple[slice, int], ...] = (
+    (slice(0, 9), 9),
+    (slice(10, 20), 20),
+    (slice(21, 31), 31),
+)
+
+# Fatias da linha que, concatenadas, formam o campo livre
+LINHA_CAMPO_LIVRE = (slice(4, 9), slice(10, 20), slice(21, 31))
+
+# === TABELAS DE CONVERSÃO ===
+
+# Fatias da linha, na ordem do código de barras (44 dígitos)
+_LINHA_PARA_BARRAS = (slice(0, 4), slice(32, 47)) + LINHA_CAMPO_LIVRE
+
+# Fatias do código de barras que formam cada campo da linha (antes do DV)
+BARRAS_CAMPOS_LINHA = (
+    (slice(0, 4), slice(19, 24)),
+    (slice(24, 34),),
+    (slice(34, 44),),
+)
+BARRAS_CAMPO5_LINHA = slice(5, 19)
+
+
+def _indices(fatias: Tuple[slice, ...]) -> Tuple[int, ...]:
+    return tuple(i for fatia in fatias for i in range(fatia.start, fatia.stop))
+
+
+# Posição na linha de cada dígito do código de barras, sem o DV geral
+# (43 dígitos sobre os quais o Módulo 11 é calculado)
+INDICES_BARRAS_SEM_DV: Tuple[int, ...] = tuple(
+    i for i in _indices(_LINHA_PARA_BARRAS) if i != LINHA_DV_GERAL
+)
+
+Digitos = TypeVar("Digitos", str, bytes)
+
+
+def _vazio(digitos: Digitos) -> Digitos:
+    return digitos[:0]
+
+
+def linha_para_codigo_barras(linha: Digitos) -> Digitos:
+    """
+    Converte a linha digitável (47 dígitos) para o código de barras (44)
+
+    O DV geral é copiado da linha, sem recálculo.
+
+    Args:
+        linha: Linha digitável normalizada (apenas dígitos)
+
+    Returns:
+        Código de barras, do mesmo tipo da entrada (str ou bytes)
+
+    Raises:
+        ValueError: Se a linha não tiver 47 dígitos
+    """
+    if len(linha) != TAMANHO_LINHA:
+        raise ValueError(f"Linha digitável deve ter {TAMANHO_LINHA} dígitos")
+    return _vazio(linha).join([linha[fatia] for fatia in _LINHA_PARA_BARRAS])
+
+
+def codigo_barras_sem_dv(linha: Digitos) -> Digitos:
+    """Código de barras da linha sem o DV geral (base do Módulo 11)"""
+    codigo = linha_para_codigo_barras(linha)
+    return codigo[:BARRAS_DV_GERAL] + codigo[BARRAS_DV_GERAL + 1 :]
+
+
+def codigo_barras_para_linha(codigo_barras: Digitos) -> Digitos:
+    """
+    Converte o código de barras (44 dígitos) para a linha digitável (47)
+
+    Os DVs dos campos 1, 2 e 3 (Módulo 10) são calculados; o DV geral é
+    copiado do código de barras.
+
+    Args:
+        codigo_barras: Código de barras normalizado (apenas dígitos)
+
+    Returns:
+        Linha digitável, do mesmo tipo da entrada (str ou bytes)
+
+    Raises:
+        ValueError: Se o código não tiver 44 dígitos
+    """
+    if len(codigo_barras) != TAMANHO_CODIGO_BARRAS:
+        raise ValueError(f"Código de barras deve ter {TAMANHO_CODIGO_BARRAS} dígitos")
+    vazio = _vazio(codigo_barras)
+    partes = []
+    for fatias in BARRAS_CAMPOS_LINHA:
+        campo = vazio.join([codigo_barras[fatia] for fatia in fatias])
+        partes.append(campo)
+        partes.append(_digito(modulo_10(campo), vazio))
+    partes.append(codigo_barras[BARRAS_DV_GERAL : BARRAS_DV_GERAL + 1])
+    partes.append(codigo_barras[BARRAS_CAMPO5_LINHA])
+    return vazio.join(partes)
+
+
+def inserir_dv_geral(codigo_sem_dv: Digitos, dv: int) -> Digitos:
+    """Monta o código de barras (44) a partir dos 43 dígitos e do DV geral"""
+    vazio = _vazio(codigo_sem_dv)
+    return (
+        codigo_sem_dv[:BARRAS_DV_GERAL]
+        + _digito(dv, vazio)
+        + codigo_sem_dv[BARRAS_DV_GERAL:]
+    )
+
+
+def campo_livre_da_linha(linha: Digitos) -> Digitos:
+    """Campo livre (25 dígitos) a partir da linha digitável"""
+    return _vazio(linha).join([linha[fatia] for fatia in LINHA_CAMPO_LIVRE])
+
+
+def _digito(valor: int, vazio: Digitos) -> Digitos:
+    """Dígito no mesmo tipo (str ou bytes) da entrada"""
+    return str(valor) if isinstance(vazio, str) else bytes((48 + valor,))
@@ -9,6 +9,7 @@ import re
 from datetime import datetime
 
 from ..utils.logger import get_logger
+from .codigo_barras import CodigoBarras
 
 
 class BoletoValidator:
@@ -177,11 +178,13 @@ class BoletoValidator:
         linha_limpa = re.sub(r"[.\s]", "", linha)
 
         # Deve ter exatamente 47 dígitos
-        return linha_limpa.isdigit() and len(linha_limpa) == 47
+        return (
+            linha_limpa.isascii() and linha_limpa.isdigit() and len(linha_limpa) == 47
+        )
 
     def validar_codigo_barras(self, codigo: str) -> bool:
         """
-        Valida código de barras
+        Valida código de barras (44 dígitos e DV geral)
 
         Args:
             codigo: Código de barras para validar
@@ -189,11 +192,7 @@ class BoletoValidator:
         Returns:
             True se válido, False caso contrário
         """
-        if not codigo:
-            return False
-
-        # Deve ter exatamente 44 dígitos
-        return codigo.isdigit() and len(codigo) == 44
+        return CodigoBarras(codigo).validar()
 
     def validar_cep(self, cep: str) -> bool:
         """
@@ -270,7 +269,10 @@ class DigitavelValidator:
         digitavel_limpo = re.sub(r"[.\s]", "", digitavel)
 
         # Deve ter exatamente 47 dígitos
-        if not digitavel_limpo.isdigit() or len(digitavel_limpo) != 47:
+        if (
+            not (digitavel_limpo.isascii() and digitavel_limpo.isdigit())
+            or len(digitavel_limpo) != 47
+        ):
             return False
 
         return True
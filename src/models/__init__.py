@@ -5,6 +5,7 @@ from .boleto_data import BoletoData
 from .endereco import EnderecoInstituicao
 from .instrucoes import Instrucoes
 from .pagador import DadosPagador
+from .pagamento import DadosPagamento
 from .valores import Valores
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "Instrucoes",
     "EnderecoInstituicao",
     "BoletoData",
+    "DadosPagamento",
 ]
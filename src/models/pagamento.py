@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DadosPagamento(BaseModel):
+    """Dados para pagamento do boleto, obtidos da linha digitável"""
+
+    banco: str
+    nome_banco: str
+    valor: float
+    vencimento: Optional[str] = None
+    linha_digitavel: str
+    codigo_barras: str
+    dv_geral_valido: bool
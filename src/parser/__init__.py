@@ -5,7 +5,15 @@ Este módulo contém as classes e utilitários para extrair e processar
 informações de boletos bancários a partir de arquivos PDF.
 """
 
+from .cache import CacheResultados
 from .decoder import BoletoDecoder
+from .extracao_texto import (
+    MotorExtracaoTexto,
+    MotorPdftotext,
+    MotorPyPDF2,
+    PoolExtracaoTexto,
+    SelecaoPaginas,
+)
 from .extractors import (
     AlunoExtractor,
     BeneficiarioExtractor,
@@ -17,11 +25,20 @@ from .extractors import (
     PagadorExtractor,
     ValoresExtractor,
 )
-from .parser import BoletoParser
+from .padroes import RegistroPadroes, registro
+from .parser import MODOS_PARSING, BoletoParser, ContextoParsing
+from .resultado import BoletoDataParcial, BoletoLazy
+from .segmentacao import Segmento, segmentar
+from .tipo_arquivo import TipoArquivo, detectar_tipo, detectar_tipo_arquivo
 
 __all__ = [
     "BoletoDecoder",
     "BoletoParser",
+    "ContextoParsing",
+    "MODOS_PARSING",
+    "BoletoLazy",
+    "BoletoDataParcial",
+    "CacheResultados",
     "BoletoDataExtractor",
     "BeneficiarioExtractor",
     "PagadorExtractor",
@@ -31,4 +48,16 @@ __all__ = [
     "InstrucoesExtractor",
     "EnderecoInstituicaoExtractor",
     "DadosExtrasExtractor",
+    "MotorExtracaoTexto",
+    "MotorPdftotext",
+    "MotorPyPDF2",
+    "PoolExtracaoTexto",
+    "SelecaoPaginas",
+    "RegistroPadroes",
+    "registro",
+    "Segmento",
+    "segmentar",
+    "TipoArquivo",
+    "detectar_tipo",
+    "detectar_tipo_arquivo",
 ]
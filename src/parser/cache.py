@@ -0,0 +1,247 @@
+"""
+Cache de resultados de parsing indexado pelo conteúdo do PDF.
+
+A chave é o hash SHA-256 dos bytes do PDF combinado com a versão do
+parser (versão instalada do pacote, versão do esquema do cache e
+assinatura dos padrões registrados), de modo que uma atualização ou uma
+mudança nos extratores invalida os resultados antigos. O cache
+tem duas camadas:
+
+- memória: LRU limitada pelo tamanho total dos resultados serializados
+- disco (opcional): banco SQLite compartilhado entre processos, com TTL;
+  em modo WAL, e um banco ocupado por outro processo conta como falha do
+  cache em vez de interromper o parsing
+
+Um acerto devolve o BoletoData sem detectar o tipo do arquivo, extrair o
+texto ou executar os extratores.
+"""
+
+import hashlib
+import importlib.metadata
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from ..models import BoletoData
+from ..utils.logger import get_logger
+from .padroes import registro
+
+logger = get_logger("cache_resultados")
+
+# Incrementar sempre que o resultado do parsing mudar para o mesmo PDF
+# (extratores, decoder, modelos), mesmo sem mudança nos padrões
+VERSAO_ESQUEMA_CACHE = 1
+
+# Espera máxima, em segundos, por um banco em disco bloqueado por outro
+# processo antes de desistir da operação
+TIMEOUT_DISCO = 5.0
+
+
+def _versao_pacote() -> str:
+    """Versão instalada do pacote (metadados da distribuição)"""
+    try:
+        return importlib.metadata.version("boleto-parser")
+    except importlib.metadata.PackageNotFoundError:
+        return "desconhecida"  # Executado a partir do código-fonte
+
+
+VERSAO_PACOTE = _versao_pacote()
+
+
+def versao_parser() -> str:
+    """Versão usada na chave do cache"""
+    return f"{VERSAO_PACOTE}+esquema{VERSAO_ESQUEMA_CACHE}+{registro.assinatura()}"
+
+
+def chave_conteudo(conteudo: bytes, versao: Optional[str] = None) -> str:
+    """
+    Calcula a chave do cache para o conteúdo de um PDF
+
+    Args:
+        conteudo: Bytes do PDF
+        versao: Versão do parser (padrão: versao_parser())
+
+    Returns:
+        Hash hexadecimal
+    """
+    hash_conteudo = hashlib.sha256()
+    hash_conteudo.update((versao or versao_parser()).encode("utf-8"))
+    hash_conteudo.update(b"\0")
+    hash_conteudo.update(conteudo)
+    return hash_conteudo.hexdigest()
+
+
+class CacheResultados:
+    """Cache LRU em memória com camada opcional em disco (SQLite)"""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        caminho_disco: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Inicializa o cache
+
+        Args:
+            max_bytes: Tamanho máximo dos resultados mantidos em memória
+            caminho_disco: Arquivo SQLite da camada em disco (None = sem disco)
+            ttl: Validade dos resultados, em segundos (None = sem expiração)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._memoria: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes_memoria = 0
+        self._lock = threading.Lock()
+        self._contadores = {
+            "acertos_memoria": 0,
+            "acertos_disco": 0,
+            "falhas": 0,
+            "remocoes": 0,
+            "expirados": 0,
+            "erros_disco": 0,
+        }
+
+        self._disco: Optional[sqlite3.Connection] = None
+        if caminho_disco is not None:
+            self._disco = sqlite3.connect(
+                str(caminho_disco), timeout=TIMEOUT_DISCO, check_same_thread=False
+            )
+            # WAL: leitores não bloqueiam o escritor dos outros processos
+            self._disco.execute("PRAGMA journal_mode=WAL")
+            self._disco.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                "chave TEXT PRIMARY KEY, criado REAL NOT NULL, valor BLOB NOT NULL)"
+            )
+            self._disco.commit()
+
+    def _expirado(self, criado: float) -> bool:
+        """Verifica se um resultado passou da validade"""
+        return self.ttl is not None and time.time() - criado > self.ttl
+
+    def obter(self, chave: str) -> Optional[BoletoData]:
+        """
+        Busca um resultado no cache
+
+        Args:
+            chave: Chave calculada por chave_conteudo()
+
+        Returns:
+            BoletoData armazenado ou None
+        """
+        with self._lock:
+            item = self._memoria.get(chave)
+            if item is not None and self._expirado(item[0]):
+                self._remover_memoria(chave)
+                self._contadores["expirados"] += 1
+                item = None
+            if item is not None:
+                self._memoria.move_to_end(chave)
+                self._contadores["acertos_memoria"] += 1
+                return BoletoData.model_validate_json(item[1])
+
+            try:
+                item = self._obter_disco(chave)
+            except sqlite3.OperationalError as e:
+                self._erro_disco("leitura", e)
+                item = None
+            if item is None:
+                self._contadores["falhas"] += 1
+                return None
+            self._contadores["acertos_disco"] += 1
+            self._guardar_memoria(chave, *item)
+        return BoletoData.model_validate_json(item[1])
+
+    def guardar(self, chave: str, dados: BoletoData) -> None:
+        """
+        Armazena um resultado nas duas camadas
+
+        Args:
+            chave: Chave calculada por chave_conteudo()
+            dados: Resultado completo do parsing
+        """
+        valor = dados.model_dump_json().encode("utf-8")
+        criado = time.time()
+        with self._lock:
+            self._guardar_memoria(chave, criado, valor)
+            if self._disco is not None:
+                try:
+                    self._disco.execute(
+                        "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?)",
+                        (chave, criado, valor),
+                    )
+                    self._disco.commit()
+                except sqlite3.OperationalError as e:
+                    self._erro_disco("escrita", e)
+
+    def _erro_disco(self, operacao: str, erro: sqlite3.OperationalError) -> None:
+        """Registra uma falha da camada em disco (ex.: banco bloqueado)"""
+        self._contadores["erros_disco"] += 1
+        if self._disco is not None and self._disco.in_transaction:
+            self._disco.rollback()
+        logger.warning("Falha no cache em disco", operacao=operacao, erro=str(erro))
+
+    def _obter_disco(self, chave: str) -> Optional[Tuple[float, bytes]]:
+        """Busca um resultado na camada em disco, descartando expirados"""
+        if self._disco is None:
+            return None
+        linha = self._disco.execute(
+            "SELECT criado, valor FROM resultados WHERE chave = ?", (chave,)
+        ).fetchone()
+        if linha is None:
+            return None
+        if self._expirado(linha[0]):
+            self._disco.execute("DELETE FROM resultados WHERE chave = ?", (chave,))
+            self._disco.commit()
+            self._contadores["expirados"] += 1
+            return None
+        return linha[0], bytes(linha[1])
+
+    def _guardar_memoria(self, chave: str, criado: float, valor: bytes) -> None:
+        """Insere na LRU e remove os mais antigos acima do limite de tamanho"""
+        if len(valor) > self.max_bytes:
+            return
+        if chave in self._memoria:
+            self._remover_memoria(chave)
+        self._memoria[chave] = (criado, valor)
+        self._bytes_memoria += len(valor)
+        while self._bytes_memoria > self.max_bytes:
+            antiga = next(iter(self._memoria))
+            self._remover_memoria(antiga)
+            self._contadores["remocoes"] += 1
+
+    def _remover_memoria(self, chave: str) -> None:
+        """Remove um item da camada em memória"""
+        _, valor = self._memoria.pop(chave)
+        self._bytes_memoria -= len(valor)
+
+    def limpar(self) -> None:
+        """Remove todos os resultados das duas camadas"""
+        with self._lock:
+            self._memoria.clear()
+            self._bytes_memoria = 0
+            if self._disco is not None:
+                try:
+                    self._disco.execute("DELETE FROM resultados")
+                    self._disco.commit()
+                except sqlite3.OperationalError as e:
+                    self._erro_disco("limpeza", e)
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores de acertos, falhas, remoções e ocupação da memória"""
+        with self._lock:
+            return {
+                **self._contadores,
+                "itens_memoria": len(self._memoria),
+                "bytes_memoria": self._bytes_memoria,
+            }
+
+    def fechar(self) -> None:
+        """Fecha a conexão com a camada em disco"""
+        with self._lock:
+            if self._disco is not None:
+                self._disco.close()
+                self._disco = None
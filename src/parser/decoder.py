@@ -6,10 +6,22 @@ códigos digitáveis e gerar códigos de barras de boletos bancários.
 """
 
 import re
-from datetime import datetime, timedelta
-from typing import Any, Dict
-
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..core.codigo_barras import codigos_para_linhas, eh_codigo_barras
+from ..core.layout import (
+    BARRAS_BANCO,
+    BARRAS_CAMPO_LIVRE,
+    BARRAS_DV_GERAL,
+    BARRAS_FATOR,
+    BARRAS_MOEDA,
+    BARRAS_VALOR,
+    TAMANHO_CODIGO_BARRAS,
+    TAMANHO_LINHA,
+    linha_para_codigo_barras,
+)
 from ..utils.logger import get_logger
+from ..utils.vencimento import fator_para_data_br
 
 
 class BoletoDecoder:
@@ -25,6 +37,7 @@ class BoletoDecoder:
 
         Args:
             digitavel: Código digitável no formato 03399.16140 70000.019182 81556.601014 4 11370000038936
+                ou código de barras de 44 dígitos
 
         Returns:
             Dicionário com os dados decodificados
@@ -53,24 +66,74 @@ class BoletoDecoder:
             self.logger.error("Erro ao decodificar código digitável", erro=str(e))
             raise ValueError(f"Erro ao decodificar código digitável: {e}")
 
+    def decodificar_lote(
+        self, digitaveis: Iterable[str]
+    ) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Decodifica vários códigos digitáveis sem interromper nos inválidos
+
+        Mesmo resultado de decodificar_digitavel() para cada código, mas sem
+        logs por item: apenas um resumo ao final do lote.
+
+        Args:
+            digitaveis: Códigos digitáveis (com ou sem pontos e espaços)
+
+        Yields:
+            Tuplas (dados decodificados, None) ou (None, mensagem de erro)
+        """
+        total = falhas = 0
+        for digitavel in digitaveis:
+            total += 1
+            try:
+                digitavel_limpo = self._limpar_digitavel(digitavel or "")
+                self._validar_digitavel(digitavel_limpo)
+            except ValueError as e:
+                falhas += 1
+                yield None, str(e)
+                continue
+            try:
+                componentes = self._extrair_componentes(digitavel_limpo)
+                resultado = self._montar_resultado(componentes)
+            except Exception as e:
+                falhas += 1
+                yield None, f"Erro ao decodificar código digitável: {e}"
+                continue
+            yield resultado, None
+        self.logger.info(
+            "Lote de códigos digitáveis decodificado", total=total, falhas=falhas
+        )
+
     def _limpar_digitavel(self, digitavel: str) -> str:
-        """Remove espaços e pontos do código digitável"""
-        return re.sub(r"[.\s]", "", digitavel)
+        """
+        Remove espaços e pontos do código digitável
+
+        Códigos de barras (44 dígitos) são convertidos para linha digitável.
+        """
+        limpo = re.sub(r"[.\s]", "", digitavel)
+        if eh_codigo_barras(limpo):
+            return codigos_para_linhas([limpo])[0]
+        return limpo
 
     def _validar_digitavel(self, digitavel: str) -> None:
         """Valida se o código digitável tem o tamanho correto"""
-        if len(digitavel) != 47:
-            raise ValueError("Código digitável deve ter 47 dígitos")
+        if len(digitavel) != TAMANHO_LINHA:
+            raise ValueError(
+                f"Código digitável deve ter {TAMANHO_LINHA} dígitos "
+                f"(ou {TAMANHO_CODIGO_BARRAS} no código de barras)"
+            )
 
     def _extrair_componentes(self, digitavel: str) -> Dict[str, str]:
-        """Extrai os componentes do código digitável"""
+        """Extrai os componentes do código de barras equivalente à linha"""
+        codigo_barras = linha_para_codigo_barras(digitavel)
         return {
-            "banco": digitavel[0:3],
-            "moeda": digitavel[3:4],
-            "fator_vencimento": digitavel[4:8],
-            "valor": digitavel[8:17],
-            "digito_verificador": digitavel[17:18],
-            "campo_livre": digitavel[18:47],
+            "banco": codigo_barras[BARRAS_BANCO],
+            "moeda": codigo_barras[BARRAS_MOEDA],
+            "fator_vencimento": codigo_barras[BARRAS_FATOR],
+            "valor": codigo_barras[BARRAS_VALOR],
+            "digito_verificador": codigo_barras[BARRAS_DV_GERAL],
+            "campo_livre": codigo_barras[BARRAS_CAMPO_LIVRE],
+            "codigo_barras": codigo_barras,
+            "linha_digitavel": digitavel,
         }
 
     def _montar_resultado(self, componentes: Dict[str, str]) -> Dict[str, Any]:
@@ -86,39 +149,18 @@ class BoletoDecoder:
             "valor": valor_decimal,
             "digito_verificador": componentes["digito_verificador"],
             "campo_livre": componentes["campo_livre"],
-            "codigo_barras": self._gerar_codigo_barras(
-                componentes["banco"]
-                + componentes["moeda"]
-                + componentes["fator_vencimento"]
-                + componentes["valor"]
-                + componentes["digito_verificador"]
-                + componentes["campo_livre"]
-            ),
+            "codigo_barras": componentes["codigo_barras"],
+            "linha_digitavel": componentes["linha_digitavel"],
         }
 
-    def _fator_para_data(self, fator: int) -> str:
+    def _fator_para_data(self, fator: int) -> Optional[str]:
         """Converte fator de vencimento para data"""
-        # Data base: 07/10/1997
-        data_base = datetime(1997, 10, 7)
-        data_vencimento = data_base + timedelta(days=fator)
-        return data_vencimento.strftime("%d/%m/%Y")
+        return fator_para_data_br(fator)
 
     def _identificar_banco(self, codigo: str) -> str:
         """Identifica o banco pelo código"""
         return self._bancos.get(codigo, f"Banco {codigo}")
 
-    def _gerar_codigo_barras(self, digitavel: str) -> str:
-        """Gera código de barras a partir do digitável"""
-        # Remove dígitos verificadores e reorganiza
-        # Formato: 03399161407000001918281556601014411370000038936
-        return (
-            digitavel[0:4]
-            + digitavel[32:47]
-            + digitavel[4:9]
-            + digitavel[10:20]
-            + digitavel[21:31]
-        )
-
     def _inicializar_bancos(self) -> Dict[str, str]:
         """Inicializa o dicionário de bancos"""
         return {
@@ -0,0 +1,569 @@
+"""
+Motores de extração de texto de PDFs.
+
+Este módulo separa a extração de texto do parser: cada motor sabe extrair
+o texto de um PDF (caminho ou bytes) e o PoolExtracaoTexto mantém um
+executor de longa duração, com concorrência limitada, tempo limite por
+extração e fallback para o pdftotext. SelecaoPaginas limita as páginas
+convertidas (ex.: só a primeira, onde costuma estar a ficha de compensação).
+
+O pool compartilhado pelos parsers (obter_pool_padrao) é configurado por
+variáveis de ambiente:
+
+- ``BOLETO_EXTRACAO_MOTOR``: "pdftotext" (padrão) ou "pypdf2". Os padrões
+  dos extratores foram ajustados sobre o layout de texto do pdftotext
+- ``BOLETO_EXTRACAO_WORKERS``: extrações simultâneas (padrão: 4)
+- ``BOLETO_EXTRACAO_TIMEOUT``: tempo limite por extração, em segundos
+  (padrão: 30; 0 desativa)
+- ``BOLETO_EXTRACAO_PROCESSOS``: "1" para usar processos em vez de threads
+"""
+
+import io
+import os
+import re
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from ..utils.logger import get_logger
+
+OrigemPDF = Union[str, Path, bytes]
+
+logger = get_logger("extracao_texto")
+
+ESTRATEGIAS_PAGINAS = ("todas", "primeira", "ultima", "intervalo", "auto")
+
+# Páginas extraídas por vez na estratégia "auto", depois da primeira e da última
+_BLOCO_AUTO = 4
+
+_PAGINAS_PDFINFO = re.compile(rb"^Pages:\s+(\d+)", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class SelecaoPaginas:
+    """
+    Páginas do PDF a converter em texto
+
+    Estratégias:
+        todas: o documento inteiro (padrão)
+        primeira / ultima: apenas a primeira ou a última página
+        intervalo: páginas de ``inicio`` a ``fim`` (a partir de 1, inclusive;
+            valores negativos contam do final, -1 é a última página)
+        auto: primeira página, depois a última e então as demais, parando na
+            primeira página que contém uma linha digitável com DVs válidos
+    """
+
+    estrategia: str = "todas"
+    inicio: int = 1
+    fim: Optional[int] = None
+
+    def __post_init__(self):
+        if self.estrategia not in ESTRATEGIAS_PAGINAS:
+            raise ValueError(
+                f"Estratégia de páginas desconhecida: {self.estrategia} "
+                f"(use {', '.join(ESTRATEGIAS_PAGINAS)})"
+            )
+        if self.inicio == 0 or self.fim == 0:
+            raise ValueError("Páginas são numeradas a partir de 1 (ou -1 no final)")
+        if (
+            self.fim is not None
+            and (self.inicio > 0) == (self.fim > 0)
+            and self.inicio > self.fim
+        ):
+            raise ValueError(
+                f"Intervalo de páginas invertido: {self.inicio} a {self.fim}"
+            )
+
+    @classmethod
+    def de_texto(cls, valor: Optional[str]) -> "SelecaoPaginas":
+        """
+        Cria a seleção a partir de um texto (opção da CLI, variável de ambiente)
+
+        Args:
+            valor: Nome da estratégia, página ("3", "-1") ou intervalo ("2-5",
+                "2:-1"); vazio ou None equivale a "todas"
+
+        Returns:
+            SelecaoPaginas correspondente
+
+        Raises:
+            ValueError: Se o texto não for reconhecido
+        """
+        valor = (valor or "todas").strip().lower()
+        if valor in ("primeira", "ultima", "todas", "auto"):
+            return cls(valor)
+        partes = re.fullmatch(r"(-?\d+)(?:\s*[-:]\s*(-?\d+))?", valor)
+        if partes is None:
+            raise ValueError(f"Seleção de páginas inválida: {valor}")
+        inicio = int(partes.group(1))
+        fim = int(partes.group(2)) if partes.group(2) else inicio
+        return cls("intervalo", inicio, fim)
+
+    @property
+    def completa(self) -> bool:
+        """Indica se a seleção abrange o documento inteiro"""
+        return self.estrategia == "todas"
+
+    @property
+    def limites(self) -> Tuple[int, Optional[int]]:
+        """Primeira e última página pedidas (podem ser negativas)"""
+        if self.estrategia == "primeira":
+            return 1, 1
+        if self.estrategia == "ultima":
+            return -1, -1
+        if self.estrategia == "intervalo":
+            return self.inicio, self.fim
+        return 1, None
+
+    def resolver(self, total: int) -> Tuple[int, int]:
+        """
+        Converte os limites para páginas absolutas (1..total)
+
+        Args:
+            total: Número de páginas do documento
+
+        Returns:
+            (primeira, última); primeira > última se a seleção estiver vazia
+        """
+        inicio, fim = self.limites
+        if fim is None:
+            fim = total
+        if inicio < 0:
+            inicio += total + 1
+        if fim < 0:
+            fim += total + 1
+        return max(inicio, 1), min(fim, total)
+
+    def __str__(self) -> str:
+        if self.estrategia != "intervalo":
+            return self.estrategia
+        fim = "" if self.fim is None else self.fim
+        return f"{self.inicio}:{fim}"
+
+
+class MotorExtracaoTexto(ABC):
+    """Classe base para motores de extração de texto"""
+
+    nome = "base"
+
+    @abstractmethod
+    def extrair(self, origem: OrigemPDF) -> str:
+        """
+        Extrai o texto de um PDF
+
+        Args:
+            origem: Caminho do arquivo ou conteúdo do PDF em bytes
+
+        Returns:
+            Texto extraído
+
+        Raises:
+            ValueError: Se não for possível extrair o texto
+        """
+
+    def extrair_paginas(
+        self, origem: OrigemPDF, inicio: int = 1, fim: Optional[int] = None
+    ) -> List[str]:
+        """
+        Extrai o texto de cada página do PDF
+
+        Motores que não distinguem páginas ignoram os limites e devolvem o
+        texto todo como uma única página.
+
+        Args:
+            origem: Caminho do arquivo ou conteúdo do PDF em bytes
+            inicio: Primeira página (a partir de 1)
+            fim: Última página, inclusive (None = até o final)
+
+        Returns:
+            Texto de cada página, na ordem do documento
+        """
+        return [self.extrair(origem)]
+
+    def contar_paginas(self, origem: OrigemPDF) -> int:
+        """
+        Retorna o número de páginas do PDF
+
+        Raises:
+            ValueError: Se não for possível ler o PDF
+        """
+        return len(self.extrair_paginas(origem))
+
+
+class MotorPdftotext(MotorExtracaoTexto):
+    """Extração via comando pdftotext (poppler-utils), um processo por chamada"""
+
+    nome = "pdftotext"
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+
+    def extrair_paginas(
+        self, origem: OrigemPDF, inicio: int = 1, fim: Optional[int] = None
+    ) -> List[str]:
+        """
+        Converte só as páginas pedidas (-f/-l) e as separa pelo form feed
+        emitido pelo pdftotext
+        """
+        limites = ["-f", str(inicio)]
+        if fim is not None:
+            limites += ["-l", str(fim)]
+        saida = self._executar("pdftotext", limites, origem)
+        paginas = saida.decode("utf-8", errors="replace").split("\f")
+        if len(paginas) > 1 and not paginas[-1].strip():
+            paginas.pop()
+        return paginas
+
+    def contar_paginas(self, origem: OrigemPDF) -> int:
+        """Lê o número de páginas com 'pdfinfo' (também do poppler-utils)"""
+        paginas = _PAGINAS_PDFINFO.search(self._executar("pdfinfo", [], origem))
+        if paginas is None:
+            raise ValueError("Não foi possível obter o número de páginas do PDF")
+        return int(paginas.group(1))
+
+    def extrair(self, origem: OrigemPDF) -> str:
+        """Extrai texto executando 'pdftotext' (bytes são enviados via stdin)"""
+        return self._executar("pdftotext", [], origem).decode("utf-8", errors="replace")
+
+    def _executar(self, programa: str, opcoes: List[str], origem: OrigemPDF) -> bytes:
+        """Executa um utilitário do poppler e retorna a saída padrão"""
+        if isinstance(origem, bytes):
+            arquivo = "-"
+            entrada: Optional[bytes] = origem
+        else:
+            arquivo = str(origem)
+            entrada = None
+        comando = [programa, *opcoes, arquivo]
+        if programa == "pdftotext":
+            comando.append("-")
+
+        try:
+            resultado = subprocess.run(
+                comando,
+                input=entrada,
+                capture_output=True,
+                check=True,
+                timeout=self.timeout,
+            )
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"Erro ao extrair texto do PDF: {e}")
+        except subprocess.TimeoutExpired:
+            raise ValueError(
+                f"Tempo limite de {self.timeout}s excedido ao extrair texto do PDF"
+            )
+        except FileNotFoundError:
+            raise ValueError(
+                f"Comando '{programa}' não encontrado. Instale o poppler-utils."
+            )
+        return resultado.stdout
+
+
+class MotorPyPDF2(MotorExtracaoTexto):
+    """Extração em processo usando PyPDF2, sem criar subprocessos"""
+
+    nome = "pypdf2"
+
+    def extrair(self, origem: OrigemPDF) -> str:
+        """Extrai texto de todas as páginas com PyPDF2"""
+        return "\n".join(self.extrair_paginas(origem))
+
+    def extrair_paginas(
+        self, origem: OrigemPDF, inicio: int = 1, fim: Optional[int] = None
+    ) -> List[str]:
+        """Extrai o texto de cada página pedida com PyPDF2"""
+        from PyPDF2.errors import PyPdfError
+
+        try:
+            paginas = self._abrir(origem).pages[inicio - 1 : fim]
+            return [pagina.extract_text() or "" for pagina in paginas]
+        except (PyPdfError, OSError, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Erro ao extrair texto do PDF: {e}")
+
+    def contar_paginas(self, origem: OrigemPDF) -> int:
+        """Conta as páginas sem extrair texto"""
+        from PyPDF2.errors import PyPdfError
+
+        try:
+            return len(self._abrir(origem).pages)
+        except (PyPdfError, OSError, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Erro ao ler o PDF: {e}")
+
+    @staticmethod
+    def _abrir(origem: OrigemPDF):
+        """Abre o PDF com PyPDF2 (as páginas são lidas sob demanda)"""
+        from PyPDF2 import PdfReader
+
+        return PdfReader(
+            io.BytesIO(origem) if isinstance(origem, bytes) else str(origem)
+        )
+
+
+MOTORES = {
+    MotorPdftotext.nome: MotorPdftotext,
+    MotorPyPDF2.nome: MotorPyPDF2,
+}
+
+
+class PoolExtracaoTexto:
+    """
+    Pool de longa duração para extração de texto.
+
+    Mantém um executor (threads ou processos) reutilizado entre chamadas,
+    limitando quantas extrações rodam ao mesmo tempo. Se o motor principal
+    falhar ou não encontrar texto, usa o pdftotext como fallback.
+
+    Quando uma extração excede o tempo limite, o executor é descartado e as
+    chamadas seguintes usam um novo, sem esperar pelo PDF travado. Com
+    processos, os processos do executor descartado são encerrados; com
+    threads, a thread travada não pode ser interrompida e continua rodando
+    fora do pool até o motor retornar.
+    """
+
+    def __init__(
+        self,
+        motor: Union[str, MotorExtracaoTexto] = "pdftotext",
+        max_workers: int = 4,
+        timeout: Optional[float] = 30.0,
+        fallback_pdftotext: bool = True,
+        usar_processos: bool = False,
+    ):
+        """
+        Inicializa o pool
+
+        Args:
+            motor: Nome do motor ("pypdf2" ou "pdftotext") ou instância
+            max_workers: Número máximo de extrações simultâneas
+            timeout: Tempo limite por extração, em segundos (None = sem
+                limite); só interrompe de fato a extração com processos
+            fallback_pdftotext: Se deve recorrer ao pdftotext quando o motor
+                principal falhar ou retornar texto vazio
+            usar_processos: Usa processos em vez de threads (evita o GIL em
+                motores puramente Python, como o PyPDF2)
+        """
+        if isinstance(motor, str):
+            if motor not in MOTORES:
+                raise ValueError(f"Motor de extração desconhecido: {motor}")
+            motor = MOTORES[motor]()
+        self.motor = motor
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.usar_processos = usar_processos
+        self.fallback: Optional[MotorExtracaoTexto] = None
+        if fallback_pdftotext and not isinstance(motor, MotorPdftotext):
+            self.fallback = MotorPdftotext(timeout=timeout)
+
+        self._executor: Optional[Executor] = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def do_ambiente(cls) -> "PoolExtracaoTexto":
+        """Cria o pool a partir das variáveis de ambiente BOLETO_EXTRACAO_*"""
+        timeout = float(os.environ.get("BOLETO_EXTRACAO_TIMEOUT", "30"))
+        return cls(
+            motor=os.environ.get("BOLETO_EXTRACAO_MOTOR", "pdftotext"),
+            max_workers=int(os.environ.get("BOLETO_EXTRACAO_WORKERS", "4")),
+            timeout=timeout if timeout > 0 else None,
+            usar_processos=os.environ.get("BOLETO_EXTRACAO_PROCESSOS") == "1",
+        )
+
+    def _obter_executor(self) -> Executor:
+        """Cria o executor no primeiro uso e o reutiliza nas chamadas seguintes"""
+        if self._pid != os.getpid():
+            # Processo filho (fork): as threads do executor herdado não existem
+            self._executor = None
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+        with self._lock:
+            if self._executor is None:
+                tipo = (
+                    ProcessPoolExecutor if self.usar_processos else ThreadPoolExecutor
+                )
+                self._executor = tipo(max_workers=self.max_workers)
+            return self._executor
+
+    def extrair(
+        self, origem: OrigemPDF, paginas: Optional[SelecaoPaginas] = None
+    ) -> str:
+        """
+        Extrai o texto de um PDF usando o pool
+
+        Args:
+            origem: Caminho do arquivo ou conteúdo do PDF em bytes
+            paginas: Páginas a converter (padrão: todas)
+
+        Returns:
+            Texto extraído
+
+        Raises:
+            ValueError: Se nenhum motor conseguir extrair o texto
+        """
+        if paginas is None or paginas.completa:
+            return self._extrair(origem, "extrair")
+        return "\n".join(self.extrair_paginas(origem, paginas))
+
+    def extrair_paginas(
+        self, origem: OrigemPDF, paginas: Optional[SelecaoPaginas] = None
+    ) -> List[str]:
+        """
+        Extrai o texto de cada página de um PDF usando o pool
+
+        Mesmo comportamento de extrair() (tempo limite e fallback), mas
+        preservando a divisão em páginas. Só as páginas selecionadas são
+        convertidas; na estratégia "auto", as páginas seguintes só são
+        convertidas se a linha digitável ainda não tiver sido encontrada.
+
+        Args:
+            origem: Caminho do arquivo ou conteúdo do PDF em bytes
+            paginas: Páginas a converter (padrão: todas)
+
+        Returns:
+            Texto de cada página convertida, na ordem do documento
+
+        Raises:
+            ValueError: Se nenhum motor conseguir extrair o texto
+        """
+        if paginas is None or paginas.completa:
+            return self._extrair(origem, "extrair_paginas")
+        if paginas.estrategia == "auto":
+            return self._extrair_auto(origem)
+
+        inicio, fim = paginas.limites
+        if inicio != 1 or (fim is not None and fim < 0):
+            # Negativos contam do final; um início positivo pode passar do fim
+            inicio, fim = paginas.resolver(self.contar_paginas(origem))
+            if inicio > fim:
+                return []  # Nada a converter (não recorre ao fallback)
+        return self._extrair(origem, "extrair_paginas", inicio, fim)
+
+    def contar_paginas(self, origem: OrigemPDF) -> int:
+        """
+        Retorna o número de páginas do PDF
+
+        Raises:
+            ValueError: Se nenhum motor conseguir ler o PDF
+        """
+        try:
+            return self._extrair_no_pool(origem, "contar_paginas")
+        except ValueError:
+            if self.fallback is None:
+                raise
+            return self.fallback.contar_paginas(origem)
+
+    def _extrair_auto(self, origem: OrigemPDF) -> List[str]:
+        """
+        Converte a primeira página, a última e depois as demais em blocos,
+        parando ao encontrar uma linha digitável válida
+        """
+        from .localizador import INVALIDA, localizar_linha
+
+        total = self.contar_paginas(origem)
+        ordem = [(1, 1)]
+        if total > 1:
+            ordem.append((total, total))
+        ordem += [
+            (inicio, min(inicio + _BLOCO_AUTO - 1, total - 1))
+            for inicio in range(2, total, _BLOCO_AUTO)
+        ]
+
+        convertidas = {}
+        for inicio, fim in ordem:
+            textos = self._extrair(origem, "extrair_paginas", inicio, fim)
+            convertidas.update(zip(range(inicio, fim + 1), textos))
+            encontradas = (localizar_linha(texto) for texto in textos)
+            if any(linha and linha[1] != INVALIDA for linha in encontradas):
+                break
+        logger.debug("Páginas convertidas", total=total, convertidas=len(convertidas))
+        return [convertidas[numero] for numero in sorted(convertidas)]
+
+    def _extrair(
+        self, origem: OrigemPDF, metodo: str, *limites: Optional[int]
+    ) -> Union[str, List[str]]:
+        """Executa ``metodo`` do motor principal, recorrendo ao fallback"""
+        try:
+            texto = self._extrair_no_pool(origem, metodo, *limites)
+            if _tem_texto(texto) or self.fallback is None:
+                return texto
+            logger.info(
+                "Motor não encontrou texto, usando fallback", motor=self.motor.nome
+            )
+        except ValueError as e:
+            if self.fallback is None:
+                raise
+            logger.warning(
+                "Falha no motor de extração, usando fallback",
+                motor=self.motor.nome,
+                erro=str(e),
+            )
+        return getattr(self.fallback, metodo)(origem, *limites)
+
+    def _extrair_no_pool(self, origem: OrigemPDF, metodo: str = "extrair", *limites):
+        """Executa o motor principal no executor, respeitando o tempo limite"""
+        executor = self._obter_executor()
+        futuro = executor.submit(getattr(self.motor, metodo), origem, *limites)
+        try:
+            return futuro.result(timeout=self.timeout)
+        except FuturesTimeoutError:
+            self._descartar_executor(executor)
+            raise ValueError(
+                f"Tempo limite de {self.timeout}s excedido ao extrair texto do PDF"
+            )
+        except BrokenProcessPool as e:
+            # Processos encerrados pelo tempo limite de outra extração
+            self._descartar_executor(executor)
+            raise ValueError(f"Extração interrompida: {e}")
+
+    def _descartar_executor(self, executor: Executor) -> None:
+        """
+        Substitui o executor em que uma extração travou
+
+        Os processos de um ProcessPoolExecutor são encerrados (as extrações
+        em andamento nele falham e vão para o fallback); um executor de
+        threads apenas deixa de receber trabalho.
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return  # Já substituído por outra chamada
+            self._executor = None
+        processos = list((getattr(executor, "_processes", None) or {}).values())
+        for processo in processos:
+            processo.terminate()
+        executor.shutdown(wait=False)
+
+    def fechar(self) -> None:
+        """Encerra o executor (um novo é criado se o pool for usado de novo)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+def _tem_texto(texto: Union[str, List[str]]) -> bool:
+    """Verifica se o texto (ou alguma página) não está em branco"""
+    if isinstance(texto, str):
+        return bool(texto.strip())
+    return any(pagina.strip() for pagina in texto)
+
+
+_pool_padrao: Optional[PoolExtracaoTexto] = None
+_pool_padrao_lock = threading.Lock()
+
+
+def obter_pool_padrao() -> PoolExtracaoTexto:
+    """
+    Retorna o pool de extração compartilhado pelos parsers
+
+    Criado no primeiro uso a partir das variáveis BOLETO_EXTRACAO_* (ver
+    PoolExtracaoTexto.do_ambiente)
+    """
+    global _pool_padrao
+    with _pool_padrao_lock:
+        if _pool_padrao is None:
+            _pool_padrao = PoolExtracaoTexto.do_ambiente()
+        return _pool_padrao
@@ -5,9 +5,10 @@ Este módulo contém classes especializadas para extrair diferentes tipos
 de informações de boletos bancários a partir do texto extraído.
 """
 
-import re
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+from ..core.layout import linha_para_codigo_barras
 from ..models import (
     DadosAluno,
     DadosBeneficiario,
@@ -18,23 +19,52 @@ from ..models import (
     Valores,
 )
 from ..utils.logger import get_logger
+from .indice import IndiceDocumento
+from .localizador import escolher_linha
+from .padroes import PADROES_EXTRAS, registro
+from .varredura import VarredorCampos
+
+
+@lru_cache(maxsize=None)
+def _varredor_extras() -> VarredorCampos:
+    """Varredor dos dados extras, criado no primeiro uso"""
+    return VarredorCampos(
+        {campo: registro.obter(f"extras.{campo}") for campo in PADROES_EXTRAS}
+    )
 
 
 class BoletoDataExtractor:
     """Classe base para extratores de dados de boletos"""
 
-    def __init__(self, texto_extraido: str):
+    def __init__(self, texto_extraido: str, indice: Optional[IndiceDocumento] = None):
         self.texto_extraido = texto_extraido
+        self._indice = indice
         self.logger = get_logger(self.__class__.__name__)
 
-    def _extrair_com_regex(self, padrao: str, grupo: int = 1) -> str:
-        """Extrai valor usando regex com tratamento de erro"""
-        match = re.search(padrao, self.texto_extraido)
+    @property
+    def indice(self) -> IndiceDocumento:
+        """Índice de rótulos do documento (criado no primeiro uso)"""
+        if self._indice is None:
+            self._indice = IndiceDocumento(self.texto_extraido)
+        return self._indice
+
+    def _buscar(self, chave: str):
+        """Busca o padrão registrado com a chave na janela do seu rótulo"""
+        return self.indice.buscar(chave)
+
+    def _linha_digitavel(self) -> Optional[str]:
+        """Linha digitável do boleto, escolhida pelos DVs (None se ausente)"""
+        escolhida = escolher_linha(self.indice.linhas_digitaveis)
+        return escolhida[0] if escolhida else None
+
+    def _extrair_com_regex(self, chave: str, grupo: int = 1) -> str:
+        """Extrai valor usando o padrão registrado com a chave informada"""
+        match = self._buscar(chave)
         return match.group(grupo).strip() if match else ""
 
-    def _extrair_valor_monetario(self, padrao: str) -> float:
-        """Extrai valor monetário usando regex"""
-        match = re.search(padrao, self.texto_extraido)
+    def _extrair_valor_monetario(self, chave: str) -> float:
+        """Extrai valor monetário usando o padrão registrado"""
+        match = self._buscar(chave)
         if match:
             valor_str = match.group(1).replace(",", ".")
             return float(valor_str)
@@ -60,8 +90,7 @@ class BeneficiarioExtractor(BoletoDataExtractor):
 
     def _extrair_nome_cnpj(self) -> tuple[str, str]:
         """Extrai nome e CNPJ do beneficiário"""
-        padrao = r"Beneficiário\s*(.+?)\s*-\s*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})"
-        match = re.search(padrao, self.texto_extraido)
+        match = self._buscar("beneficiario.nome_cnpj")
 
         nome = match.group(1).strip() if match else ""
         cnpj = match.group(2) if match else ""
@@ -70,8 +99,7 @@ class BeneficiarioExtractor(BoletoDataExtractor):
 
     def _extrair_agencia_codigo(self) -> tuple[str, str]:
         """Extrai agência e código do beneficiário"""
-        padrao = r"Agência / Código do Beneficiário\s*(\d+)\s*/\s*(\d+)"
-        match = re.search(padrao, self.texto_extraido)
+        match = self._buscar("beneficiario.agencia_codigo")
 
         agencia = match.group(1) if match else ""
         codigo = match.group(2) if match else ""
@@ -80,7 +108,7 @@ class BeneficiarioExtractor(BoletoDataExtractor):
 
     def _extrair_nosso_numero(self) -> str:
         """Extrai nosso número"""
-        return self._extrair_com_regex(r"Nosso Número\s*(\d+)")
+        return self._extrair_com_regex("beneficiario.nosso_numero")
 
 
 class PagadorExtractor(BoletoDataExtractor):
@@ -95,8 +123,7 @@ class PagadorExtractor(BoletoDataExtractor):
 
     def _extrair_nome_cpf(self) -> tuple[str, str]:
         """Extrai nome e CPF/CNPJ do pagador"""
-        padrao = r"Pagador:\s*(.+?)\s*-\s*CPF/CNPJ:\s*([\d\.-]+)"
-        match = re.search(padrao, self.texto_extraido)
+        match = self._buscar("pagador.nome_cpf")
 
         nome = match.group(1).strip() if match else ""
         cpf = match.group(2) if match else ""
@@ -105,8 +132,7 @@ class PagadorExtractor(BoletoDataExtractor):
 
     def _extrair_endereco_cep(self) -> tuple[str, str]:
         """Extrai endereço e CEP do pagador"""
-        padrao = r"R\s+([^C]+?)\s+CEP:\s*(\d{5}-\d{3})"
-        match = re.search(padrao, self.texto_extraido)
+        match = self._buscar("pagador.endereco_cep")
 
         endereco = match.group(1).strip() if match else ""
         cep = match.group(2) if match else ""
@@ -119,8 +145,8 @@ class AlunoExtractor(BoletoDataExtractor):
 
     def extrair(self) -> Optional[DadosAluno]:
         """Extrai dados do aluno se for boleto educacional"""
-        nome = self._extrair_com_regex(r"Nome do Aluno:\s*(.+)")
-        matricula = self._extrair_com_regex(r"Matrícula:\s*(\d+)")
+        nome = self._extrair_com_regex("aluno.nome")
+        matricula = self._extrair_com_regex("aluno.matricula")
 
         if not nome or not matricula:
             return None
@@ -137,8 +163,7 @@ class AlunoExtractor(BoletoDataExtractor):
 
     def _extrair_curso_turno(self) -> tuple[str, str, str]:
         """Extrai informações do curso e turno"""
-        padrao = r"Curso/Turno\s*(.+?)/(.+?)/(\d+)"
-        match = re.search(padrao, self.texto_extraido)
+        match = self._buscar("aluno.curso_turno")
 
         if match:
             curso = match.group(1).strip()
@@ -169,22 +194,16 @@ class ValoresExtractor(BoletoDataExtractor):
 
     def _extrair_valor_documento(self) -> float:
         """Extrai valor do documento"""
-        return self._extrair_valor_monetario(
-            r"Valor do documento\s*R\$\s*([\d,]+\.?\d*)"
-        )
+        return self._extrair_valor_monetario("valores.documento")
 
     def _extrair_valor_cobrado(self, valor_documento: float) -> float:
         """Extrai valor cobrado"""
-        valor_cobrado = self._extrair_valor_monetario(
-            r"Valor Cobrado\s*R\$\s*([\d,]+\.?\d*)"
-        )
+        valor_cobrado = self._extrair_valor_monetario("valores.cobrado")
         return valor_cobrado if valor_cobrado > 0 else valor_documento
 
     def _extrair_total_debitos(self) -> Optional[float]:
         """Extrai total de débitos"""
-        valor = self._extrair_valor_monetario(
-            r"Total de Débitos:\s*R\$\s*([\d,]+\.?\d*)"
-        )
+        valor = self._extrair_valor_monetario("valores.total_debitos")
         return valor if valor > 0 else None
 
 
@@ -193,11 +212,11 @@ class InformacoesBancariasExtractor(BoletoDataExtractor):
 
     def extrair(self) -> InformacoesBancarias:
         """Extrai informações bancárias"""
-        banco = self._extrair_com_regex(r"BANCO\s+(.+?)\s+S\.\s*A\.")
+        banco = self._extrair_com_regex("bancario.banco")
         codigo_barras = self._extrair_codigo_barras()
-        carteira = self._extrair_com_regex(r"Carteira\s*(\w+)")
-        especie = self._extrair_com_regex(r"Espécie\s*(\w+)")
-        aceite = self._extrair_com_regex(r"Aceite\s*(\w)")
+        carteira = self._extrair_com_regex("bancario.carteira")
+        especie = self._extrair_com_regex("bancario.especie")
+        aceite = self._extrair_com_regex("bancario.aceite")
 
         return InformacoesBancarias(
             banco=banco,
@@ -208,9 +227,9 @@ class InformacoesBancariasExtractor(BoletoDataExtractor):
         )
 
     def _extrair_codigo_barras(self) -> str:
-        """Extrai código de barras"""
-        padrao = r"(\d{3}\d{3}\d{3}\.\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\.\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\.\d{1}\s+\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3})"
-        return self._extrair_com_regex(padrao)
+        """Código de barras (44 dígitos) da linha digitável do boleto"""
+        linha = self._linha_digitavel()
+        return linha_para_codigo_barras(linha) if linha else ""
 
 
 class InstrucoesExtractor(BoletoDataExtractor):
@@ -218,9 +237,9 @@ class InstrucoesExtractor(BoletoDataExtractor):
 
     def extrair(self) -> Instrucoes:
         """Extrai instruções de pagamento"""
-        local_pagamento = self._extrair_com_regex(r"Local do Pagamento\s*(.+?)\n")
-        multa = self._extrair_com_regex(r"Multa após o vencimento:\s*(.+?)\.")
-        juros = self._extrair_com_regex(r"juros de\s*(.+?)\s+por dia")
+        local_pagamento = self._extrair_com_regex("instrucoes.local_pagamento")
+        multa = self._extrair_com_regex("instrucoes.multa")
+        juros = self._extrair_com_regex("instrucoes.juros")
         restricoes = self._extrair_restricoes()
 
         return Instrucoes(
@@ -232,8 +251,7 @@ class InstrucoesExtractor(BoletoDataExtractor):
 
     def _extrair_restricoes(self) -> Optional[str]:
         """Extrai restrições das instruções"""
-        padrao = r"Instruções\s*(.+?)(?=\n\n|\n[A-Z]|$)"
-        match = re.search(padrao, self.texto_extraido, re.DOTALL)
+        match = self._buscar("instrucoes.restricoes")
         return match.group(1).strip() if match else None
 
 
@@ -242,8 +260,7 @@ class EnderecoInstituicaoExtractor(BoletoDataExtractor):
 
     def extrair(self) -> EnderecoInstituicao:
         """Extrai endereço da instituição"""
-        padrao = r"Endereço da Instituição:\s*(.+?)\s+CEP:\s*(\d{5}-\d{3})"
-        match = re.search(padrao, self.texto_extraido)
+        match = self._buscar("instituicao.endereco_cep")
 
         if match:
             endereco = match.group(1).strip()
@@ -265,6 +282,11 @@ class DadosExtrasExtractor(BoletoDataExtractor):
         # Extrair usando padrões predefinidos
         self._extrair_padroes_predefinidos(dados_extras)
 
+        linha = self._linha_digitavel()
+        if linha:
+            dados_extras["codigo_barras_digitavel"] = linha_para_codigo_barras(linha)
+            dados_extras["linha_digitavel"] = linha
+
         # Extrair linhas com informações extras
         self._extrair_linhas_extras(dados_extras)
 
@@ -272,54 +294,10 @@ class DadosExtrasExtractor(BoletoDataExtractor):
         return dados_extras
 
     def _extrair_padroes_predefinidos(self, dados_extras: Dict[str, Any]) -> None:
-        """Extrai dados usando padrões predefinidos"""
-        padroes = {
-            "protocolo": r"Protocolo[:\s]*(\d+)",
-            "codigo_curso": r"Código do Curso[:\s]*(\d+)",
-            "turma": r"Turma[:\s]*([A-Z0-9]+)",
-            "disciplina": r"Disciplina[:\s]*([A-Za-z\s]+)",
-            "periodo": r"Período[:\s]*(\d+)",
-            "semestre": r"Semestre[:\s]*(\d+)",
-            "ano_letivo": r"Ano Letivo[:\s]*(\d{4})",
-            "codigo_baixa": r"Código de Baixa[:\s]*(\d+)",
-            "uso_banco": r"Uso do Banco[:\s]*([A-Za-z0-9\s]+)",
-            "quantidade": r"Quantidade[:\s]*(\d+)",
-            "data_processamento": r"Data processamento[:\s]*(\d{2}/\d{2}/\d{4})",
-            "especie_doc": r"Espécie Doc\s*\n([A-Za-z]{2,})",
-            "aceite": r"Aceite[:\s]*([A-Z])",
-            "codigo_beneficiario_completo": r"Código do Beneficiário[:\s]*(\d+)",
-            "agencia_completa": r"Agência[:\s]*(\d+)",
-            "conta_corrente": r"Conta[:\s]*(\d+)",
-            "nosso_numero_completo": r"Nosso Número[:\s]*(\d+)",
-            "numero_documento": r"Nº do Documento[:\s]*(\d+)",
-            "carteira_completa": r"Carteira[:\s]*([A-Za-z0-9]+)",
-            "especie_completa": r"Espécie[:\s]*([A-Za-z]+)",
-            "valor_abatimento": r"Abatimento[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "valor_desconto": r"Desconto[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "valor_outras_deducoes": r"Outras Deduções[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "valor_mora_multa": r"Mora / Multa[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "valor_outros_acrescimos": r"Outros Acréscimos[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "valor_cobrado": r"Valor Cobrado[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "autenticacao": r"Autenticação[:\s]*([A-Za-z0-9\s]+)",
-            "ficha_compensacao": r"Ficha de Compensação[:\s]*([A-Za-z0-9\s]+)",
-            "codigo_operacional": r"Código Operacional[:\s]*(\d+)",
-            "valor_operacional": r"Valor Operacional[:\s]*R\$\s*([\d,]+\.?\d*)",
-            "data_operacional": r"Data Operacional[:\s]*(\d{2}/\d{2}/\d{4})",
-            "tipo_operacao": r"Tipo de Operação[:\s]*([A-Za-z\s]+)",
-            "responsavel": r"Responsável[:\s]*([A-Za-z\s]+)",
-            "codigo_responsavel": r"Código do Responsável[:\s]*(\d+)",
-            "matricula_responsavel": r"Matrícula do Responsável[:\s]*(\d+)",
-            "endereco_pagador": r"Endereço do Pagador[:\s]*([A-Za-z0-9\s,.-]+)",
-            "telefone_pagador": r"Telefone[:\s]*([\d\s\-\(\)]+)",
-            "email_pagador": r"Email[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-            "observacoes": r"Observações[:\s]*([A-Za-z0-9\s,.-]+)",
-            "instrucoes_especiais": r"Instruções Especiais[:\s]*([A-Za-z0-9\s,.-]+)",
-            "codigo_barras_digitavel": r"(\d{3}\d{3}\d{3}\.\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\.\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\.\d{1}\s+\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3})",
-            "linha_digitavel": r"(\d{3}\d{3}\d{3}\.\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\.\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\.\d{1}\s+\d{1}\s+\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3}\d{3})",
-        }
-
-        for nome_campo, padrao in padroes.items():
-            match = re.search(padrao, self.texto_extraido, re.IGNORECASE)
+        """Extrai dados usando padrões predefinidos, em uma passada pelo texto"""
+        encontrados = _varredor_extras().extrair(self.texto_extraido)
+        for nome_campo in PADROES_EXTRAS:
+            match = encontrados.get(nome_campo)
             if match:
                 valor = match.group(1).strip()
                 if valor:
@@ -327,37 +305,14 @@ class DadosExtrasExtractor(BoletoDataExtractor):
 
     def _extrair_linhas_extras(self, dados_extras: Dict[str, Any]) -> None:
         """Extrai informações extras de linhas não padronizadas"""
-        campos_conhecidos = [
-            "beneficiário",
-            "pagador",
-            "vencimento",
-            "valor",
-            "cnpj",
-            "cpf",
-            "endereço",
-            "cep",
-            "aluno",
-            "matrícula",
-            "curso",
-            "banco",
-            "agência",
-            "carteira",
-            "espécie",
-            "aceite",
-            "local",
-            "multa",
-            "juros",
-            "instruções",
-        ]
-
-        linhas = self.texto_extraido.split("\n")
-        for linha in linhas:
+        campos_conhecidos = registro.obter("extras.campos_conhecidos")
+
+        for linha in self.texto_extraido.split("\n"):
             linha = linha.strip()
             if linha and ":" in linha and len(linha) > 10:
-                if not any(campo in linha.lower() for campo in campos_conhecidos):
-                    if ":" in linha:
-                        chave, valor = linha.split(":", 1)
-                        chave = chave.strip().lower().replace(" ", "_")
-                        valor = valor.strip()
-                        if valor and chave not in dados_extras:
-                            dados_extras[f"info_{chave}"] = valor
+                if not campos_conhecidos.search(linha.lower()):
+                    chave, valor = linha.split(":", 1)
+                    chave = chave.strip().lower().replace(" ", "_")
+                    valor = valor.strip()
+                    if valor and chave not in dados_extras:
+                        dados_extras[f"info_{chave}"] = valor
@@ -0,0 +1,163 @@
+"""
+Índice de rótulos do documento, construído uma vez por parsing.
+
+Logo após a extração do texto, o IndiceDocumento localiza em uma única
+passada todas as ocorrências dos rótulos conhecidos ("Beneficiário",
+"Pagador:", "Valor do documento", "Nosso Número"...), com posição e
+número da linha. Os extratores então aplicam seus padrões apenas em uma
+janela de poucas linhas a partir de cada ocorrência do rótulo, em vez de
+percorrer o texto inteiro. A janela também evita que um padrão iniciado
+em um rótulo repetido (recibo do pagador e ficha de compensação) avance
+sobre a seção seguinte.
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .localizador import localizar_linhas
+from .padroes import registro
+
+# Linhas seguintes à do rótulo incluídas na janela de busca
+JANELA_LINHAS = 2
+
+# "$" não escapado: sem re.MULTILINE, o padrão pode terminar no fim do texto
+_FIM_DO_TEXTO = re.compile(r"(?<!\\)\$")
+
+# Rótulos muito curtos ("R") não servem de âncora
+_TAMANHO_MINIMO_ROTULO = 3
+
+
+@dataclass(frozen=True)
+class Ancora:
+    """Ocorrência de um rótulo no texto"""
+
+    rotulo: str
+    posicao: int
+    linha: int  # Número da linha, a partir de 1
+
+
+@lru_cache(maxsize=None)
+def _rotulos_indexados() -> Tuple[Dict[str, str], "re.Pattern[str]"]:
+    """Rótulos por chave do registro e a expressão que localiza todos eles"""
+    rotulos = {}
+    for chave in registro:
+        # Dados extras usam o VarredorCampos (sem diferenciar maiúsculas)
+        if chave.startswith("extras."):
+            continue
+        rotulo = registro.rotulo(chave)
+        if len(rotulo) >= _TAMANHO_MINIMO_ROTULO:
+            rotulos[chave] = rotulo
+
+    # Lookahead para encontrar também rótulos sobrepostos
+    alternativas = "|".join(
+        re.escape(r) for r in sorted(set(rotulos.values()), key=len, reverse=True)
+    )
+    return rotulos, re.compile(f"(?=({alternativas}))")
+
+
+@lru_cache(maxsize=None)
+def _busca_ate_o_fim(chave: str) -> bool:
+    """
+    Verifica se o padrão pode terminar no fim do texto
+
+    Numa janela, o ``$`` casaria no fim da janela e cortaria o valor; esses
+    padrões são aplicados da âncora até o fim do texto, como na busca no
+    texto inteiro.
+    """
+    padrao = registro.obter(chave)
+    return not padrao.flags & re.MULTILINE and bool(
+        _FIM_DO_TEXTO.search(padrao.pattern)
+    )
+
+
+class IndiceDocumento:
+    """Posições e linhas dos rótulos conhecidos em um documento"""
+
+    def __init__(self, texto: str):
+        """
+        Constrói o índice do texto
+
+        Args:
+            texto: Texto extraído do documento
+        """
+        self.texto = texto
+        self._quebras = [m.start() for m in re.finditer("\n", texto)]
+        self.ocorrencias: Dict[str, List[Ancora]] = {}
+        self._linhas_digitaveis: Optional[List[Tuple[str, int]]] = None
+
+        rotulos, ancoras = _rotulos_indexados()
+        por_inicial: Dict[str, List[str]] = {}
+        for rotulo in set(rotulos.values()):
+            por_inicial.setdefault(rotulo[0], []).append(rotulo)
+
+        for match in ancoras.finditer(texto):
+            posicao = match.start()
+            linha = self.linha_de(posicao)
+            # Mais de um rótulo pode começar na mesma posição
+            for rotulo in por_inicial.get(texto[posicao], ()):
+                if texto.startswith(rotulo, posicao):
+                    self.ocorrencias.setdefault(rotulo, []).append(
+                        Ancora(rotulo, posicao, linha)
+                    )
+
+    def __contains__(self, rotulo: str) -> bool:
+        return rotulo in self.ocorrencias
+
+    @property
+    def linhas_digitaveis(self) -> List[Tuple[str, int]]:
+        """
+        Linhas digitáveis candidatas do documento, com a pontuação dos DVs
+
+        Localizadas no primeiro acesso (ver localizador.py) e compartilhadas
+        pelos extratores.
+        """
+        if self._linhas_digitaveis is None:
+            self._linhas_digitaveis = localizar_linhas(self.texto)
+        return self._linhas_digitaveis
+
+    def linha_de(self, posicao: int) -> int:
+        """Número da linha (a partir de 1) da posição no texto"""
+        return bisect_left(self._quebras, posicao) + 1
+
+    def fim_janela(self, posicao: int, linhas: int = JANELA_LINHAS) -> int:
+        """Posição final da janela: fim da linha da posição + ``linhas``"""
+        indice = self.linha_de(posicao) - 1 + linhas
+        if indice >= len(self._quebras):
+            return len(self.texto)
+        # Inclui a quebra de linha, usada por alguns padrões
+        return self._quebras[indice] + 1
+
+    def buscar(self, chave: str) -> Optional["re.Match[str]"]:
+        """
+        Aplica o padrão registrado na janela de cada ocorrência do rótulo
+
+        Padrões sem rótulo indexado são buscados no texto inteiro; padrões
+        que podem terminar em ``$`` vão da âncora até o fim do texto.
+
+        Args:
+            chave: Chave do padrão no registro
+
+        Returns:
+            Primeiro match encontrado, na ordem do documento, ou None
+        """
+        rotulo = _rotulos_indexados()[0].get(chave)
+        if rotulo is None:
+            return registro.buscar(chave, self.texto)
+
+        ate_o_fim = _busca_ate_o_fim(chave)
+        for ancora in self.ocorrencias.get(rotulo, ()):
+            fim = len(self.texto) if ate_o_fim else self.fim_janela(ancora.posicao)
+            match = registro.casar(chave, self.texto, ancora.posicao, fim)
+            if match:
+                return match
+        return None
+
+    def to_dict(self) -> Dict[str, List[Tuple[int, int]]]:
+        """Ocorrências como {rótulo: [(posição, linha), ...]}"""
+        return {
+            rotulo: [(a.posicao, a.linha) for a in ancoras]
+            for rotulo, ancoras in self.ocorrencias.items()
+        }
@@ -0,0 +1,247 @@
+"""
+Localização da linha digitável no texto extraído do PDF.
+
+Uma única varredura separa o texto em grupos de dígitos ("03399.16140")
+e encadeia os grupos vizinhos separados apenas por espaços e quebras de
+linha, já que o pdftotext costuma quebrar a linha digitável em várias
+linhas ou espaçá-la de forma irregular. Em cada cadeia, as janelas de
+grupos consecutivos com 47 dígitos (linha digitável) ou 44 (código de
+barras) são as candidatas; os DVs decidem entre elas e descartam números
+que só têm o formato certo. Uma linha de 47 dígitos impressa sozinha ou
+nos blocos usuais é mantida mesmo com DVs errados (pontuação INVALIDA), para que um erro de
+impressão ou de extração não faça o documento perder a linha.
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+from ..core.codigo_barras import CodigoBarras, codigos_para_linhas
+from ..core.digitavel import LinhaDigitavel
+from ..core.layout import (
+    LINHA_BLOCOS,
+    LINHA_DV_GERAL,
+    TAMANHO_CODIGO_BARRAS,
+    TAMANHO_LINHA,
+)
+
+# Grupo de dígitos, com os pontos dos campos da linha digitável
+_GRUPO = re.compile(r"\d+(?:\.\d+)*")
+
+# Trecho só de dígitos, pontos e espaços em branco (pode conter cadeias)
+_TRECHO = re.compile(r"\d[\d.\s]*")
+
+# Dígitos de cada grupo da linha digitável impressa (campos 1 a 3, DV geral
+# e fator/valor), como em "03399.16140 07000.001912 81556.001014 4 1137..."
+_BLOCOS_IMPRESSOS = tuple(bloco.stop - bloco.start for bloco in LINHA_BLOCOS) + (
+    1,
+    TAMANHO_LINHA - LINHA_DV_GERAL - 1,
+)
+
+# Quebras de linha aceitas entre dois grupos da mesma cadeia
+_MAX_QUEBRAS = 2
+
+# Pontuação das candidatas
+INVALIDA = 0
+DVS_CAMPOS = 1  # DVs dos campos 1, 2 e 3 conferem
+COMPLETA = 2  # ... e também o DV geral
+
+
+class _Grupo:
+    """Grupo de dígitos de uma cadeia"""
+
+    __slots__ = ("posicao", "digitos", "nova_linha", "isolado")
+
+    def __init__(self, posicao: int, digitos: str, nova_linha: bool):
+        self.posicao = posicao
+        self.digitos = digitos
+        self.nova_linha = nova_linha  # Separado do anterior por quebra de linha
+        self.isolado = False  # Não há outro grupo depois dele na mesma linha
+
+
+def _cadeias(texto: str) -> Iterator[List[_Grupo]]:
+    """Agrupa os grupos de dígitos separados apenas por espaços e quebras"""
+    for trecho in _TRECHO.finditer(texto):
+        if trecho.end() - trecho.start() < TAMANHO_CODIGO_BARRAS:
+            continue  # Curto demais para conter um código (datas, valores...)
+        cadeia: List[_Grupo] = []
+        fim_anterior = trecho.start()
+        for match in _GRUPO.finditer(texto, trecho.start(), trecho.end()):
+            quebras = texto.count("\n", fim_anterior, match.start())
+            if cadeia and quebras > _MAX_QUEBRAS:
+                cadeia[-1].isolado = True
+                yield cadeia
+                cadeia = []
+            elif cadeia and quebras:
+                cadeia[-1].isolado = True
+            digitos = match.group(0).replace(".", "")
+            cadeia.append(_Grupo(match.start(), digitos, bool(cadeia) and quebras > 0))
+            fim_anterior = match.end()
+        cadeia[-1].isolado = True
+        yield cadeia
+
+
+def _aceitar(digitos: str, pelo_formato: bool) -> Optional[str]:
+    """
+    Converte a janela em linha digitável, se passar na verificação
+
+    Uma janela de 47 dígitos que ocupa sozinha o trecho da sua linha de
+    texto, ou que está em uma única linha nos blocos da linha digitável
+    impressa, é aceita pelo formato; as demais (partes de uma sequência
+    maior, cadeias que atravessam quebras de linha) precisam dos DVs dos
+    campos. Códigos de barras são impressos em um único bloco: só valem
+    como trecho inteiro e com o DV geral correto.
+    """
+    if len(digitos) == TAMANHO_CODIGO_BARRAS:
+        if pelo_formato and CodigoBarras(digitos).validar():
+            return codigos_para_linhas([digitos])[0]
+        return None
+    if pelo_formato or LinhaDigitavel(digitos).validar_campos():
+        return digitos
+    return None
+
+
+def _janelas(cadeia: List[_Grupo], tamanho: int) -> Iterator[Tuple[int, int]]:
+    """
+    Janelas [i, j] de grupos consecutivos somando ``tamanho`` dígitos
+
+    Os tamanhos são positivos, então dois ponteiros percorrem a cadeia em
+    tempo linear.
+    """
+    fim = 0
+    soma = 0  # Dígitos dos grupos inicio..fim-1
+    for inicio in range(len(cadeia)):
+        while fim < len(cadeia) and soma < tamanho:
+            soma += len(cadeia[fim].digitos)
+            fim += 1
+        if soma == tamanho:
+            yield inicio, fim - 1
+        soma -= len(cadeia[inicio].digitos)
+
+
+def _janela_valida(digitos: str) -> Optional[str]:
+    """Primeira janela de 47 dígitos com DVs dos campos corretos"""
+    for inicio in range(len(digitos) - TAMANHO_LINHA + 1):
+        janela = digitos[inicio : inicio + TAMANHO_LINHA]
+        if LinhaDigitavel(janela).validar_campos():
+            return janela
+    return None
+
+
+def _candidatos_cadeia(cadeia: List[_Grupo]) -> List[Tuple[int, str]]:
+    """Candidatas de uma cadeia, na ordem do texto"""
+    encontradas = []
+    for tamanho in (TAMANHO_LINHA, TAMANHO_CODIGO_BARRAS):
+        for i, j in _janelas(cadeia, tamanho):
+            grupos = cadeia[i : j + 1]
+            mesma_linha = not any(grupo.nova_linha for grupo in grupos[1:])
+            trecho_inteiro = (
+                (i == 0 or grupos[0].nova_linha) and grupos[-1].isolado and mesma_linha
+            )
+            if tamanho == TAMANHO_CODIGO_BARRAS and not trecho_inteiro:
+                continue
+            impressa = mesma_linha and (
+                tuple(len(grupo.digitos) for grupo in grupos) == _BLOCOS_IMPRESSOS
+            )
+            linha = _aceitar(
+                "".join(g.digitos for g in grupos), trecho_inteiro or impressa
+            )
+            if linha is not None:
+                encontradas.append((grupos[0].posicao, linha))
+
+    # Sequência única maior que uma linha (ex.: banco colado à linha)
+    for grupo in cadeia:
+        if len(grupo.digitos) > TAMANHO_LINHA:
+            linha = _janela_valida(grupo.digitos)
+            if linha is not None:
+                encontradas.append((grupo.posicao, linha))
+
+    encontradas.sort(key=lambda candidata: candidata[0])
+    return encontradas
+
+
+def candidatos(texto: str) -> Iterator[Tuple[int, str]]:
+    """
+    Percorre as linhas digitáveis candidatas do texto
+
+    Janelas que ocupam sozinhas o seu trecho de linha ou que seguem os
+    blocos da linha digitável impressa são aceitas pelo formato (47
+    dígitos); as demais só se os DVs conferirem.
+
+    Args:
+        texto: Texto extraído do PDF
+
+    Yields:
+        (posição no texto, linha normalizada com 47 dígitos)
+    """
+    for cadeia in _cadeias(texto):
+        yield from _candidatos_cadeia(cadeia)
+
+
+def pontuar(linha: str) -> int:
+    """
+    Pontua uma linha digitável pelos DVs que conferem
+
+    Returns:
+        INVALIDA, DVS_CAMPOS ou COMPLETA
+    """
+    if not LinhaDigitavel(linha).validar_campos():
+        return INVALIDA
+    if CodigoBarras.da_linha_digitavel(linha).validar():
+        return COMPLETA
+    return DVS_CAMPOS
+
+
+def localizar_linhas(texto: str) -> List[Tuple[str, int]]:
+    """
+    Lista as linhas digitáveis candidatas distintas, pontuadas pelos DVs
+
+    Inclui as aceitas só pelo formato (pontuação INVALIDA); use
+    escolher_linha() para preferir as que têm DVs corretos.
+
+    Args:
+        texto: Texto extraído do PDF
+
+    Returns:
+        (linha, pontuação) na ordem do texto
+    """
+    encontradas = {}
+    for _, linha in candidatos(texto):
+        if linha not in encontradas:
+            encontradas[linha] = pontuar(linha)
+    return list(encontradas.items())
+
+
+def escolher_linha(linhas: List[Tuple[str, int]]) -> Optional[Tuple[str, int]]:
+    """
+    Escolhe a linha digitável do boleto entre as localizadas
+
+    Prefere a primeira com todos os DVs corretos; sem nenhuma, a primeira
+    cujos DVs dos campos conferem e, por fim, a primeira aceita só pelo
+    formato.
+
+    Args:
+        linhas: Resultado de localizar_linhas()
+
+    Returns:
+        (linha, pontuação) ou None se a lista estiver vazia
+    """
+    melhor = None
+    for linha, nota in linhas:
+        if nota == COMPLETA:
+            return linha, nota
+        if melhor is None or nota > melhor[1]:
+            melhor = (linha, nota)
+    return melhor
+
+
+def localizar_linha(texto: str) -> Optional[Tuple[str, int]]:
+    """
+    Localiza a linha digitável do boleto (ver escolher_linha)
+
+    Args:
+        texto: Texto extraído do PDF
+
+    Returns:
+        (linha, pontuação) ou None se não houver candidata
+    """
+    return escolher_linha(localizar_linhas(texto))
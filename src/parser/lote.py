@@ -0,0 +1,190 @@
+"""
+Processamento em lote de boletos.
+
+Reúne as peças usadas pelo comando ``prod parse-batch``: seleção dos
+arquivos (diretório, padrão glob ou manifesto), checkpoint para retomar
+execuções interrompidas e um pool de processos que devolve os resultados
+à medida que cada arquivo termina.
+"""
+
+import glob
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from ..utils.logger import get_logger
+from .extracao_texto import SelecaoPaginas
+from .saida import Projecao, criar_registro
+
+logger = get_logger("lote")
+
+
+def coletar_arquivos(
+    entrada: Union[str, Path], padrao: str = "*.pdf", manifesto: bool = False
+) -> List[str]:
+    """
+    Lista os arquivos de entrada do lote
+
+    Args:
+        entrada: Diretório (busca recursiva por ``padrao``), padrão glob
+            ("boletos/**/*.pdf") ou arquivo de manifesto
+        padrao: Padrão dos arquivos quando ``entrada`` é um diretório
+        manifesto: Trata ``entrada`` como manifesto (um caminho por linha;
+            linhas vazias e iniciadas por "#" são ignoradas)
+
+    Returns:
+        Caminhos dos arquivos, sem repetição, na ordem encontrada
+
+    Raises:
+        FileNotFoundError: Se o diretório ou manifesto não existir
+    """
+    caminho = Path(entrada)
+    if manifesto:
+        with open(caminho, encoding="utf-8") as arquivo:
+            linhas = (linha.strip() for linha in arquivo)
+            arquivos = [
+                linha for linha in linhas if linha and not linha.startswith("#")
+            ]
+    elif caminho.is_dir():
+        arquivos = sorted(str(p) for p in caminho.rglob(padrao) if p.is_file())
+    elif glob.has_magic(str(entrada)):
+        arquivos = sorted(glob.glob(str(entrada), recursive=True))
+    elif caminho.is_file():
+        arquivos = [str(caminho)]
+    else:
+        raise FileNotFoundError(f"Entrada não encontrada: {entrada}")
+    return list(dict.fromkeys(arquivos))
+
+
+class Checkpoint:
+    """
+    Registro dos arquivos já processados, para retomar um lote.
+
+    Cada arquivo concluído é acrescentado em uma linha e gravado
+    imediatamente; em uma nova execução esses arquivos são pulados.
+    """
+
+    def __init__(self, caminho: Union[str, Path]):
+        """
+        Abre (ou cria) o arquivo de checkpoint
+
+        Args:
+            caminho: Arquivo de checkpoint
+        """
+        self.caminho = Path(caminho)
+        self.processados: Set[str] = set()
+        if self.caminho.exists():
+            with open(self.caminho, encoding="utf-8") as arquivo:
+                self.processados = {linha.rstrip("\n") for linha in arquivo}
+            self.processados.discard("")
+        self._arquivo = open(self.caminho, "a", encoding="utf-8")
+
+    def __contains__(self, fonte: str) -> bool:
+        return fonte in self.processados
+
+    def __len__(self) -> int:
+        return len(self.processados)
+
+    def registrar(self, fonte: str) -> None:
+        """Marca um arquivo como processado"""
+        self.processados.add(fonte)
+        self._arquivo.write(fonte + "\n")
+        self._arquivo.flush()
+
+    def fechar(self) -> None:
+        """Fecha o arquivo de checkpoint"""
+        self._arquivo.close()
+
+
+# === EXECUÇÃO NOS PROCESSOS DO POOL ===
+
+_parser = None
+
+
+def processar_arquivo(
+    caminho: str,
+    projecao: Optional[Projecao] = None,
+    paginas: Optional[SelecaoPaginas] = None,
+    modo: str = "completo",
+) -> Dict[str, Any]:
+    """
+    Faz o parsing de um arquivo no processo atual
+
+    Erros não são propagados: voltam no próprio registro, para que um
+    arquivo com problema não interrompa o lote.
+
+    Args:
+        caminho: Caminho do PDF
+        projecao: Campos a serializar; os demais não chegam a ser
+            enviados de volta ao processo principal
+        paginas: Páginas convertidas em texto (padrão: todas)
+        modo: "completo" (BoletoData) ou "pagamento" (DadosPagamento)
+
+    Returns:
+        Registro {"arquivo", "sucesso", "erro", "dados"}
+    """
+    global _parser
+    paginas = paginas or SelecaoPaginas()
+    if _parser is None or _parser.paginas != paginas:
+        from .parser import BoletoParser
+
+        _parser = BoletoParser(paginas=paginas)
+
+    try:
+        if modo == "pagamento":
+            dados = _parser.parse_pagamento(caminho)
+        else:
+            dados = _parser.parse(caminho)
+    except Exception as e:
+        logger.warning("Falha ao processar arquivo", arquivo=caminho, erro=str(e))
+        return criar_registro(caminho, erro=str(e))
+    return criar_registro(caminho, dados, projecao=projecao)
+
+
+def processar_lote(
+    arquivos: Iterable[str],
+    workers: Optional[int] = None,
+    max_pendentes: Optional[int] = None,
+    projecao: Optional[Projecao] = None,
+    paginas: Optional[SelecaoPaginas] = None,
+    modo: str = "completo",
+) -> Iterator[Dict[str, Any]]:
+    """
+    Processa arquivos em um pool de processos
+
+    Os resultados são devolvidos na ordem em que terminam. No máximo
+    ``max_pendentes`` arquivos ficam submetidos ao pool ao mesmo tempo,
+    o que limita a memória mesmo com listas muito grandes.
+
+    Args:
+        arquivos: Caminhos dos PDFs
+        workers: Número de processos (padrão: número de CPUs)
+        max_pendentes: Limite de tarefas em andamento (padrão: 2 × workers)
+        projecao: Campos a serializar em cada registro (padrão: todos)
+        paginas: Páginas convertidas em texto em cada arquivo (padrão: todas)
+        modo: "completo" ou "pagamento" (ver processar_arquivo)
+
+    Yields:
+        Registros produzidos por processar_arquivo()
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pendentes = max_pendentes or workers * 2
+    fila = iter(arquivos)
+    pendentes: Set[Future] = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for caminho in fila:
+            pendentes.add(
+                executor.submit(processar_arquivo, caminho, projecao, paginas, modo)
+            )
+            if len(pendentes) < max_pendentes:
+                continue
+            concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                yield futuro.result()
+
+        while pendentes:
+            concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                yield futuro.result()
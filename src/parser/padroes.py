@@ -0,0 +1,341 @@
+"""
+Registro central dos padrões regex usados pelos extratores.
+
+Cada padrão é registrado uma única vez, identificado por uma chave
+("<grupo>.<campo>"), e compilado no primeiro uso. O registro também
+contabiliza o tempo gasto compilando cada padrão e, se habilitado
+(``BOLETO_MEDIR_PADROES=1``), o tempo das buscas, para identificar os
+campos mais caros do parsing.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger("padroes")
+
+_VALOR = r"R\$\s*([\d,]+\.?\d*)"
+
+# Rótulo literal no início do padrão (até o primeiro metacaractere)
+_PREFIXO_LITERAL = re.compile(r"[^\\\[\](){}.*+?|^$]+")
+
+# Quantificadores que podem tornar opcional o caractere anterior
+_QUANTIFICADORES_OPCIONAIS = frozenset("*?{")
+
+
+def rotulo_literal(padrao: str) -> str:
+    """
+    Retorna o rótulo literal que inicia o padrão (ou vazio)
+
+    Se o prefixo for seguido de um quantificador (``*``, ``?`` ou ``{``), o
+    último caractere pode não aparecer no texto e fica fora do rótulo.
+    """
+    match = _PREFIXO_LITERAL.match(padrao)
+    if not match:
+        return ""
+    rotulo = match.group(0)
+    if padrao[match.end() : match.end() + 1] in _QUANTIFICADORES_OPCIONAIS:
+        rotulo = rotulo[:-1]
+    return rotulo
+
+
+@dataclass
+class EstatisticaPadrao:
+    """Tempo de compilação e de busca acumulado de um padrão"""
+
+    compilacao_s: float = 0.0
+    buscas: int = 0
+    busca_s: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Converte a estatística para dicionário"""
+        return {
+            "compilacao_s": self.compilacao_s,
+            "buscas": self.buscas,
+            "busca_s": self.busca_s,
+        }
+
+
+class RegistroPadroes:
+    """
+    Registro de padrões regex compilados, identificados por chave.
+
+    A compilação é preguiçosa (no primeiro uso da chave) e o resultado é
+    compartilhado por todas as threads. Use ``compilar_todos()`` para
+    compilar tudo antecipadamente, por exemplo na inicialização da API.
+    """
+
+    def __init__(self, medir_tempo: Optional[bool] = None):
+        """
+        Inicializa o registro
+
+        Args:
+            medir_tempo: Se deve contabilizar o tempo de cada busca (padrão:
+                variável de ambiente BOLETO_MEDIR_PADROES=1). A medição
+                serializa as buscas das threads em um lock; use apenas para
+                diagnóstico
+        """
+        if medir_tempo is None:
+            medir_tempo = os.environ.get("BOLETO_MEDIR_PADROES") == "1"
+        self.medir_tempo = medir_tempo
+        self._fontes: Dict[str, Tuple[str, int]] = {}
+        self._compilados: Dict[str, "re.Pattern[str]"] = {}
+        self._estatisticas: Dict[str, EstatisticaPadrao] = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, chave: str, padrao: str, flags: int = 0) -> None:
+        """
+        Registra um padrão
+
+        Args:
+            chave: Identificador do padrão, por exemplo "valores.documento"
+            padrao: Expressão regular
+            flags: Flags do módulo re
+
+        Raises:
+            ValueError: Se a chave já estiver registrada com outro padrão
+        """
+        with self._lock:
+            anterior = self._fontes.get(chave)
+            if anterior is not None and anterior != (padrao, flags):
+                raise ValueError(f"Padrão já registrado com a chave: {chave}")
+            self._fontes[chave] = (padrao, flags)
+            self._estatisticas.setdefault(chave, EstatisticaPadrao())
+
+    def __contains__(self, chave: str) -> bool:
+        return chave in self._fontes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fontes)
+
+    def __len__(self) -> int:
+        return len(self._fontes)
+
+    def obter(self, chave: str) -> "re.Pattern[str]":
+        """
+        Retorna o padrão compilado, compilando no primeiro uso
+
+        Raises:
+            KeyError: Se a chave não estiver registrada
+        """
+        compilado = self._compilados.get(chave)
+        if compilado is not None:
+            return compilado
+
+        padrao, flags = self._fontes[chave]
+        inicio = time.perf_counter()
+        compilado = re.compile(padrao, flags)
+        duracao = time.perf_counter() - inicio
+        with self._lock:
+            # Outra thread pode ter compilado antes; mantém o primeiro
+            compilado = self._compilados.setdefault(chave, compilado)
+            self._estatisticas[chave].compilacao_s += duracao
+        return compilado
+
+    def compilar_todos(self) -> None:
+        """Compila todos os padrões registrados"""
+        for chave in list(self._fontes):
+            self.obter(chave)
+        logger.info("Padrões compilados", quantidade=len(self._compilados))
+
+    def buscar(self, chave: str, texto: str) -> Optional["re.Match[str]"]:
+        """
+        Executa ``search`` do padrão no texto
+
+        Args:
+            chave: Chave do padrão
+            texto: Texto onde buscar
+
+        Returns:
+            Match encontrado ou None
+        """
+        return self._medir(chave, self.obter(chave).search, texto)
+
+    def casar(
+        self, chave: str, texto: str, inicio: int = 0, fim: Optional[int] = None
+    ) -> Optional["re.Match[str]"]:
+        """
+        Executa ``match`` do padrão a partir de uma posição do texto
+
+        Args:
+            chave: Chave do padrão
+            texto: Texto onde buscar
+            inicio: Posição onde o padrão deve começar
+            fim: Posição final considerada (padrão: final do texto)
+
+        Returns:
+            Match encontrado ou None
+        """
+        fim = len(texto) if fim is None else fim
+        return self._medir(chave, self.obter(chave).match, texto, inicio, fim)
+
+    def rotulo(self, chave: str) -> str:
+        """Rótulo literal que inicia o padrão da chave (ou vazio)"""
+        return rotulo_literal(self._fontes[chave][0])
+
+    def _medir(self, chave: str, funcao, *args) -> Optional["re.Match[str]"]:
+        """Executa a busca contabilizando o tempo, se habilitado"""
+        if not self.medir_tempo:
+            return funcao(*args)
+
+        inicio = time.perf_counter()
+        match = funcao(*args)
+        duracao = time.perf_counter() - inicio
+        with self._lock:
+            estatistica = self._estatisticas[chave]
+            estatistica.buscas += 1
+            estatistica.busca_s += duracao
+        return match
+
+    def assinatura(self) -> str:
+        """Hash dos padrões registrados; muda quando algum padrão muda"""
+        with self._lock:
+            fontes = sorted(self._fontes.items())
+        return hashlib.sha256(repr(fontes).encode("utf-8")).hexdigest()[:16]
+
+    def estatisticas(self) -> Dict[str, dict]:
+        """Retorna as estatísticas por chave, das mais caras para as mais baratas"""
+        with self._lock:
+            itens = [(c, e.to_dict()) for c, e in self._estatisticas.items()]
+        itens.sort(key=lambda item: item[1]["busca_s"], reverse=True)
+        return dict(itens)
+
+    def zerar_estatisticas(self) -> None:
+        """Zera os contadores de busca (o tempo de compilação é mantido)"""
+        with self._lock:
+            for estatistica in self._estatisticas.values():
+                estatistica.buscas = 0
+                estatistica.busca_s = 0.0
+
+
+registro = RegistroPadroes()
+
+_PADROES: Dict[str, str] = {
+    # Dados básicos (BoletoParser)
+    "basico.cnpj_instituicao": (
+        r"CNPJ da Instituição:\s*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})"
+    ),
+    "basico.numero_boleto": r"Boleto:\s*(\d+)",
+    "basico.vencimento": r"Vencimento:\s*(\d{2}/\d{2}/\d{4})",
+    "basico.data_documento": r"Data do documento\s*(\d{2}/\d{2}/\d{4})",
+    # Beneficiário
+    "beneficiario.nome_cnpj": (
+        r"Beneficiário\s*(.+?)\s*-\s*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})"
+    ),
+    "beneficiario.agencia_codigo": (
+        r"Agência / Código do Beneficiário\s*(\d+)\s*/\s*(\d+)"
+    ),
+    "beneficiario.nosso_numero": r"Nosso Número\s*(\d+)",
+    # Pagador
+    "pagador.nome_cpf": r"Pagador:\s*(.+?)\s*-\s*CPF/CNPJ:\s*([\d\.-]+)",
+    "pagador.endereco_cep": r"R\s+([^C]+?)\s+CEP:\s*(\d{5}-\d{3})",
+    # Aluno
+    "aluno.nome": r"Nome do Aluno:\s*(.+)",
+    "aluno.matricula": r"Matrícula:\s*(\d+)",
+    "aluno.curso_turno": r"Curso/Turno\s*(.+?)/(.+?)/(\d+)",
+    # Valores
+    "valores.documento": r"Valor do documento\s*" + _VALOR,
+    "valores.cobrado": r"Valor Cobrado\s*" + _VALOR,
+    "valores.total_debitos": r"Total de Débitos:\s*" + _VALOR,
+    # Informações bancárias
+    "bancario.banco": r"BANCO\s+(.+?)\s+S\.\s*A\.",
+    "bancario.carteira": r"Carteira\s*(\w+)",
+    "bancario.especie": r"Espécie\s*(\w+)",
+    "bancario.aceite": r"Aceite\s*(\w)",
+    # Instruções
+    "instrucoes.local_pagamento": r"Local do Pagamento\s*(.+?)\n",
+    "instrucoes.multa": r"Multa após o vencimento:\s*(.+?)\.",
+    "instrucoes.juros": r"juros de\s*(.+?)\s+por dia",
+    # Endereço da instituição
+    "instituicao.endereco_cep": (
+        r"Endereço da Instituição:\s*(.+?)\s+CEP:\s*(\d{5}-\d{3})"
+    ),
+}
+
+# Dados extras: buscados sem diferenciar maiúsculas de minúsculas
+PADROES_EXTRAS: Dict[str, str] = {
+    "protocolo": r"Protocolo[:\s]*(\d+)",
+    "codigo_curso": r"Código do Curso[:\s]*(\d+)",
+    "turma": r"Turma[:\s]*([A-Z0-9]+)",
+    "disciplina": r"Disciplina[:\s]*([A-Za-z\s]+)",
+    "periodo": r"Período[:\s]*(\d+)",
+    "semestre": r"Semestre[:\s]*(\d+)",
+    "ano_letivo": r"Ano Letivo[:\s]*(\d{4})",
+    "codigo_baixa": r"Código de Baixa[:\s]*(\d+)",
+    "uso_banco": r"Uso do Banco[:\s]*([A-Za-z0-9\s]+)",
+    "quantidade": r"Quantidade[:\s]*(\d+)",
+    "data_processamento": r"Data processamento[:\s]*(\d{2}/\d{2}/\d{4})",
+    "especie_doc": r"Espécie Doc\s*\n([A-Za-z]{2,})",
+    "aceite": r"Aceite[:\s]*([A-Z])",
+    "codigo_beneficiario_completo": r"Código do Beneficiário[:\s]*(\d+)",
+    "agencia_completa": r"Agência[:\s]*(\d+)",
+    "conta_corrente": r"Conta[:\s]*(\d+)",
+    "nosso_numero_completo": r"Nosso Número[:\s]*(\d+)",
+    "numero_documento": r"Nº do Documento[:\s]*(\d+)",
+    "carteira_completa": r"Carteira[:\s]*([A-Za-z0-9]+)",
+    "especie_completa": r"Espécie[:\s]*([A-Za-z]+)",
+    "valor_abatimento": r"Abatimento[:\s]*" + _VALOR,
+    "valor_desconto": r"Desconto[:\s]*" + _VALOR,
+    "valor_outras_deducoes": r"Outras Deduções[:\s]*" + _VALOR,
+    "valor_mora_multa": r"Mora / Multa[:\s]*" + _VALOR,
+    "valor_outros_acrescimos": r"Outros Acréscimos[:\s]*" + _VALOR,
+    "valor_cobrado": r"Valor Cobrado[:\s]*" + _VALOR,
+    "autenticacao": r"Autenticação[:\s]*([A-Za-z0-9\s]+)",
+    "ficha_compensacao": r"Ficha de Compensação[:\s]*([A-Za-z0-9\s]+)",
+    "codigo_operacional": r"Código Operacional[:\s]*(\d+)",
+    "valor_operacional": r"Valor Operacional[:\s]*" + _VALOR,
+    "data_operacional": r"Data Operacional[:\s]*(\d{2}/\d{2}/\d{4})",
+    "tipo_operacao": r"Tipo de Operação[:\s]*([A-Za-z\s]+)",
+    "responsavel": r"Responsável[:\s]*([A-Za-z\s]+)",
+    "codigo_responsavel": r"Código do Responsável[:\s]*(\d+)",
+    "matricula_responsavel": r"Matrícula do Responsável[:\s]*(\d+)",
+    "endereco_pagador": r"Endereço do Pagador[:\s]*([A-Za-z0-9\s,.-]+)",
+    "telefone_pagador": r"Telefone[:\s]*([\d\s\-\(\)]+)",
+    "email_pagador": r"Email[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
+    "observacoes": r"Observações[:\s]*([A-Za-z0-9\s,.-]+)",
+    "instrucoes_especiais": r"Instruções Especiais[:\s]*([A-Za-z0-9\s,.-]+)",
+}
+
+for _chave, _padrao in _PADROES.items():
+    registro.registrar(_chave, _padrao)
+
+# A instrução pode ocupar várias linhas
+registro.registrar(
+    "instrucoes.restricoes", r"Instruções\s*(.+?)(?=\n\n|\n[A-Z]|$)", re.DOTALL
+)
+
+for _chave, _padrao in PADROES_EXTRAS.items():
+    registro.registrar(f"extras.{_chave}", _padrao, re.IGNORECASE)
+
+# Linhas "chave: valor" que mencionam estes termos já são campos conhecidos
+CAMPOS_CONHECIDOS = (
+    "beneficiário",
+    "pagador",
+    "vencimento",
+    "valor",
+    "cnpj",
+    "cpf",
+    "endereço",
+    "cep",
+    "aluno",
+    "matrícula",
+    "curso",
+    "banco",
+    "agência",
+    "carteira",
+    "espécie",
+    "aceite",
+    "local",
+    "multa",
+    "juros",
+    "instruções",
+)
+registro.registrar(
+    "extras.campos_conhecidos", "|".join(re.escape(c) for c in CAMPOS_CONHECIDOS)
+)
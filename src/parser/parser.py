@@ -5,195 +5,574 @@ Este módulo contém a classe BoletoParser que coordena a extração
 de dados de boletos bancários usando extratores especializados.
 """
 
-import re
-import subprocess
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import (
+    BinaryIO,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from ..models import BoletoData
+from ..models import BoletoData, DadosPagamento
 from ..utils.logger import get_logger
+from .cache import CacheResultados, chave_conteudo, versao_parser
 from .decoder import BoletoDecoder
-from .extractors import (
-    AlunoExtractor,
-    BeneficiarioExtractor,
-    DadosExtrasExtractor,
-    EnderecoInstituicaoExtractor,
-    InformacoesBancariasExtractor,
-    InstrucoesExtractor,
-    PagadorExtractor,
-    ValoresExtractor,
+from .extracao_texto import (
+    OrigemPDF,
+    PoolExtracaoTexto,
+    SelecaoPaginas,
+    obter_pool_padrao,
+)
+from .indice import IndiceDocumento
+from .localizador import COMPLETA, INVALIDA, localizar_linha
+from .resultado import (
+    BoletoLazy,
+    ResultadoBoleto,
+    selecionar_campos,
+    validar_campos,
 )
+from .segmentacao import segmentar
+from .tipo_arquivo import TipoArquivo, detectar_tipo, detectar_tipo_arquivo
+
+OrigemArquivo = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+ResultadoItem = Tuple[OrigemArquivo, Union[ResultadoBoleto, Exception]]
+
+# "completo": BoletoData com todos os extratores; "pagamento": DadosPagamento
+MODOS_PARSING = ("completo", "pagamento")
+
+
+def _normalizar_origem(origem: OrigemArquivo) -> OrigemPDF:
+    """Converte a origem para caminho (str) ou conteúdo em bytes"""
+    if isinstance(origem, bytes):
+        return origem
+    if isinstance(origem, (bytearray, memoryview)):
+        return bytes(origem)
+    if hasattr(origem, "read"):
+        return origem.read()
+    return str(origem)
+
+
+def _descrever(origem: OrigemArquivo) -> str:
+    """Descreve a origem para os logs sem incluir o conteúdo"""
+    if isinstance(origem, (bytes, bytearray, memoryview)):
+        return f"<{len(origem)} bytes em memória>"
+    if hasattr(origem, "read"):
+        return f"<{type(origem).__name__}>"
+    return str(origem)
+
+
+def _selecionar(
+    dados: BoletoData, campos: Optional[Tuple[str, ...]]
+) -> ResultadoBoleto:
+    """Reduz um resultado completo aos campos pedidos"""
+    if campos is None:
+        return dados
+    return selecionar_campos(dados, dados.tipo_boleto, campos)
+
+
+_parser_segmentos: Optional["BoletoParser"] = None
+
+
+def _parse_segmento(texto: str, campos: Optional[Tuple[str, ...]]) -> ResultadoBoleto:
+    """Parsing de um segmento de texto (executável em outro processo)"""
+    global _parser_segmentos
+    if _parser_segmentos is None:
+        _parser_segmentos = BoletoParser()
+    return _parser_segmentos.parse_texto(texto, campos)
+
+
+@dataclass
+class ContextoParsing:
+    """
+    Estado de um único parsing.
+
+    Tudo o que pertence ao documento sendo processado fica aqui, e não no
+    BoletoParser; assim uma mesma instância do parser pode atender várias
+    threads ao mesmo tempo.
+    """
+
+    texto_extraido: str
+    origem: str = "<texto>"
+    tipo_boleto: str = "desconhecido"
+    indice: Optional[IndiceDocumento] = None
 
 
 class BoletoParser:
-    """Parser inteligente para boletos bancários PDF"""
+    """
+    Parser inteligente para boletos bancários PDF.
+
+    A instância não guarda estado do documento processado (ver
+    ContextoParsing) e pode ser compartilhada entre threads.
+    """
+
+    def __init__(
+        self,
+        extrator: Optional[PoolExtracaoTexto] = None,
+        cache: Optional[CacheResultados] = None,
+        paginas: Union[str, SelecaoPaginas, None] = None,
+    ):
+        """
+        Inicializa o parser
 
-    def __init__(self):
+        Args:
+            extrator: Pool de extração de texto (padrão: pool compartilhado)
+            cache: Cache de resultados indexado pelo conteúdo (padrão: sem cache)
+            paginas: Páginas convertidas em texto por parse() (SelecaoPaginas
+                ou texto como "primeira", "ultima", "auto", "2-5"; padrão:
+                todas)
+
+        Raises:
+            ValueError: Se a seleção de páginas for inválida
+        """
         self.logger = get_logger("boleto_parser")
         self.decoder = BoletoDecoder()
-        self.texto_extraido = ""
+        self.extrator = extrator or obter_pool_padrao()
+        self.cache = cache
+        if not isinstance(paginas, SelecaoPaginas):
+            paginas = SelecaoPaginas.de_texto(paginas)
+        self.paginas = paginas
+        # Resultados de seleções diferentes não compartilham entradas no cache
+        self._versao_cache = (
+            None if paginas.completa else f"{versao_parser()}|paginas={paginas}"
+        )
 
-    def parse(self, caminho_arquivo: str) -> BoletoData:
+    def parse(
+        self, origem: OrigemArquivo, fields: Optional[Iterable[str]] = None
+    ) -> ResultadoBoleto:
         """
         Método principal que faz todo o parsing do boleto
 
         Args:
-            caminho_arquivo: Caminho para o arquivo PDF do boleto
+            origem: Caminho para o arquivo PDF do boleto, conteúdo do PDF em
+                bytes ou objeto file-like aberto em modo binário
+            fields: Campos do BoletoData a extrair (None = todos); os demais
+                extratores não são executados
+
+        Returns:
+            Objeto BoletoData com os dados extraídos (BoletoDataParcial,
+            só com os campos pedidos e o tipo do boleto, se houver ``fields``)
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado
+            ValueError: Se o arquivo não for um PDF válido ou algum campo
+                pedido não existir
+        """
+        campos = validar_campos(fields)
+        if self.cache is None:
+            return self._finalizar(self.parse_lazy(origem), campos)
+
+        conteudo = self._ler_conteudo(origem)
+        chave = chave_conteudo(conteudo, self._versao_cache)
+        dados = self.cache.obter(chave)
+        if dados is not None:
+            self.logger.info("Resultado obtido do cache", arquivo=_descrever(origem))
+            return _selecionar(dados, campos)
+
+        # Apenas resultados completos são armazenados
+        resultado = self.parse_lazy(conteudo)
+        if campos is not None:
+            return self._finalizar(resultado, campos)
+        dados = self._finalizar(resultado, None)
+        self.cache.guardar(chave, dados)
+        return dados
+
+    def parse_multiplos(
+        self,
+        origem: OrigemArquivo,
+        fields: Optional[Iterable[str]] = None,
+        executor: Optional[Executor] = None,
+        workers: int = 4,
+    ) -> List[ResultadoBoleto]:
+        """
+        Faz o parsing de um PDF com vários boletos (carnê ou lote)
+
+        O texto é extraído uma única vez, página a página (sempre o
+        documento inteiro, independentemente de ``paginas``), e dividido em
+        um segmento por ficha de compensação, ancorado nas linhas digitáveis
+        (ver segmentacao.py). Um PDF com um único boleto resulta em uma
+        lista com um elemento.
+
+        Args:
+            origem: Caminho para o arquivo PDF, conteúdo em bytes ou objeto
+                file-like binário
+            fields: Campos do BoletoData a extrair (None = todos)
+            executor: Executor para processar os segmentos em paralelo (por
+                exemplo, um ProcessPoolExecutor reutilizado); por padrão os
+                segmentos são processados em um pool de ``workers`` threads
+                criado para a chamada
+            workers: Threads de parsing sem ``executor`` (1 = sequencial, na
+                thread atual)
+
+        Returns:
+            Um BoletoData (ou BoletoDataParcial, com ``fields``) por boleto,
+            na ordem do documento
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado
+            ValueError: Se o arquivo não for um PDF válido ou algum campo
+                pedido não existir
+        """
+        campos = validar_campos(fields)
+        descricao = _descrever(origem)
+        self.logger.info("Iniciando parsing de múltiplos boletos", arquivo=descricao)
+
+        conteudo = self._validar_arquivo(origem)
+        try:
+            paginas = self.extrator.extrair_paginas(conteudo)
+        except ValueError as e:
+            self.logger.error("Erro ao extrair texto do PDF", erro=str(e))
+            raise
+        segmentos = segmentar(paginas)
+        self.logger.info(
+            "Documento segmentado", paginas=len(paginas), boletos=len(segmentos)
+        )
+
+        textos = [segmento.texto for segmento in segmentos]
+        if executor is not None:
+            return list(executor.map(_parse_segmento, textos, [campos] * len(textos)))
+        if workers <= 1 or len(textos) <= 1:
+            return [self.parse_texto(texto, campos) for texto in textos]
+        # A instância é compartilhada pelas threads (ver ContextoParsing)
+        with ThreadPoolExecutor(max_workers=min(workers, len(textos))) as threads:
+            return list(threads.map(self.parse_texto, textos, [campos] * len(textos)))
+
+    def parse_pagamento(
+        self,
+        origem: OrigemArquivo,
+        paginas: Union[str, SelecaoPaginas, None] = None,
+    ) -> DadosPagamento:
+        """
+        Extrai apenas os dados para pagamento, a partir da linha digitável
+
+        A linha digitável é localizada no texto e validada pelos DVs; banco,
+        valor e vencimento vêm da decodificação da linha. Nenhum dos
+        extratores de seções (beneficiário, pagador, extras...) é executado
+        e as páginas são convertidas sob demanda, parando na página da
+        linha digitável.
+
+        Args:
+            origem: Caminho para o arquivo PDF, conteúdo em bytes ou objeto
+                file-like binário
+            paginas: Páginas onde procurar a linha (padrão: a seleção do
+                parser, ou "auto" se ela for "todas")
 
         Returns:
-            Objeto BoletoData com todos os dados extraídos
+            DadosPagamento do boleto
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado
+            ValueError: Se o arquivo não for um PDF válido ou não tiver
+                linha digitável válida
+        """
+        descricao = _descrever(origem)
+        self.logger.info("Iniciando parsing para pagamento", arquivo=descricao)
+
+        if paginas is None:
+            paginas = SelecaoPaginas("auto") if self.paginas.completa else self.paginas
+        elif not isinstance(paginas, SelecaoPaginas):
+            paginas = SelecaoPaginas.de_texto(paginas)
+
+        conteudo = self._validar_arquivo(origem)
+        try:
+            texto = self.extrator.extrair(conteudo, paginas)
+        except ValueError as e:
+            self.logger.error("Erro ao extrair texto do PDF", erro=str(e))
+            raise
+        return self.pagamento_do_texto(texto)
+
+    def pagamento_do_texto(self, texto: str) -> DadosPagamento:
+        """
+        Obtém os dados para pagamento a partir do texto já extraído
+
+        Args:
+            texto: Texto extraído do boleto
+
+        Returns:
+            DadosPagamento do boleto
+
+        Raises:
+            ValueError: Se o texto não tiver linha digitável válida
+        """
+        encontrada = localizar_linha(texto)
+        if encontrada is None or encontrada[1] == INVALIDA:
+            self.logger.error("Linha digitável não encontrada")
+            raise ValueError("Linha digitável válida não encontrada no documento")
+
+        linha, nota = encontrada
+        dados = self.decoder.decodificar_digitavel(linha)
+        return DadosPagamento(
+            banco=dados["banco"]["codigo"],
+            nome_banco=dados["banco"]["nome"],
+            valor=dados["valor"],
+            vencimento=dados["vencimento"],
+            linha_digitavel=dados["linha_digitavel"],
+            codigo_barras=dados["codigo_barras"],
+            dv_geral_valido=nota == COMPLETA,
+        )
+
+    def parse_many(
+        self,
+        origens: Iterable[OrigemArquivo],
+        workers: int = 4,
+        ordered: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        max_pendentes: Optional[int] = None,
+    ) -> Iterator[ResultadoItem]:
+        """
+        Faz o parsing de vários boletos, devolvendo os resultados aos poucos
+
+        As origens são consumidas sob demanda: no máximo ``max_pendentes``
+        ficam em andamento, e novas só são iniciadas à medida que o
+        consumidor avança no iterador. Um erro em um item é devolvido no
+        lugar do resultado e não interrompe os demais.
+
+        Args:
+            origens: Caminhos, conteúdos em bytes ou objetos file-like
+            workers: Threads de parsing (1 = sequencial, na thread atual)
+            ordered: Devolve na ordem das origens em vez da ordem de término
+            fields: Campos do BoletoData a extrair (None = todos)
+            max_pendentes: Limite de itens em andamento (padrão: 2 × workers)
+
+        Yields:
+            Tuplas (origem, BoletoData ou exceção)
+
+        Raises:
+            ValueError: Se algum campo pedido não existir
+        """
+        campos = validar_campos(fields)
+        if workers <= 1:
+            return self._parse_sequencial(origens, campos)
+        return self._parse_paralelo(
+            origens, workers, ordered, campos, max_pendentes or workers * 2
+        )
+
+    def _parse_item(
+        self, origem: OrigemArquivo, campos: Optional[Tuple[str, ...]]
+    ) -> Union[ResultadoBoleto, Exception]:
+        """Executa parse() devolvendo a exceção em vez de propagá-la"""
+        try:
+            return self.parse(origem, campos)
+        except Exception as e:
+            self.logger.warning(
+                "Falha ao processar boleto", arquivo=_descrever(origem), erro=str(e)
+            )
+            return e
+
+    def _parse_sequencial(
+        self, origens: Iterable[OrigemArquivo], campos: Optional[Tuple[str, ...]]
+    ) -> Iterator[ResultadoItem]:
+        for origem in origens:
+            yield origem, self._parse_item(origem, campos)
+
+    def _parse_paralelo(
+        self,
+        origens: Iterable[OrigemArquivo],
+        workers: int,
+        ordered: bool,
+        campos: Optional[Tuple[str, ...]],
+        max_pendentes: int,
+    ) -> Iterator[ResultadoItem]:
+        # A instância é compartilhada pelas threads (ver ContextoParsing)
+        fila: Deque[Tuple[OrigemArquivo, Future]] = deque()
+        pendentes: Set[Future] = set()
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+        def concluidos() -> Iterator[ResultadoItem]:
+            """Espera ao menos um item e devolve os que já podem sair"""
+            nonlocal pendentes
+            if ordered:
+                origem, futuro = fila.popleft()
+                pendentes.discard(futuro)
+                yield origem, futuro.result()
+                return
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for origem, futuro in [item for item in fila if item[1] in prontos]:
+                fila.remove((origem, futuro))
+                yield origem, futuro.result()
+
+        try:
+            for origem in origens:
+                futuro = executor.submit(self._parse_item, origem, campos)
+                fila.append((origem, futuro))
+                pendentes.add(futuro)
+                if len(fila) >= max_pendentes:
+                    yield from concluidos()
+            while fila:
+                yield from concluidos()
+        finally:
+            # Consumidor parou antes do fim: descarta o que não começou
+            for _, futuro in fila:
+                futuro.cancel()
+            executor.shutdown(wait=True)
+
+    def _ler_conteudo(self, origem: OrigemArquivo) -> bytes:
+        """Lê os bytes do arquivo (necessários para a chave do cache)"""
+        conteudo = _normalizar_origem(origem)
+        if isinstance(conteudo, bytes):
+            return conteudo
+        if not Path(conteudo).exists():
+            self.logger.error("Arquivo não encontrado", arquivo=conteudo)
+            raise FileNotFoundError(f"Arquivo não encontrado: {conteudo}")
+        return Path(conteudo).read_bytes()
+
+    def parse_texto(
+        self, texto: str, fields: Optional[Iterable[str]] = None
+    ) -> ResultadoBoleto:
+        """
+        Faz o parsing a partir do texto já extraído do PDF
+
+        Args:
+            texto: Texto extraído do boleto
+            fields: Campos do BoletoData a extrair (None = todos)
+
+        Returns:
+            Objeto BoletoData com os dados extraídos (BoletoDataParcial com
+            ``fields``)
+        """
+        campos = validar_campos(fields)
+        return self._finalizar(self._processar(ContextoParsing(texto)), campos)
+
+    def parse_lazy(self, origem: OrigemArquivo) -> BoletoLazy:
+        """
+        Extrai o texto do PDF e adia a extração dos campos
+
+        Cada seção é extraída no primeiro acesso ao atributo correspondente.
+
+        Args:
+            origem: Caminho para o arquivo PDF, conteúdo em bytes ou objeto
+                file-like binário
+
+        Returns:
+            BoletoLazy com os dados do boleto
 
         Raises:
             FileNotFoundError: Se o arquivo não for encontrado
             ValueError: Se o arquivo não for um PDF válido
         """
-        self.logger.info("Iniciando parsing do boleto", arquivo=caminho_arquivo)
+        descricao = _descrever(origem)
+        self.logger.info("Iniciando parsing do boleto", arquivo=descricao)
 
-        self._validar_arquivo(caminho_arquivo)
-        self._extrair_texto_pdf(caminho_arquivo)
+        conteudo = self._validar_arquivo(origem)
+        contexto = ContextoParsing(
+            texto_extraido=self.extrair_texto_pdf(conteudo), origem=descricao
+        )
+        return self._processar(contexto)
 
-        tipo_boleto = self._identificar_tipo_boleto()
-        self.logger.info("Tipo de boleto identificado", tipo=tipo_boleto)
+    def _processar(self, contexto: ContextoParsing) -> BoletoLazy:
+        """Identifica o tipo e indexa o documento do contexto"""
+        contexto.indice = IndiceDocumento(contexto.texto_extraido)
+        contexto.tipo_boleto = self._identificar_tipo_boleto(contexto.texto_extraido)
+        self.logger.info("Tipo de boleto identificado", tipo=contexto.tipo_boleto)
+        return BoletoLazy(
+            contexto.texto_extraido, contexto.tipo_boleto, indice=contexto.indice
+        )
 
-        dados = self._extrair_dados_completos(tipo_boleto)
+    def _finalizar(
+        self, resultado: BoletoLazy, campos: Optional[Tuple[str, ...]]
+    ) -> ResultadoBoleto:
+        """Extrai os campos pedidos e converte para BoletoData"""
+        self.logger.info("Extraindo dados do boleto", campos=campos or "todos")
+        dados = resultado.to_boleto_data(campos)
 
         self.logger.info(
             "Parsing concluído com sucesso",
-            beneficiario=dados.beneficiario.nome,
-            valor=dados.valores.valor_documento,
-            tipo=dados.tipo_boleto,
+            campos=resultado.extraidos,
+            tipo=resultado.tipo_boleto,
         )
-
         return dados
 
-    def _validar_arquivo(self, caminho_arquivo: str) -> None:
-        """Valida se o arquivo existe e é um PDF válido"""
-        if not Path(caminho_arquivo).exists():
-            self.logger.error("Arquivo não encontrado", arquivo=caminho_arquivo)
-            raise FileNotFoundError(f"Arquivo não encontrado: {caminho_arquivo}")
+    def _validar_arquivo(self, origem: OrigemArquivo) -> OrigemPDF:
+        """
+        Valida se o arquivo existe e é um PDF válido
+
+        Returns:
+            Caminho do arquivo ou conteúdo em bytes, pronto para extração
+        """
+        conteudo = _normalizar_origem(origem)
+        if not isinstance(conteudo, bytes) and not Path(conteudo).exists():
+            self.logger.error("Arquivo não encontrado", arquivo=conteudo)
+            raise FileNotFoundError(f"Arquivo não encontrado: {conteudo}")
 
-        tipo_arquivo = self._detectar_tipo_arquivo(caminho_arquivo)
-        if "PDF" not in tipo_arquivo:
-            self.logger.error("Arquivo não é PDF válido", tipo=tipo_arquivo)
+        tipo_arquivo = self.detectar_tipo_arquivo(conteudo)
+        if not tipo_arquivo.is_pdf:
+            self.logger.error("Arquivo não é PDF válido", tipo=str(tipo_arquivo))
             raise ValueError(f"Arquivo não é um PDF válido: {tipo_arquivo}")
+        return conteudo
+
+    def detectar_tipo_arquivo(self, origem: OrigemArquivo) -> TipoArquivo:
+        """
+        Detecta o tipo do arquivo pelo conteúdo (cabeçalho %PDF- e %%EOF)
+
+        Args:
+            origem: Caminho para o arquivo ou conteúdo em bytes
 
-    def _detectar_tipo_arquivo(self, caminho_arquivo: str) -> str:
-        """Detecta o tipo do arquivo usando o comando 'file'"""
-        self.logger.info("Detectando tipo do arquivo", arquivo=caminho_arquivo)
+        Returns:
+            TipoArquivo com o resultado da detecção
+
+        Raises:
+            ValueError: Se não for possível ler o arquivo
+        """
+        conteudo = _normalizar_origem(origem)
+        self.logger.info("Detectando tipo do arquivo", arquivo=_descrever(conteudo))
         try:
-            resultado = subprocess.run(
-                ["file", caminho_arquivo], capture_output=True, text=True, check=True
-            )
-            tipo_arquivo = resultado.stdout.strip()
-            self.logger.info("Tipo do arquivo detectado", tipo=tipo_arquivo)
-            return tipo_arquivo
-        except subprocess.CalledProcessError as e:
+            if isinstance(conteudo, bytes):
+                tipo_arquivo = detectar_tipo(conteudo)
+            else:
+                tipo_arquivo = detectar_tipo_arquivo(conteudo)
+        except OSError as e:
             self.logger.error("Erro ao detectar tipo do arquivo", erro=str(e))
             raise ValueError(f"Erro ao detectar tipo do arquivo: {e}")
+        self.logger.info("Tipo do arquivo detectado", tipo=str(tipo_arquivo))
+        return tipo_arquivo
+
+    def extrair_texto_pdf(self, origem: OrigemArquivo) -> str:
+        """
+        Extrai o texto bruto do PDF (apenas as páginas selecionadas)
+
+        Args:
+            origem: Caminho para o arquivo PDF, conteúdo em bytes ou objeto
+                file-like binário
 
-    def _extrair_texto_pdf(self, caminho_arquivo: str) -> None:
-        """Extrai texto do PDF usando pdftotext"""
-        self.logger.info("Extraindo texto do PDF", arquivo=caminho_arquivo)
+        Returns:
+            Texto extraído
+
+        Raises:
+            ValueError: Se não for possível extrair o texto
+        """
+        conteudo = _normalizar_origem(origem)
+        self.logger.info(
+            "Extraindo texto do PDF",
+            arquivo=_descrever(conteudo),
+            motor=self.extrator.motor.nome,
+            paginas=str(self.paginas),
+        )
         try:
-            resultado = subprocess.run(
-                ["pdftotext", caminho_arquivo, "-"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            self.texto_extraido = resultado.stdout
-            self.logger.info(
-                "Texto extraído com sucesso", tamanho=len(self.texto_extraido)
-            )
-        except subprocess.CalledProcessError as e:
+            texto = self.extrator.extrair(conteudo, self.paginas)
+        except ValueError as e:
             self.logger.error("Erro ao extrair texto do PDF", erro=str(e))
-            raise ValueError(f"Erro ao extrair texto do PDF: {e}")
-        except FileNotFoundError:
-            self.logger.error("Comando pdftotext não encontrado")
-            raise ValueError(
-                "Comando 'pdftotext' não encontrado. Instale o poppler-utils."
-            )
+            raise
+        self.logger.info("Texto extraído com sucesso", tamanho=len(texto))
+        return texto
 
-    def _identificar_tipo_boleto(self) -> str:
+    def _identificar_tipo_boleto(self, texto: str) -> str:
         """Identifica o tipo do boleto baseado no conteúdo"""
-        if (
-            "Nome do Aluno:" in self.texto_extraido
-            and "Curso/Turno" in self.texto_extraido
-        ):
+        if "Nome do Aluno:" in texto and "Curso/Turno" in texto:
             return "educacional"
-        elif "Beneficiário" in self.texto_extraido:
+        elif "Beneficiário" in texto:
             return "bancario"
         else:
             return "desconhecido"
-
-    def _extrair_dados_completos(self, tipo_boleto: str) -> BoletoData:
-        """Extrai todos os dados do boleto usando extratores especializados"""
-        self.logger.info("Extraindo dados do boleto")
-
-        # Criar extratores
-        beneficiario_extractor = BeneficiarioExtractor(self.texto_extraido)
-        pagador_extractor = PagadorExtractor(self.texto_extraido)
-        valores_extractor = ValoresExtractor(self.texto_extraido)
-        info_bancarias_extractor = InformacoesBancariasExtractor(self.texto_extraido)
-        instrucoes_extractor = InstrucoesExtractor(self.texto_extraido)
-        endereco_extractor = EnderecoInstituicaoExtractor(self.texto_extraido)
-        dados_extras_extractor = DadosExtrasExtractor(self.texto_extraido)
-
-        # Extrair dados básicos
-        dados_basicos = self._extrair_dados_basicos()
-
-        # Extrair dados específicos por tipo
-        aluno = None
-        if tipo_boleto == "educacional":
-            aluno_extractor = AlunoExtractor(self.texto_extraido)
-            aluno = aluno_extractor.extrair()
-
-        return BoletoData(
-            cnpj_instituicao=dados_basicos["cnpj_instituicao"],
-            numero_boleto=dados_basicos["numero_boleto"],
-            vencimento=dados_basicos["vencimento"],
-            data_documento=dados_basicos["data_documento"],
-            beneficiario=beneficiario_extractor.extrair(),
-            pagador=pagador_extractor.extrair(),
-            aluno=aluno,
-            valores=valores_extractor.extrair(),
-            informacoes_bancarias=info_bancarias_extractor.extrair(),
-            instrucoes=instrucoes_extractor.extrair(),
-            endereco_instituicao=endereco_extractor.extrair(),
-            tipo_boleto=tipo_boleto,
-            texto_extraido=self.texto_extraido,
-            dados_extras=dados_extras_extractor.extrair(),
-        )
-
-    def _extrair_dados_basicos(self) -> Dict[str, str]:
-        """Extrai dados básicos do boleto"""
-        return {
-            "cnpj_instituicao": self._extrair_cnpj_instituicao(),
-            "numero_boleto": self._extrair_numero_boleto(),
-            "vencimento": self._extrair_vencimento(),
-            "data_documento": self._extrair_data_documento(),
-        }
-
-    def _extrair_cnpj_instituicao(self) -> str:
-        """Extrai CNPJ da instituição"""
-        padrao = r"CNPJ da Instituição:\s*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})"
-        match = re.search(padrao, self.texto_extraido)
-        return match.group(1) if match else ""
-
-    def _extrair_numero_boleto(self) -> str:
-        """Extrai número do boleto"""
-        padrao = r"Boleto:\s*(\d+)"
-        match = re.search(padrao, self.texto_extraido)
-        return match.group(1) if match else ""
-
-    def _extrair_vencimento(self) -> str:
-        """Extrai data de vencimento"""
-        padrao = r"Vencimento:\s*(\d{2}/\d{2}/\d{4})"
-        match = re.search(padrao, self.texto_extraido)
-        return match.group(1) if match else ""
-
-    def _extrair_data_documento(self) -> str:
-        """Extrai data do documento"""
-        padrao = r"Data do documento\s*(\d{2}/\d{2}/\d{4})"
-        match = re.search(padrao, self.texto_extraido)
-        return match.group(1) if match else ""
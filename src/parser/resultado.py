@@ -0,0 +1,220 @@
+"""
+Resultado de parsing com extração sob demanda.
+
+O BoletoLazy recebe o texto já extraído (e o índice de rótulos) e só
+executa o extrator de cada seção na primeira vez em que ela é acessada,
+guardando o resultado. Quem precisa apenas de alguns campos (por exemplo
+vencimento e valores) não paga pela extração do boleto inteiro.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+from ..models import BoletoData
+from .extractors import (
+    AlunoExtractor,
+    BeneficiarioExtractor,
+    DadosExtrasExtractor,
+    EnderecoInstituicaoExtractor,
+    InformacoesBancariasExtractor,
+    InstrucoesExtractor,
+    PagadorExtractor,
+    ValoresExtractor,
+)
+from .indice import IndiceDocumento
+
+# Campos na ordem do BoletoData
+CAMPOS: Tuple[str, ...] = tuple(BoletoData.model_fields)
+
+_EXTRATORES = {
+    "beneficiario": BeneficiarioExtractor,
+    "pagador": PagadorExtractor,
+    "valores": ValoresExtractor,
+    "informacoes_bancarias": InformacoesBancariasExtractor,
+    "instrucoes": InstrucoesExtractor,
+    "endereco_instituicao": EnderecoInstituicaoExtractor,
+}
+
+# Campos básicos; os padrões ficam no registro como "basico.<campo>"
+_CAMPOS_BASICOS = (
+    "cnpj_instituicao",
+    "numero_boleto",
+    "vencimento",
+    "data_documento",
+)
+
+
+class BoletoDataParcial(BaseModel):
+    """
+    Base dos resultados com apenas parte dos campos do BoletoData
+
+    Cada seleção de campos tem o seu modelo (ver modelo_parcial): as seções
+    não pedidas não existem no resultado, em vez de aparecerem com valores
+    padrão. O tipo do boleto é sempre incluído.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    tipo_boleto: str
+
+
+ResultadoBoleto = Union[BoletoData, BoletoDataParcial]
+
+
+@lru_cache(maxsize=None)
+def modelo_parcial(campos: Tuple[str, ...]) -> Type[BoletoDataParcial]:
+    """
+    Modelo com os campos pedidos do BoletoData (e o tipo do boleto)
+
+    Args:
+        campos: Campos já validados (ver validar_campos)
+
+    Returns:
+        Subclasse de BoletoDataParcial, reutilizada para a mesma seleção
+    """
+    definicoes = {
+        campo: (info.annotation, info)
+        for campo, info in BoletoData.model_fields.items()
+        if campo in campos and campo != "tipo_boleto"
+    }
+    return create_model("BoletoDataParcial", __base__=BoletoDataParcial, **definicoes)
+
+
+def selecionar_campos(
+    dados: Any, tipo_boleto: str, campos: Tuple[str, ...]
+) -> BoletoDataParcial:
+    """
+    Monta o resultado parcial a partir de um BoletoData ou BoletoLazy
+
+    Args:
+        dados: Objeto com os campos como atributos
+        tipo_boleto: Tipo identificado do boleto
+        campos: Campos já validados (ver validar_campos)
+
+    Returns:
+        Instância do modelo parcial, sem validação dos valores
+    """
+    valores = {campo: getattr(dados, campo) for campo in campos}
+    valores["tipo_boleto"] = tipo_boleto
+    return modelo_parcial(campos).model_construct(**valores)
+
+
+def validar_campos(campos: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Valida uma seleção de campos do BoletoData
+
+    Args:
+        campos: Nomes dos campos ou string separada por vírgulas
+            (None = todos)
+
+    Returns:
+        Tupla com os campos na ordem do BoletoData, ou None para todos
+
+    Raises:
+        ValueError: Se algum campo não existir
+    """
+    if campos is None:
+        return None
+    if isinstance(campos, str):
+        campos = campos.split(",")
+    selecionados = {campo.strip() for campo in campos if campo.strip()}
+    desconhecidos = selecionados.difference(CAMPOS)
+    if desconhecidos:
+        raise ValueError(f"Campos desconhecidos: {', '.join(sorted(desconhecidos))}")
+    return tuple(campo for campo in CAMPOS if campo in selecionados)
+
+
+class BoletoLazy:
+    """
+    Dados do boleto extraídos sob demanda.
+
+    Cada campo do BoletoData está disponível como atributo; a seção é
+    extraída no primeiro acesso e memorizada.
+    """
+
+    def __init__(
+        self,
+        texto_extraido: str,
+        tipo_boleto: str = "desconhecido",
+        indice: Optional[IndiceDocumento] = None,
+    ):
+        """
+        Inicializa o resultado
+
+        Args:
+            texto_extraido: Texto extraído do PDF
+            tipo_boleto: Tipo identificado ("bancario", "educacional"...)
+            indice: Índice de rótulos do texto (criado se não informado)
+        """
+        self.texto_extraido = texto_extraido
+        self.tipo_boleto = tipo_boleto
+        self.indice = indice or IndiceDocumento(texto_extraido)
+        self._secoes: Dict[str, Any] = {}
+
+    def __getattr__(self, campo: str) -> Any:
+        # Chamado apenas para atributos ainda não definidos: as seções
+        if campo.startswith("_") or campo not in CAMPOS:
+            raise AttributeError(campo)
+        secoes = self.__dict__["_secoes"]
+        if campo not in secoes:
+            secoes[campo] = self._extrair(campo)
+        return secoes[campo]
+
+    def _extrair(self, campo: str) -> Any:
+        """Executa a extração de um campo"""
+        if campo in _CAMPOS_BASICOS:
+            match = self.indice.buscar(f"basico.{campo}")
+            return match.group(1) if match else ""
+        if campo in _EXTRATORES:
+            return _EXTRATORES[campo](self.texto_extraido, self.indice).extrair()
+        if campo == "aluno":
+            if self.tipo_boleto != "educacional":
+                return None
+            return AlunoExtractor(self.texto_extraido, self.indice).extrair()
+        if campo == "dados_extras":
+            return DadosExtrasExtractor(self.texto_extraido, self.indice).extrair()
+        raise AttributeError(campo)
+
+    @property
+    def extraidos(self) -> Tuple[str, ...]:
+        """Seções já extraídas"""
+        return tuple(self._secoes)
+
+    def to_boleto_data(self, campos: Optional[Iterable[str]] = None) -> ResultadoBoleto:
+        """
+        Converte para BoletoData
+
+        Args:
+            campos: Campos a extrair (None = todos). Com uma seleção, o
+                resultado é um BoletoDataParcial construído sem validação,
+                só com os campos pedidos e o tipo do boleto
+
+        Returns:
+            Objeto BoletoData (ou BoletoDataParcial, com seleção)
+        """
+        selecionados = validar_campos(campos)
+        if selecionados is None:
+            return BoletoData(**{campo: getattr(self, campo) for campo in CAMPOS})
+        return selecionar_campos(self, self.tipo_boleto, selecionados)
+
+    def model_dump(self, campos: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Serializa para dicionário apenas os campos pedidos
+
+        Args:
+            campos: Campos a extrair (None = todos)
+
+        Returns:
+            Dicionário no mesmo formato de ``BoletoData.model_dump()``
+        """
+        selecionados = validar_campos(campos)
+        if selecionados is None:
+            return self.to_boleto_data().model_dump()
+        return {campo: _serializar(getattr(self, campo)) for campo in selecionados}
+
+
+def _serializar(valor: Any) -> Any:
+    """Serializa modelos pydantic e mantém os demais valores"""
+    return valor.model_dump() if isinstance(valor, BaseModel) else valor
@@ -0,0 +1,478 @@
+"""
+Escrita incremental dos resultados de parsing.
+
+Os registros são gravados à medida que ficam prontos, sem acumular o lote
+em memória. Formatos suportados: JSONL (um objeto por linha), CSV (campos
+aninhados achatados em colunas "secao.campo") e Parquet (requer o pacote
+opcional pyarrow).
+
+Opções comuns a todos os escritores:
+
+- projeção: campos incluídos/excluídos de ``dados`` (por exemplo, sem o
+  ``texto_extraido``), aceitando caminhos "secao.campo"
+- buffer: número máximo de registros mantidos em memória antes da escrita
+- fsync: quando forçar a gravação em disco ("nunca", "buffer" ou "fechar")
+"""
+
+import csv
+import json
+import os
+import typing
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from ..models import BoletoData
+
+FORMATOS = ("jsonl", "csv", "parquet")
+POLITICAS_FSYNC = ("nunca", "buffer", "fechar")
+
+# Colunas de controle presentes em todo registro
+COLUNAS_REGISTRO = ["arquivo", "sucesso", "erro"]
+
+CamposProjecao = Optional[Union[str, Sequence[str]]]
+
+
+def _submodelo(anotacao: Any) -> Optional[type]:
+    """Retorna o modelo pydantic de uma anotação (inclusive Optional[...])"""
+    for tipo in (anotacao, *typing.get_args(anotacao)):
+        if isinstance(tipo, type) and issubclass(tipo, BaseModel):
+            return tipo
+    return None
+
+
+def _tipo_basico(anotacao: Any) -> Any:
+    """Tipo escalar de uma anotação (inclusive Optional[...])"""
+    for tipo in (anotacao, *typing.get_args(anotacao)):
+        if tipo in (str, float, int, bool):
+            return tipo
+    return str
+
+
+def _colunas_tipadas(modelo: Type[BaseModel] = BoletoData) -> Dict[str, Any]:
+    """Colunas do modelo achatado com o tipo escalar de cada uma"""
+    colunas: Dict[str, Any] = {}
+    for nome, campo in modelo.model_fields.items():
+        submodelo = _submodelo(campo.annotation)
+        if submodelo is None:
+            colunas[nome] = _tipo_basico(campo.annotation)
+        else:
+            for sub, info in submodelo.model_fields.items():
+                colunas[f"{nome}.{sub}"] = _tipo_basico(info.annotation)
+    return colunas
+
+
+def _normalizar_campos(campos: CamposProjecao) -> Optional[List[str]]:
+    """Aceita lista ou string separada por vírgulas"""
+    if campos is None:
+        return None
+    if isinstance(campos, str):
+        campos = campos.split(",")
+    return [campo.strip() for campo in campos if campo.strip()]
+
+
+class Projecao:
+    """
+    Seleção de campos de ``dados`` a gravar.
+
+    Campos são nomes do modelo ("valores") ou caminhos para subcampos
+    ("valores.valor_documento"). O modelo padrão é o BoletoData; o modo
+    pagamento usa o DadosPagamento.
+    """
+
+    def __init__(
+        self,
+        incluir: CamposProjecao = None,
+        excluir: CamposProjecao = None,
+        modelo: Type[BaseModel] = BoletoData,
+    ):
+        """
+        Inicializa a projeção
+
+        Args:
+            incluir: Campos a manter (None = todos)
+            excluir: Campos a remover
+            modelo: Modelo dos dados projetados
+
+        Raises:
+            ValueError: Se algum campo não existir no modelo
+        """
+        self.incluir = _normalizar_campos(incluir)
+        self.excluir = _normalizar_campos(excluir) or []
+        self.modelo = modelo
+        validos = set(modelo.model_fields) | set(_colunas_tipadas(modelo))
+        desconhecidos = set(self.incluir or []) | set(self.excluir)
+        desconhecidos -= validos
+        if desconhecidos:
+            raise ValueError(
+                f"Campos desconhecidos: {', '.join(sorted(desconhecidos))}"
+            )
+
+    @staticmethod
+    def _arvore(campos: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Converte caminhos "a.b" para o formato include/exclude do pydantic"""
+        if campos is None:
+            return None
+        arvore: Dict[str, Any] = {}
+        for campo in campos:
+            secao, _, sub = campo.partition(".")
+            if not sub:
+                arvore[secao] = True
+            elif arvore.get(secao) is not True:
+                arvore.setdefault(secao, {})[sub] = True
+        return arvore
+
+    @property
+    def vazia(self) -> bool:
+        """Se a projeção mantém todos os campos"""
+        return self.incluir is None and not self.excluir
+
+    def aplicar_modelo(self, dados: BaseModel) -> Dict[str, Any]:
+        """Serializa o modelo já projetado (sem gerar os campos removidos)"""
+        return dados.model_dump(
+            include=self._arvore(self.incluir), exclude=self._arvore(self.excluir)
+        )
+
+    def aplicar(self, dados: Dict[str, Any]) -> Dict[str, Any]:
+        """Aplica a projeção a um dicionário já serializado"""
+        if self.vazia:
+            return dados
+        incluir = self._arvore(self.incluir)
+        excluir = self._arvore(self.excluir) or {}
+        resultado = {}
+        for secao, valor in dados.items():
+            if incluir is not None and secao not in incluir:
+                continue
+            if excluir.get(secao) is True:
+                continue
+            filtro = incluir.get(secao) if incluir is not None else True
+            if isinstance(valor, dict) and secao != "dados_extras":
+                valor = {
+                    sub: v
+                    for sub, v in valor.items()
+                    if (filtro is True or sub in filtro)
+                    and sub not in excluir.get(secao, {})
+                }
+            resultado[secao] = valor
+        return resultado
+
+    def colunas(self) -> List[str]:
+        """Colunas achatadas do modelo que passam pela projeção"""
+        selecionadas = []
+        for coluna in _colunas_tipadas(self.modelo):
+            secao = coluna.partition(".")[0]
+            if self.incluir is not None and not (
+                coluna in self.incluir or secao in self.incluir
+            ):
+                continue
+            if coluna in self.excluir or secao in self.excluir:
+                continue
+            selecionadas.append(coluna)
+        return selecionadas
+
+
+def colunas_boleto() -> List[str]:
+    """Colunas do BoletoData achatado, na ordem do modelo"""
+    return list(_colunas_tipadas())
+
+
+def achatar(dados: Dict[str, Any], prefixo: str = "") -> Dict[str, Any]:
+    """
+    Achata dicionários aninhados em chaves "secao.campo"
+
+    ``dados_extras`` e outros dicionários sem esquema fixo viram JSON.
+    """
+    plano: Dict[str, Any] = {}
+    for chave, valor in dados.items():
+        nome = f"{prefixo}{chave}"
+        if nome == "dados_extras":
+            plano[nome] = json.dumps(valor, ensure_ascii=False)
+        elif isinstance(valor, dict):
+            plano.update(achatar(valor, f"{nome}."))
+        else:
+            plano[nome] = valor
+    return plano
+
+
+def detectar_formato(caminho: Union[str, Path]) -> str:
+    """
+    Deduz o formato pela extensão do arquivo
+
+    Raises:
+        ValueError: Se a extensão não corresponder a um formato suportado
+    """
+    extensao = Path(caminho).suffix.lower().lstrip(".")
+    formato = "jsonl" if extensao in ("json", "ndjson") else extensao
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de saída não suportado: {extensao or caminho}")
+    return formato
+
+
+def criar_registro(
+    arquivo: str,
+    dados: Optional[Union[BaseModel, Dict[str, Any]]] = None,
+    erro: Optional[str] = None,
+    projecao: Optional[Projecao] = None,
+) -> Dict[str, Any]:
+    """
+    Monta o registro gravado para um arquivo
+
+    Args:
+        arquivo: Origem do resultado
+        dados: Resultado do parsing (None em caso de erro)
+        erro: Mensagem de erro
+        projecao: Projeção aplicada antes de serializar
+
+    Returns:
+        Registro {"arquivo", "sucesso", "erro", "dados"}
+    """
+    if isinstance(dados, BaseModel):
+        dados = projecao.aplicar_modelo(dados) if projecao else dados.model_dump()
+    return {"arquivo": arquivo, "sucesso": erro is None, "erro": erro, "dados": dados}
+
+
+class EscritorResultados(ABC):
+    """Classe base dos escritores incrementais"""
+
+    formato = "base"
+    buffer_padrao = 1
+    permite_anexar = True  # Se um lote interrompido pode ser retomado
+
+    def __init__(
+        self,
+        caminho: Union[str, Path],
+        anexar: bool = False,
+        projecao: Optional[Projecao] = None,
+        max_buffer: Optional[int] = None,
+        fsync: str = "nunca",
+        ao_gravar: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ):
+        """
+        Abre o arquivo de saída
+
+        Args:
+            caminho: Arquivo de saída
+            anexar: Acrescenta ao final em vez de sobrescrever (retomada)
+            projecao: Campos de ``dados`` a gravar (padrão: todos)
+            max_buffer: Registros mantidos em memória antes de gravar
+            fsync: "nunca", "buffer" (a cada gravação) ou "fechar"
+            ao_gravar: Função chamada com os registros de cada gravação,
+                depois que chegaram ao arquivo (por exemplo, checkpoint)
+
+        Raises:
+            ValueError: Se a política de fsync for inválida
+        """
+        if fsync not in POLITICAS_FSYNC:
+            raise ValueError(f"Política de fsync inválida: {fsync}")
+        self.caminho = Path(caminho)
+        self.projecao = projecao or Projecao()
+        self.max_buffer = max(max_buffer or self.buffer_padrao, 1)
+        self.fsync = fsync
+        self.ao_gravar = ao_gravar
+        self.escritos = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._novo = not (
+            anexar and self.caminho.exists() and self.caminho.stat().st_size
+        )
+        self._abrir(anexar)
+
+    def _abrir(self, anexar: bool) -> None:
+        self._arquivo: TextIO = open(
+            self.caminho, "a" if anexar else "w", encoding="utf-8", newline=""
+        )
+
+    def escrever(self, registro: Dict[str, Any]) -> None:
+        """Adiciona um registro; grava quando o buffer enche"""
+        if registro.get("dados") is not None:
+            registro = {**registro, "dados": self.projecao.aplicar(registro["dados"])}
+        self._buffer.append(registro)
+        if len(self._buffer) >= self.max_buffer:
+            self.descarregar()
+
+    def escrever_varios(self, registros: Iterable[Dict[str, Any]]) -> int:
+        """Grava todos os registros de um iterável, um a um"""
+        inicial = self.escritos + len(self._buffer)
+        for registro in registros:
+            self.escrever(registro)
+        return self.escritos + len(self._buffer) - inicial
+
+    def descarregar(self) -> None:
+        """Grava os registros do buffer no arquivo"""
+        if not self._buffer:
+            return
+        registros, self._buffer = self._buffer, []
+        self._gravar(registros)
+        self._enviar_ao_disco(self.fsync == "buffer")
+        self.escritos += len(registros)
+        if self.ao_gravar is not None:
+            self.ao_gravar(registros)
+
+    @abstractmethod
+    def _gravar(self, registros: List[Dict[str, Any]]) -> None:
+        """Grava um bloco de registros no arquivo aberto"""
+
+    def _enviar_ao_disco(self, sincronizar: bool) -> None:
+        """Esvazia o buffer do Python e, se pedido, faz fsync"""
+        self._arquivo.flush()
+        if sincronizar:
+            os.fsync(self._arquivo.fileno())
+
+    def fechar(self) -> None:
+        """Grava o que restar no buffer e fecha o arquivo"""
+        self.descarregar()
+        self._enviar_ao_disco(self.fsync != "nunca")
+        self._arquivo.close()
+
+    def __enter__(self) -> "EscritorResultados":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.fechar()
+
+
+class EscritorJSONL(EscritorResultados):
+    """Um objeto JSON por linha"""
+
+    formato = "jsonl"
+
+    def _gravar(self, registros: List[Dict[str, Any]]) -> None:
+        self._arquivo.write(
+            "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in registros)
+        )
+
+
+class EscritorCSV(EscritorResultados):
+    """CSV com os campos do boleto achatados em colunas"""
+
+    formato = "csv"
+
+    def __init__(self, caminho: Union[str, Path], **opcoes: Any):
+        super().__init__(caminho, **opcoes)
+        self.colunas = COLUNAS_REGISTRO + self.projecao.colunas()
+        self._csv = csv.DictWriter(
+            self._arquivo, fieldnames=self.colunas, extrasaction="ignore"
+        )
+        if self._novo:
+            self._csv.writeheader()
+
+    def _gravar(self, registros: List[Dict[str, Any]]) -> None:
+        for registro in registros:
+            linha = {chave: registro.get(chave) for chave in COLUNAS_REGISTRO}
+            linha.update(achatar(registro.get("dados") or {}))
+            self._csv.writerow(linha)
+
+
+class EscritorParquet(EscritorResultados):
+    """Parquet com as colunas do CSV; cada gravação vira um row group"""
+
+    formato = "parquet"
+    buffer_padrao = 1000
+    permite_anexar = False  # O rodapé é gravado no fechamento
+
+    def _abrir(self, anexar: bool) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("O formato parquet requer o pacote 'pyarrow'")
+        if anexar and not self._novo and not self.permite_anexar:
+            raise ValueError("O formato parquet não permite anexar a um arquivo")
+
+        tipos = {str: pa.string(), float: pa.float64(), int: pa.int64()}
+        tipos[bool] = pa.bool_()
+        colunas_tipadas = _colunas_tipadas(self.projecao.modelo)
+        self.colunas = COLUNAS_REGISTRO + self.projecao.colunas()
+        self._schema = pa.schema(
+            [("arquivo", pa.string()), ("sucesso", pa.bool_()), ("erro", pa.string())]
+            + [(c, tipos[colunas_tipadas[c]]) for c in self.colunas[3:]]
+        )
+        self._pa = pa
+        self._escritor = pq.ParquetWriter(str(self.caminho), self._schema)
+
+    def _gravar(self, registros: List[Dict[str, Any]]) -> None:
+        linhas = []
+        for registro in registros:
+            linha = {chave: registro.get(chave) for chave in COLUNAS_REGISTRO}
+            linha.update(achatar(registro.get("dados") or {}))
+            linhas.append({coluna: linha.get(coluna) for coluna in self.colunas})
+        tabela = self._pa.Table.from_pylist(linhas, schema=self._schema)
+        self._escritor.write_table(tabela)
+
+    def _enviar_ao_disco(self, sincronizar: bool) -> None:
+        # O ParquetWriter só grava o rodapé no fechamento; fsync no fechar
+        pass
+
+    def fechar(self) -> None:
+        self.descarregar()
+        self._escritor.close()
+        if self.fsync != "nunca":
+            with open(self.caminho, "rb") as arquivo:
+                os.fsync(arquivo.fileno())
+
+
+ESCRITORES = {
+    EscritorJSONL.formato: EscritorJSONL,
+    EscritorCSV.formato: EscritorCSV,
+    EscritorParquet.formato: EscritorParquet,
+}
+
+
+def criar_escritor(
+    caminho: Union[str, Path], formato: Optional[str] = None, **opcoes: Any
+) -> EscritorResultados:
+    """
+    Cria o escritor adequado ao formato
+
+    Args:
+        caminho: Arquivo de saída
+        formato: "jsonl", "csv" ou "parquet" (padrão: deduzido da extensão)
+        **opcoes: Opções do EscritorResultados (anexar, projecao,
+            max_buffer, fsync, ao_gravar)
+
+    Returns:
+        Escritor pronto para uso (também é um context manager)
+
+    Raises:
+        ValueError: Se o formato não for suportado
+    """
+    formato = formato or detectar_formato(caminho)
+    if formato not in ESCRITORES:
+        raise ValueError(f"Formato de saída não suportado: {formato}")
+    return ESCRITORES[formato](caminho, **opcoes)
+
+
+def gravar_resultados(
+    registros: Iterable[Dict[str, Any]],
+    caminho: Union[str, Path],
+    formato: Optional[str] = None,
+    **opcoes: Any,
+) -> int:
+    """
+    Consome um iterável de registros gravando-os incrementalmente
+
+    Args:
+        registros: Registros (ver criar_registro()), por exemplo vindos de
+            processar_lote()
+        caminho: Arquivo de saída
+        formato: Formato da saída (padrão: deduzido da extensão)
+        **opcoes: Opções repassadas a criar_escritor()
+
+    Returns:
+        Número de registros gravados
+    """
+    with criar_escritor(caminho, formato, **opcoes) as escritor:
+        escritor.escrever_varios(registros)
+    return escritor.escritos
@@ -0,0 +1,99 @@
+"""
+Segmentação de PDFs com vários boletos (carnês e lotes).
+
+Cada ficha de compensação traz a sua linha digitável; as ocorrências de
+linhas digitáveis distintas servem de âncora para dividir o texto do
+documento em um segmento por boleto. A divisão respeita as páginas: se a
+âncora é a primeira da sua página, o segmento começa no início da página
+(recibo do pagador impresso acima da ficha); se há mais de um boleto na
+mesma página, o corte é feito na linha da âncora.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from .localizador import candidatos
+
+
+@dataclass
+class Segmento:
+    """Trecho do documento correspondente a um boleto"""
+
+    texto: str
+    linha_digitavel: Optional[str]  # Âncora normalizada (None sem âncora)
+    paginas: Tuple[int, int]  # Primeira e última página (a partir de 0)
+
+
+def encontrar_ancoras(texto: str) -> List[Tuple[int, str]]:
+    """
+    Localiza as linhas digitáveis distintas do texto
+
+    Repetições da mesma linha (recibo do pagador e ficha de compensação do
+    mesmo boleto) são ignoradas.
+
+    Args:
+        texto: Texto do documento
+
+    Returns:
+        Lista de (posição, linha normalizada), na ordem do texto
+    """
+    ancoras: List[Tuple[int, str]] = []
+    vistas = set()
+    for posicao, linha in candidatos(texto):
+        if linha in vistas:
+            continue
+        vistas.add(linha)
+        ancoras.append((posicao, linha))
+    return ancoras
+
+
+def segmentar(paginas: Sequence[str]) -> List[Segmento]:
+    """
+    Divide o documento em um segmento por boleto
+
+    Args:
+        paginas: Texto de cada página do PDF
+
+    Returns:
+        Segmentos na ordem do documento; sem nenhuma linha digitável, um
+        único segmento com o documento inteiro
+    """
+    texto = "\n".join(paginas)
+    inicios_pagina = []
+    posicao = 0
+    for pagina in paginas:
+        inicios_pagina.append(posicao)
+        posicao += len(pagina) + 1
+
+    def pagina_de(pos: int) -> int:
+        return max(bisect_right(inicios_pagina, pos) - 1, 0)
+
+    ancoras = encontrar_ancoras(texto)
+    if not ancoras:
+        return [Segmento(texto, None, (0, max(len(paginas) - 1, 0)))]
+
+    cortes = []
+    pagina_anterior = -1
+    for pos, _ in ancoras:
+        pagina = pagina_de(pos)
+        if not cortes:
+            corte = 0
+        elif pagina != pagina_anterior:
+            corte = inicios_pagina[pagina]
+        else:
+            # Mesma página: corta no início da linha da âncora (ou na própria
+            # âncora, se a anterior estiver na mesma linha)
+            corte = texto.rfind("\n", 0, pos) + 1
+            if corte <= cortes[-1]:
+                corte = pos
+        cortes.append(corte)
+        pagina_anterior = pagina
+    cortes.append(len(texto))
+
+    segmentos = []
+    for i, (_, linha) in enumerate(ancoras):
+        inicio, fim = cortes[i], cortes[i + 1]
+        paginas_segmento = (pagina_de(inicio), pagina_de(max(fim - 1, inicio)))
+        segmentos.append(Segmento(texto[inicio:fim], linha, paginas_segmento))
+    return segmentos
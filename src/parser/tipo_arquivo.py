@@ -0,0 +1,129 @@
+"""
+Detecção do tipo de arquivo em processo, a partir do conteúdo.
+
+Substitui a chamada ao comando 'file': verifica o cabeçalho ``%PDF-`` e o
+marcador final ``%%EOF`` diretamente nos bytes e, opcionalmente, consulta a
+libmagic (python-magic) sem criar subprocessos.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+# O cabeçalho pode vir após alguns bytes de lixo; o %%EOF fica no final
+TAMANHO_CABECALHO = 1024
+TAMANHO_TRAILER = 1024
+
+_PADRAO_CABECALHO_PDF = re.compile(rb"%PDF-(\d+\.\d+)")
+
+# Assinaturas comuns para descrever arquivos que não são PDF
+_ASSINATURAS = (
+    (b"\x89PNG\r\n\x1a\n", "image/png", "PNG image data"),
+    (b"\xff\xd8\xff", "image/jpeg", "JPEG image data"),
+    (b"GIF8", "image/gif", "GIF image data"),
+    (b"PK\x03\x04", "application/zip", "Zip archive data"),
+    (b"II*\x00", "image/tiff", "TIFF image data"),
+    (b"MM\x00*", "image/tiff", "TIFF image data"),
+)
+
+
+@dataclass(frozen=True)
+class TipoArquivo:
+    """Resultado estruturado da detecção de tipo de arquivo"""
+
+    mime: str
+    descricao: str
+    is_pdf: bool = False
+    versao_pdf: Optional[str] = None
+    possui_eof: bool = False  # Marcador %%EOF encontrado no final
+
+    def __str__(self) -> str:
+        return self.descricao
+
+    def to_dict(self) -> dict:
+        """Converte o resultado para dicionário (resposta da API)"""
+        return {
+            "mime": self.mime,
+            "descricao": self.descricao,
+            "is_pdf": self.is_pdf,
+            "versao_pdf": self.versao_pdf,
+            "possui_eof": self.possui_eof,
+        }
+
+
+def _descrever_com_libmagic(cabecalho: bytes) -> Optional[TipoArquivo]:
+    """Usa a libmagic em processo, se disponível"""
+    try:
+        import magic
+
+        return TipoArquivo(
+            mime=magic.from_buffer(cabecalho, mime=True),
+            descricao=magic.from_buffer(cabecalho),
+        )
+    except Exception:
+        # python-magic sem a libmagic nativa instalada
+        return None
+
+
+def detectar_tipo(
+    cabecalho: bytes, trailer: Optional[bytes] = None, usar_libmagic: bool = False
+) -> TipoArquivo:
+    """
+    Detecta o tipo de arquivo a partir do conteúdo em memória
+
+    Args:
+        cabecalho: Início do arquivo (ou o conteúdo completo)
+        trailer: Final do arquivo (padrão: final de ``cabecalho``)
+        usar_libmagic: Consulta a libmagic para descrever arquivos não PDF
+
+    Returns:
+        TipoArquivo com o resultado da detecção
+    """
+    if trailer is None:
+        trailer = cabecalho[-TAMANHO_TRAILER:]
+
+    match = _PADRAO_CABECALHO_PDF.search(cabecalho[:TAMANHO_CABECALHO])
+    if match:
+        versao = match.group(1).decode("ascii")
+        return TipoArquivo(
+            mime="application/pdf",
+            descricao=f"PDF document, version {versao}",
+            is_pdf=True,
+            versao_pdf=versao,
+            possui_eof=b"%%EOF" in trailer,
+        )
+
+    if usar_libmagic:
+        tipo = _descrever_com_libmagic(cabecalho[: TAMANHO_CABECALHO * 2])
+        if tipo is not None:
+            return tipo
+
+    for assinatura, mime, descricao in _ASSINATURAS:
+        if cabecalho.startswith(assinatura):
+            return TipoArquivo(mime=mime, descricao=descricao)
+    if not cabecalho:
+        return TipoArquivo(mime="application/x-empty", descricao="empty")
+    return TipoArquivo(mime="application/octet-stream", descricao="data")
+
+
+def detectar_tipo_arquivo(
+    caminho_arquivo: Union[str, Path], usar_libmagic: bool = False
+) -> TipoArquivo:
+    """
+    Detecta o tipo de um arquivo lendo apenas o início e o final
+
+    Args:
+        caminho_arquivo: Caminho do arquivo
+        usar_libmagic: Consulta a libmagic para descrever arquivos não PDF
+
+    Returns:
+        TipoArquivo com o resultado da detecção
+    """
+    with open(caminho_arquivo, "rb") as arquivo:
+        cabecalho = arquivo.read(TAMANHO_CABECALHO)
+        arquivo.seek(0, 2)
+        tamanho = arquivo.tell()
+        arquivo.seek(max(tamanho - TAMANHO_TRAILER, 0))
+        trailer = arquivo.read()
+    return detectar_tipo(cabecalho, trailer, usar_libmagic=usar_libmagic)
@@ -0,0 +1,101 @@
+"""
+Varredura de campos rotulados em uma única passada pelo texto.
+
+Em vez de executar uma busca por campo sobre o texto inteiro, o
+VarredorCampos localiza todas as ocorrências dos rótulos ("Protocolo",
+"Nosso Número", "Valor Cobrado"...) com uma única expressão alternada e
+só então tenta o padrão completo de cada campo naquela posição. O custo
+passa a crescer com o tamanho do texto, e não com campos × texto.
+"""
+
+import re
+from typing import Dict, Iterator, List, Tuple
+
+from ..utils.logger import get_logger
+from .padroes import rotulo_literal
+
+logger = get_logger("varredura")
+
+AchadoCampo = Tuple[str, "re.Match[str]"]
+
+
+class VarredorCampos:
+    """
+    Localiza vários campos rotulados com uma passada pelo texto.
+
+    Para cada campo é retornada a primeira ocorrência, exatamente como
+    ``re.search`` faria com o padrão do campo. Campos cujo padrão não
+    começa com um rótulo literal (como a linha digitável) são buscados
+    individualmente, uma vez por padrão distinto.
+    """
+
+    def __init__(self, padroes: Dict[str, "re.Pattern[str]"]):
+        """
+        Inicializa o varredor
+
+        Args:
+            padroes: Padrões compilados indexados pelo nome do campo; as
+                flags do primeiro padrão também valem para os rótulos
+        """
+        self.campos = list(padroes)
+        self._compilados = dict(padroes)
+        flags = next(iter(padroes.values())).flags if padroes else 0
+
+        # Campos agrupados pela primeira letra do rótulo
+        self._por_inicial: Dict[str, List[str]] = {}
+        self._sem_rotulo: Dict[str, List[str]] = {}
+        rotulos = set()
+        for campo, compilado in padroes.items():
+            padrao = compilado.pattern
+            rotulo = rotulo_literal(padrao)
+            if rotulo:
+                rotulos.add(rotulo)
+                self._por_inicial.setdefault(rotulo[0].lower(), []).append(campo)
+            else:
+                self._sem_rotulo.setdefault(padrao, []).append(campo)
+
+        # Lookahead: encontra também rótulos sobrepostos ("Código do
+        # Responsável" contém "Responsável")
+        alternativas = "|".join(
+            re.escape(r) for r in sorted(rotulos, key=len, reverse=True)
+        )
+        self._ancoras = re.compile(f"(?=(?:{alternativas}))", flags)
+
+    def varrer(self, texto: str) -> Iterator[AchadoCampo]:
+        """
+        Percorre o texto e retorna a primeira ocorrência de cada campo
+
+        Args:
+            texto: Texto onde buscar
+
+        Yields:
+            Tuplas (campo, match) na ordem em que aparecem no documento
+        """
+        achados: List[Tuple[int, int, str, "re.Match[str]"]] = []
+
+        pendentes = set().union(*self._por_inicial.values())
+        for ancora in self._ancoras.finditer(texto):
+            if not pendentes:
+                break
+            posicao = ancora.start()
+            for campo in self._por_inicial.get(texto[posicao].lower(), ()):
+                if campo not in pendentes:
+                    continue
+                match = self._compilados[campo].match(texto, posicao)
+                if match:
+                    pendentes.discard(campo)
+                    achados.append((posicao, len(achados), campo, match))
+
+        for campos in self._sem_rotulo.values():
+            match = self._compilados[campos[0]].search(texto)
+            if match:
+                for campo in campos:
+                    achados.append((match.start(), len(achados), campo, match))
+
+        achados.sort()
+        for _, _, campo, match in achados:
+            yield campo, match
+
+    def extrair(self, texto: str) -> Dict[str, "re.Match[str]"]:
+        """Retorna o primeiro match de cada campo encontrado, por campo"""
+        return dict(self.varrer(texto))
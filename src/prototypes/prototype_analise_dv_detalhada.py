@@ -2,10 +2,14 @@
 """
 Protótipo: Análise Detalhada dos DVs
 Debug completo dos cálculos de dígitos verificadores
+
+Execução (a partir da raiz do repositório, pois importa src.utils):
+    python -m src.prototypes.prototype_analise_dv_detalhada
 """
 
 import re
-from datetime import datetime, timedelta
+
+from ..utils.vencimento import fator_para_data_br
 
 
 def calcular_modulo_10_detalhado(numero: str) -> dict:
@@ -279,9 +283,7 @@ def analisar_digitavel_detalhado(digitavel: str):
 
 def fator_para_data(fator: int) -> str:
     """Converte fator de vencimento para data"""
-    data_base = datetime(1997, 10, 7)
-    data_vencimento = data_base + timedelta(days=fator)
-    return data_vencimento.strftime("%d/%m/%Y")
+    return fator_para_data_br(fator)
 
 
 def identificar_banco(codigo: str) -> str:
@@ -2,10 +2,14 @@
 """
 Protótipo: Correção dos DVs
 Sugere o digitável correto baseado nos cálculos
+
+Execução (a partir da raiz do repositório, pois importa src.utils):
+    python -m src.prototypes.prototype_correcao_dv
 """
 
 import re
-from datetime import datetime, timedelta
+
+from ..utils.vencimento import fator_para_data_br
 
 
 def calcular_modulo_10(numero: str) -> int:
@@ -255,9 +259,7 @@ def corrigir_digitavel(digitavel: str):
 
 def fator_para_data(fator: int) -> str:
     """Converte fator de vencimento para data"""
-    data_base = datetime(1997, 10, 7)
-    data_vencimento = data_base + timedelta(days=fator)
-    return data_vencimento.strftime("%d/%m/%Y")
+    return fator_para_data_br(fator)
 
 
 def identificar_banco(codigo: str) -> str:
@@ -2,14 +2,19 @@
 """
 Protótipo: Integração Completa das Classes
 Integrando BoletoDigitavel com BoletoBancario
+
+Execução (a partir da raiz do repositório, pois importa src.utils):
+    python -m src.prototypes.prototype_integracao_completa
 """
 
 import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from ..utils.vencimento import fator_para_data_br
+
 
 class TipoDocumento(Enum):
     """Tipos de documento conforme Febraban"""
@@ -198,9 +203,7 @@ class BoletoDigitavel:
 
     def _fator_para_data(self, fator: int) -> str:
         """Converte fator de vencimento para data"""
-        data_base = datetime(1997, 10, 7)
-        data_vencimento = data_base + timedelta(days=fator)
-        return data_vencimento.strftime("%d/%m/%Y")
+        return fator_para_data_br(fator)
 
     def _validar_campo(self, campo: str) -> CampoDigitavel:
         """Valida um campo e retorna informações detalhadas"""
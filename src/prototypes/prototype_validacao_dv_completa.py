@@ -2,10 +2,14 @@
 """
 Protótipo: Validação Completa dos Dígitos Verificadores
 Implementação dos cálculos Módulo 10 e Módulo 11 da Febraban
+
+Execução (a partir da raiz do repositório, pois importa src.utils):
+    python -m src.prototypes.prototype_validacao_dv_completa
 """
 
 import re
-from datetime import datetime, timedelta
+
+from ..utils.vencimento import fator_para_data_br
 
 
 def calcular_modulo_10(numero: str) -> int:
@@ -303,9 +307,7 @@ def gerar_codigo_barras_com_dv(digitavel: str) -> str:
 
 def fator_para_data(fator: int) -> str:
     """Converte fator de vencimento para data"""
-    data_base = datetime(1997, 10, 7)
-    data_vencimento = data_base + timedelta(days=fator)
-    return data_vencimento.strftime("%d/%m/%Y")
+    return fator_para_data_br(fator)
 
 
 def identificar_banco(codigo: str) -> str:
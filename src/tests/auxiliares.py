@@ -0,0 +1,54 @@
+"""
+Funções auxiliares compartilhadas pelos módulos de teste
+"""
+
+
+def gerar_pdf(paginas):
+    """
+    Gera um PDF mínimo com texto, uma lista de linhas por página
+
+    Args:
+        paginas: Lista de páginas, cada uma uma lista de linhas de texto
+
+    Returns:
+        Conteúdo do PDF em bytes
+    """
+    objetos = [b"<< /Type /Catalog /Pages 2 0 R >>", None, None]
+    objetos[2] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    kids = []
+    for linhas in paginas:
+        comandos = ["BT /F1 10 Tf 14 TL 40 800 Td"]
+        for linha in linhas:
+            texto = linha.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            comandos.append(f"({texto}) Tj T*")
+        comandos.append("ET")
+        conteudo = "\n".join(comandos).encode("latin-1")
+        objetos.append(
+            b"<< /Length %d >>\nstream\n" % len(conteudo) + conteudo + b"\nendstream"
+        )
+        indice_conteudo = len(objetos)
+        objetos.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % indice_conteudo
+        )
+        kids.append(b"%d 0 R" % len(objetos))
+    objetos[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(kids),
+        len(kids),
+    )
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for numero, objeto in enumerate(objetos, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % numero + objeto + b"\nendobj\n"
+    inicio_xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objetos) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objetos) + 1,
+        inicio_xref,
+    )
+    return bytes(pdf)
@@ -0,0 +1,37 @@
+"""
+Fixtures compartilhadas dos testes
+"""
+
+import os
+
+import pytest
+
+from . import auxiliares
+
+# Os PDFs dos testes são gerados em memória: o pool padrão (API e CLI) usa o
+# PyPDF2 para que a suíte não dependa do poppler-utils instalado. A
+# equivalência com o pdftotext é conferida em test_extracao_texto.py
+os.environ.setdefault("BOLETO_EXTRACAO_MOTOR", "pypdf2")
+
+
+@pytest.fixture
+def gerar_pdf():
+    """Gerador de PDFs mínimos com texto (ver auxiliares.gerar_pdf)"""
+    return auxiliares.gerar_pdf
+
+
+@pytest.fixture
+def pdf_boleto():
+    """PDF de uma página com campos típicos de um boleto"""
+    return auxiliares.gerar_pdf(
+        [
+            [
+                "Beneficiário EMPRESA EXEMPLO LTDA - 12.345.678/0001-90",
+                "Pagador: FULANO DE TAL - CPF/CNPJ: 123.456.789-00",
+                "Vencimento: 09/07/2025",
+                "Valor do documento R$ 389,36",
+                "Nosso Número 12345678",
+                "033991614.0 0700000191.2 8155600101.4 4 11370000038936",
+            ]
+        ]
+    )
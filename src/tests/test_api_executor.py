@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Testes do executor limitado da API
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from ..api.executor import (
+    ExecutorParsing,
+    ServicoSobrecarregadoError,
+    TempoEsgotadoError,
+)
+
+
+def test_executa_fora_do_event_loop():
+    """Testa que a função roda em outra thread e retorna o resultado"""
+    executor = ExecutorParsing(max_workers=2, max_fila=0)
+
+    async def cenario():
+        return await executor.executar(threading.get_ident)
+
+    try:
+        assert asyncio.run(cenario()) != threading.get_ident()
+        assert executor.em_andamento == 0
+    finally:
+        executor.fechar()
+
+
+def test_recusa_quando_saturado():
+    """Testa o controle de admissão (workers + fila)"""
+    executor = ExecutorParsing(max_workers=1, max_fila=1, retry_after=7)
+    liberar = threading.Event()
+
+    async def cenario():
+        tarefas = [
+            asyncio.ensure_future(executor.executar(liberar.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(ServicoSobrecarregadoError) as erro:
+            await executor.executar(liberar.wait)
+        liberar.set()
+        await asyncio.gather(*tarefas)
+        return erro.value
+
+    try:
+        erro = asyncio.run(cenario())
+        assert erro.retry_after == 7
+        assert executor.em_andamento == 0
+    finally:
+        executor.fechar()
+
+
+def test_tempo_limite():
+    """Testa o tempo limite por requisição"""
+    executor = ExecutorParsing(max_workers=1, max_fila=0, timeout=0.05)
+    liberar = threading.Event()
+
+    async def cenario():
+        with pytest.raises(TempoEsgotadoError):
+            await executor.executar(liberar.wait)
+        # A vaga continua ocupada até a tarefa terminar de fato
+        assert executor.em_andamento == 1
+        liberar.set()
+
+    try:
+        asyncio.run(cenario())
+    finally:
+        executor.fechar()
+
+
+def test_configuracao_do_ambiente(monkeypatch):
+    """Testa a leitura das variáveis de ambiente"""
+    monkeypatch.setenv("BOLETO_API_MAX_WORKERS", "8")
+    monkeypatch.setenv("BOLETO_API_MAX_FILA", "2")
+    monkeypatch.setenv("BOLETO_API_TIMEOUT", "0")
+
+    executor = ExecutorParsing.do_ambiente()
+
+    assert executor.max_workers == 8
+    assert executor.max_fila == 2
+    assert executor.timeout is None
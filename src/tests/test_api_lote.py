@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Testes dos endpoints em lote de códigos digitáveis
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from ..api import routes_decode
+from ..api.main import app
+
+LINHA_VALIDA = "03399161400700000191281556001014411370000038936"
+LINHA_DV_ERRADO = LINHA_VALIDA[:9] + "9" + LINHA_VALIDA[10:]
+
+cliente = TestClient(app)
+
+
+def _ndjson(resposta):
+    assert resposta.status_code == 200
+    assert resposta.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(linha) for linha in resposta.text.splitlines()]
+
+
+def test_validate_digitavel_batch_array_json():
+    """Testa a validação com entrada em array JSON"""
+    resposta = cliente.post(
+        "/validate-digitavel/batch", json=[LINHA_VALIDA, LINHA_DV_ERRADO, "123"]
+    )
+    resultados = _ndjson(resposta)
+
+    assert [r["indice"] for r in resultados] == [0, 1, 2]
+    assert [r["valido"] for r in resultados] == [True, False, False]
+    assert resultados[1]["falhas"] == ["campo1"]
+    assert resultados[2]["falhas"] == ["formato"]
+
+
+def test_decode_batch_ndjson():
+    """Testa a decodificação com entrada NDJSON e o mesmo resultado de /decode"""
+    corpo = "\n".join(json.dumps(item) for item in [{"digitavel": LINHA_VALIDA}, "abc"])
+    resposta = cliente.post(
+        "/decode/batch",
+        content=corpo,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    resultados = _ndjson(resposta)
+
+    unitario = cliente.post("/decode", params={"digitavel": LINHA_VALIDA}).json()
+    assert resultados[0]["success"] and resultados[0]["valido"]
+    assert resultados[0]["data"] == unitario["data"]
+    assert not resultados[1]["success"]
+    assert "47 dígitos" in resultados[1]["error"]
+
+
+def test_decode_batch_digitos_unicode():
+    """Testa que dígitos não ASCII viram erro do item, sem cortar o lote"""
+    resposta = cliente.post("/decode/batch", json=["²" * 44, "²" * 47, LINHA_VALIDA])
+    resultados = _ndjson(resposta)
+
+    assert [r["success"] for r in resultados] == [False, False, True]
+
+
+def test_lote_invalido_ou_grande_demais(monkeypatch):
+    """Testa corpo malformado e limite de linhas"""
+    resposta = cliente.post("/decode/batch", content="[1, 2")
+    assert resposta.status_code == 400
+    resposta = cliente.post("/decode/batch", json=[1])
+    assert resposta.status_code == 400
+
+    monkeypatch.setattr(routes_decode, "MAX_LINHAS_LOTE", 2)
+    resposta = cliente.post("/validate-digitavel/batch", json=[LINHA_VALIDA] * 3)
+    assert resposta.status_code == 413
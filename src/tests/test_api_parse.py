@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Testes do endpoint /parse nos modos completo e pagamento e do /validate
+"""
+
+from fastapi.testclient import TestClient
+
+from ..api.main import app
+from .auxiliares import gerar_pdf
+
+cliente = TestClient(app)
+
+PDF_PAGAMENTO = gerar_pdf(
+    [
+        [
+            "Vencimento: 09/07/2025",
+            "03399.16140 07000.001912 81556.001014 4 11370000038936",
+        ]
+    ]
+)
+
+
+def _enviar(pdf, **parametros):
+    resposta = cliente.post(
+        "/parse",
+        params=parametros,
+        files={"file": ("boleto.pdf", pdf, "application/pdf")},
+    )
+    assert resposta.status_code == 200
+    return resposta.json()
+
+
+def test_parse_modo_pagamento():
+    """Testa que o modo pagamento devolve só os dados da linha digitável"""
+    resposta = _enviar(PDF_PAGAMENTO, mode="pagamento")
+
+    assert resposta["success"] is True
+    assert resposta["data"]["valor"] == 389.36
+    assert resposta["data"]["banco"] == "033"
+    assert "pagador" not in resposta["data"]
+
+
+def test_parse_modo_invalido():
+    """Testa modo desconhecido e fields combinado com o modo pagamento"""
+    assert "Modo desconhecido" in _enviar(PDF_PAGAMENTO, mode="rapido")["error"]
+    resposta = _enviar(PDF_PAGAMENTO, mode="pagamento", fields="vencimento")
+    assert resposta["success"] is False
+
+
+def test_validate_mantem_tipo_arquivo_como_texto():
+    """Testa que tipo_arquivo continua uma string e a detecção vem à parte"""
+    resposta = cliente.post(
+        "/validate",
+        files={"file": ("boleto.pdf", PDF_PAGAMENTO, "application/pdf")},
+    ).json()
+
+    assert isinstance(resposta["tipo_arquivo"], str)
+    assert resposta["deteccao_arquivo"]["is_pdf"] is True
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Testes do cache de resultados indexado pelo conteúdo do PDF
+"""
+
+import sqlite3
+
+from ..api import executor as executor_api
+from ..parser import BoletoParser, CacheResultados, PoolExtracaoTexto, cache
+from ..parser.cache import chave_conteudo
+
+
+def test_acerto_nao_extrai_texto_novamente(pdf_boleto, mocker):
+    """Testa que o segundo parsing do mesmo PDF vem do cache"""
+    pool = PoolExtracaoTexto("pypdf2", max_workers=1, fallback_pdftotext=False)
+    parser = BoletoParser(extrator=pool, cache=CacheResultados())
+    extrair = mocker.spy(pool, "extrair")
+
+    primeiro = parser.parse(pdf_boleto)
+    segundo = parser.parse(bytearray(pdf_boleto))
+    parcial = parser.parse(pdf_boleto, fields=["valores"])
+    pool.fechar()
+
+    assert extrair.call_count == 1
+    assert segundo == primeiro
+    assert segundo is not primeiro
+    assert parcial.valores == primeiro.valores
+    estatisticas = parser.cache.estatisticas()
+    assert estatisticas["acertos_memoria"] == 2
+    assert estatisticas["falhas"] == 1
+
+
+def test_lru_por_tamanho_e_camada_em_disco(tmp_path):
+    """Testa a remoção por tamanho e a recuperação a partir do disco"""
+    parser = BoletoParser()
+    dados = parser.parse_texto("Vencimento: 09/07/2025")
+    tamanho = len(dados.model_dump_json())
+    banco = tmp_path / "cache.sqlite"
+
+    cache = CacheResultados(max_bytes=tamanho * 2, caminho_disco=banco)
+    for i in range(3):
+        cache.guardar(chave_conteudo(bytes([i])), dados)
+    assert cache.estatisticas()["itens_memoria"] == 2
+    assert cache.estatisticas()["remocoes"] == 1
+    cache.fechar()
+
+    # Novo processo: memória vazia, resultado vem do disco
+    cache = CacheResultados(caminho_disco=banco)
+    assert cache.obter(chave_conteudo(bytes([0]))) == dados
+    assert cache.obter(chave_conteudo(b"outro")) is None
+    assert cache.estatisticas()["acertos_disco"] == 1
+    cache.fechar()
+
+
+def test_ttl_expirado(tmp_path):
+    """Testa que resultados expirados são descartados nas duas camadas"""
+    dados = BoletoParser().parse_texto("Vencimento: 09/07/2025")
+    cache = CacheResultados(caminho_disco=tmp_path / "cache.sqlite", ttl=-1)
+    cache.guardar("chave", dados)
+
+    assert cache.obter("chave") is None
+    assert cache.estatisticas()["expirados"] == 2
+    cache.fechar()
+
+
+def test_chave_muda_com_esquema(monkeypatch):
+    """Testa que incrementar o esquema do cache invalida as chaves antigas"""
+    antiga = chave_conteudo(b"%PDF-1.4")
+    monkeypatch.setattr(cache, "VERSAO_ESQUEMA_CACHE", cache.VERSAO_ESQUEMA_CACHE + 1)
+
+    assert chave_conteudo(b"%PDF-1.4") != antiga
+
+
+def test_banco_bloqueado_conta_como_falha(tmp_path, monkeypatch):
+    """Testa que um banco bloqueado por outro processo não interrompe o cache"""
+    monkeypatch.setattr(cache, "TIMEOUT_DISCO", 0.05)
+    banco = tmp_path / "cache.sqlite"
+    dados = BoletoParser().parse_texto("Vencimento: 09/07/2025")
+    resultados = CacheResultados(caminho_disco=banco)
+    assert resultados._disco.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    outro = sqlite3.connect(str(banco))
+    outro.execute("BEGIN EXCLUSIVE")
+    try:
+        resultados.guardar("chave", dados)
+        resultados.limpar()
+    finally:
+        outro.rollback()
+        outro.close()
+
+    assert resultados.estatisticas()["erros_disco"] == 2
+    resultados.guardar("chave", dados)
+    resultados.fechar()
+    resultados = CacheResultados(caminho_disco=banco)
+    assert resultados.obter("chave") == dados
+    resultados.fechar()
+
+
+def test_estatisticas_do_processo_principal(monkeypatch):
+    """Testa que com processos a API não mostra o cache do processo principal"""
+    monkeypatch.setattr(executor_api.executor, "usar_processos", True)
+    assert executor_api.estatisticas_cache() is None
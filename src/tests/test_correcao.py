@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Testes da busca de correções para linhas digitáveis com erro de digitação
+"""
+
+import pytest
+
+from ..core import Digitavel, sugerir_correcoes
+from ..core.codigo_barras import CodigoBarras
+from ..core.correcao import SUBSTITUICAO, TRANSPOSICAO
+from ..core.digitavel import LinhaDigitavel
+
+LINHA = "03399161400700000191281556001014411370000038936"
+
+
+def _valida(linha):
+    return (
+        LinhaDigitavel(linha).validar()
+        and CodigoBarras.da_linha_digitavel(linha).validar()
+    )
+
+
+def _forca_bruta(linha):
+    """Todas as alterações únicas válidas, recalculando os DVs do zero"""
+    alteradas = set()
+    for i in range(len(linha)):
+        for digito in "0123456789":
+            alteradas.add(linha[:i] + digito + linha[i + 1 :])
+    for i in range(len(linha) - 1):
+        alteradas.add(linha[:i] + linha[i + 1] + linha[i] + linha[i + 2 :])
+    alteradas.discard(linha)
+    return {alterada for alterada in alteradas if _valida(alterada)}
+
+
+def test_linha_valida_sem_sugestoes():
+    """Testa que uma linha válida não recebe sugestões"""
+    assert sugerir_correcoes(LINHA) == []
+    assert Digitavel(LINHA).sugerir_correcoes() == []
+
+
+def test_substituicao_em_cada_posicao():
+    """Testa que a linha original é sugerida para um dígito errado em qualquer posição"""
+    for posicao in range(len(LINHA)):
+        digito = str((int(LINHA[posicao]) + 3) % 10)
+        digitada = LINHA[:posicao] + digito + LINHA[posicao + 1 :]
+        sugestoes = sugerir_correcoes(digitada)
+        originais = [s for s in sugestoes if s.linha == LINHA]
+        assert len(originais) == 1
+        assert originais[0].tipo == SUBSTITUICAO
+        assert originais[0].posicoes == (posicao,)
+        assert originais[0].digitado == digito
+        assert originais[0].corrigido == LINHA[posicao]
+        assert {s.linha for s in sugestoes} == _forca_bruta(digitada)
+
+
+def test_transposicao_sugerida_primeiro():
+    """Testa que a transposição de dígitos vizinhos vem à frente"""
+    digitada = LINHA[:7] + LINHA[8] + LINHA[7] + LINHA[9:]
+    sugestoes = Digitavel(digitada).sugerir_correcoes()
+    assert sugestoes[0].linha == LINHA
+    assert sugestoes[0].tipo == TRANSPOSICAO
+    assert sugestoes[0].posicoes == (7, 8)
+    assert {s.linha for s in sugestoes} == _forca_bruta(digitada)
+
+
+def test_formato_invalido():
+    """Testa a rejeição de linhas sem 47 dígitos"""
+    with pytest.raises(ValueError):
+        sugerir_correcoes(LINHA[:-1])
+    assert Digitavel(LINHA[:-1]).sugerir_correcoes() == []
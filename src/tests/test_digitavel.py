@@ -237,7 +237,7 @@ def test_properties_digitavel():
     assert digitavel.valor_centavos == "0000038936"
     # Campo livre pode variar dependendo da implementação, testamos apenas que existe
     assert digitavel.campo_livre is not None
-    assert len(digitavel.campo_livre) == 23  # Implementação atual retorna 23 dígitos
+    assert digitavel.campo_livre == "9161407000001918155600101"
     assert digitavel.codigo_barras is not None
 
     # Testar com digitável inválido (sem campos)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Testes da validação em lote de linhas digitáveis
+"""
+
+import pytest
+
+from ..core import digitavel as modulo_digitavel
+from ..core.digitavel import Digitavel
+from ..core.enums import FalhaDigitavel
+
+LINHA_VALIDA = "03399161400700000191281556001014411370000038936"
+
+
+def _linhas_teste():
+    return [
+        LINHA_VALIDA,
+        "033991614.0 0700000191.2 8155600101.4 4 11370000038936",
+        LINHA_VALIDA[:9] + "9" + LINHA_VALIDA[10:],  # DV campo 1 errado
+        LINHA_VALIDA[:20] + "0" + LINHA_VALIDA[21:],  # DV campo 2 errado
+        LINHA_VALIDA[:31] + "0" + LINHA_VALIDA[32:],  # DV campo 3 errado
+        LINHA_VALIDA[:32] + "9" + LINHA_VALIDA[33:],  # DV geral errado
+        LINHA_VALIDA[:-1],  # Muito curta
+        LINHA_VALIDA[:-1] + "a",  # Com letra
+        "",
+    ]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Executa o teste com e sem numpy"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(modulo_digitavel, "np", None)
+    return request.param
+
+
+def test_validar_lote_mascara_e_falhas(backend):
+    """Testa a máscara de válidas e os códigos de falha por campo"""
+    resultado = Digitavel.validar_lote(_linhas_teste())
+
+    assert len(resultado) == 9
+    assert [bool(v) for v in resultado.validos] == [True, True] + [False] * 7
+    assert [int(f) for f in resultado.falhas] == [
+        FalhaDigitavel.NENHUMA,
+        FalhaDigitavel.NENHUMA,
+        FalhaDigitavel.CAMPO1,
+        FalhaDigitavel.CAMPO2,
+        FalhaDigitavel.CAMPO3,
+        FalhaDigitavel.DV_GERAL,
+        FalhaDigitavel.FORMATO,
+        FalhaDigitavel.FORMATO,
+        FalhaDigitavel.FORMATO,
+    ]
+
+
+def test_validar_lote_vazio(backend):
+    """Testa lote sem linhas"""
+    resultado = Digitavel.validar_lote([])
+    assert len(resultado) == 0
+
+
+def test_validar_lote_consistente_com_validar():
+    """Testa que os DVs de campo do lote concordam com Digitavel.validar()"""
+    linhas = _linhas_teste()[:5]
+    resultado = Digitavel.validar_lote(linhas)
+    campos = FalhaDigitavel.CAMPO1 | FalhaDigitavel.CAMPO2 | FalhaDigitavel.CAMPO3
+
+    for linha, falha in zip(linhas, resultado.falhas):
+        assert Digitavel(linha).validar() == (int(falha) & campos == 0)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Testes dos cálculos de dígito verificador (Módulo 10 e Módulo 11)
+"""
+
+import pytest
+
+from ..utils.dv import (
+    dv_soma_modulo_10,
+    dv_soma_modulo_11,
+    modulo_10,
+    modulo_10_many,
+    modulo_11,
+    modulo_11_many,
+    parcelas_modulo_10,
+    pesos_modulo_11,
+)
+
+
+def test_modulo_10_valores_conhecidos():
+    """Testa o Módulo 10 com campos de linhas digitáveis reais"""
+    assert modulo_10("033991614") == 0
+    assert modulo_10("0700000191") == 2
+    assert modulo_10("8155600101") == 4
+    assert modulo_10("") == 0
+
+
+def test_modulo_11_casos_edge():
+    """Testa os restos 0 e 1 do Módulo 11"""
+    assert modulo_11("") == 1
+    assert modulo_11("0") == 1
+    assert modulo_11("1") == 9
+
+
+def test_aceita_bytes_ascii():
+    """Testa que bytes ASCII produzem o mesmo resultado que strings"""
+    numero = "0339916140700000192815560014411370000038936"
+    assert modulo_10(numero.encode()) == modulo_10(numero)
+    assert modulo_11(memoryview(numero.encode())) == modulo_11(numero)
+
+
+def test_caracteres_invalidos():
+    """Testa que caracteres não numéricos geram ValueError"""
+    with pytest.raises(ValueError):
+        modulo_10("12a4")
+    with pytest.raises(ValueError):
+        modulo_11("12 4")
+
+
+def test_calculo_em_lote():
+    """Testa modulo_10_many/modulo_11_many com listas e buffers"""
+    numeros = ["033991614", "0700000191", "8155600101"]
+
+    assert list(modulo_10_many(numeros)) == [modulo_10(n) for n in numeros]
+    assert list(modulo_11_many(numeros)) == [modulo_11(n) for n in numeros]
+
+    buffer = "\n".join(numeros).encode()
+    assert list(modulo_10_many(buffer)) == [0, 2, 4]
+    assert list(modulo_11_many(buffer)) == [modulo_11(n) for n in numeros]
+    assert len(modulo_10_many([])) == 0
+
+
+def test_somas_por_parcelas():
+    """Testa que as parcelas por posição reproduzem os DVs calculados"""
+    numero = "0339916140700000192815560014411370000038936"
+    parcelas = parcelas_modulo_10(len(numero))
+    soma_10 = sum(parcelas[i][int(d)] for i, d in enumerate(numero))
+    assert dv_soma_modulo_10(soma_10) == modulo_10(numero)
+
+    pesos = pesos_modulo_11(len(numero))
+    soma_11 = sum(peso * int(d) for peso, d in zip(pesos, numero))
+    assert dv_soma_modulo_11(soma_11) == modulo_11(numero)
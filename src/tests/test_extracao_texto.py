@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Testes dos motores e do pool de extração de texto
+"""
+
+import shutil
+import time
+
+import pytest
+
+from ..parser import BoletoParser
+from ..parser.extracao_texto import (
+    MotorExtracaoTexto,
+    MotorPyPDF2,
+    PoolExtracaoTexto,
+    SelecaoPaginas,
+)
+from .auxiliares import gerar_pdf
+
+LINHA = "03391111141111111111511111111115516320000001000"
+
+
+class MotorFixo(MotorExtracaoTexto):
+    """Motor de teste que retorna um texto fixo ou falha"""
+
+    def __init__(self, texto="", erro=None, atraso=0.0):
+        self.texto = texto
+        self.erro = erro
+        self.atraso = atraso
+        self.chamadas = 0
+
+    def extrair(self, origem):
+        self.chamadas += 1
+        time.sleep(self.atraso)
+        if self.erro:
+            raise ValueError(self.erro)
+        return self.texto
+
+
+class MotorTravado(MotorExtracaoTexto):
+    """Motor de teste que trava nos PDFs b"trava" (executável em processos)"""
+
+    def __init__(self, atraso):
+        self.atraso = atraso
+
+    def extrair(self, origem):
+        if origem == b"trava":
+            time.sleep(self.atraso)
+        return "ok"
+
+
+class MotorPaginado(MotorExtracaoTexto):
+    """Motor de teste com páginas fixas que registra os intervalos pedidos"""
+
+    def __init__(self, paginas):
+        self.paginas = paginas
+        self.pedidos = []
+
+    def extrair(self, origem):
+        return "\n".join(self.paginas)
+
+    def extrair_paginas(self, origem, inicio=1, fim=None):
+        self.pedidos.append((inicio, fim))
+        return self.paginas[inicio - 1 : fim]
+
+    def contar_paginas(self, origem):
+        return len(self.paginas)
+
+
+def test_motor_pypdf2_extrai_bytes_e_caminho(pdf_boleto, tmp_path):
+    """Testa extração em processo a partir de bytes e de arquivo"""
+    arquivo = tmp_path / "boleto.pdf"
+    arquivo.write_bytes(pdf_boleto)
+
+    texto_bytes = MotorPyPDF2().extrair(pdf_boleto)
+    texto_arquivo = MotorPyPDF2().extrair(str(arquivo))
+
+    assert "Valor do documento R$ 389,36" in texto_bytes
+    assert texto_bytes == texto_arquivo
+
+
+def test_motor_pypdf2_pdf_invalido():
+    """Testa erro de extração para conteúdo que não é PDF"""
+    with pytest.raises(ValueError):
+        MotorPyPDF2().extrair(b"nao sou um pdf")
+
+
+def test_pool_usa_motor_principal(pdf_boleto):
+    """Testa o pool com o motor PyPDF2 e reutilização do executor"""
+    pool = PoolExtracaoTexto("pypdf2", max_workers=2)
+    try:
+        assert "Pagador:" in pool.extrair(pdf_boleto)
+        executor = pool._executor
+        pool.extrair(pdf_boleto)
+        assert pool._executor is executor
+    finally:
+        pool.fechar()
+
+
+def test_pool_fallback(monkeypatch):
+    """Testa o fallback quando o motor principal falha ou não acha texto"""
+    for principal in (MotorFixo(erro="falhou"), MotorFixo(texto="   ")):
+        pool = PoolExtracaoTexto(principal)
+        fallback = MotorFixo(texto="texto do fallback")
+        pool.fallback = fallback
+
+        assert pool.extrair(b"%PDF-") == "texto do fallback"
+        assert principal.chamadas == 1
+        assert fallback.chamadas == 1
+        pool.fechar()
+
+
+def test_pool_sem_fallback_propaga_erro():
+    """Testa que o erro é propagado quando o fallback está desativado"""
+    pool = PoolExtracaoTexto(MotorFixo(erro="falhou"), fallback_pdftotext=False)
+    with pytest.raises(ValueError, match="falhou"):
+        pool.extrair(b"%PDF-")
+    pool.fechar()
+
+
+def test_pool_timeout():
+    """Testa o tempo limite por extração"""
+    pool = PoolExtracaoTexto(
+        MotorFixo(texto="lento", atraso=0.5), timeout=0.05, fallback_pdftotext=False
+    )
+    with pytest.raises(ValueError, match="Tempo limite"):
+        pool.extrair(b"%PDF-")
+    pool.fechar()
+
+
+@pytest.mark.parametrize("usar_processos", [False, True])
+def test_pool_timeout_libera_o_pool(usar_processos):
+    """Testa que um PDF travado não bloqueia as extrações seguintes"""
+    atraso = 30.0 if usar_processos else 1.0
+    pool = PoolExtracaoTexto(
+        MotorTravado(atraso),
+        max_workers=1,
+        timeout=0.2,
+        fallback_pdftotext=False,
+        usar_processos=usar_processos,
+    )
+    with pytest.raises(ValueError, match="Tempo limite"):
+        pool.extrair(b"trava")
+    assert pool._executor is None  # Descartado; o próximo uso cria outro
+
+    inicio = time.perf_counter()
+    assert pool.extrair(b"%PDF-") == "ok"
+    assert time.perf_counter() - inicio < atraso / 2
+    pool.fechar()
+
+
+def test_motor_base_abstrato():
+    """Testa que a classe base exige a implementação de extrair()"""
+    with pytest.raises(TypeError):
+        MotorExtracaoTexto()
+
+
+def test_pool_motor_desconhecido():
+    """Testa nome de motor inválido"""
+    with pytest.raises(ValueError):
+        PoolExtracaoTexto("inexistente")
+
+
+def test_selecao_paginas_de_texto():
+    """Testa a leitura da seleção de páginas e a conversão dos limites"""
+    assert SelecaoPaginas.de_texto(None).completa
+    assert SelecaoPaginas.de_texto("ultima").resolver(9) == (9, 9)
+    assert SelecaoPaginas.de_texto("2-5").resolver(3) == (2, 3)
+    assert SelecaoPaginas.de_texto("2:-1").resolver(6) == (2, 6)
+    assert str(SelecaoPaginas.de_texto("-2")) == "-2:-2"
+    for invalido in ("segunda", "0", "1-a", "5-2", "-1:-3"):
+        with pytest.raises(ValueError):
+            SelecaoPaginas.de_texto(invalido)
+
+
+def test_motor_pypdf2_limites_de_pagina():
+    """Testa que o PyPDF2 converte apenas as páginas pedidas"""
+    pdf = gerar_pdf([[f"pagina {i}"] for i in range(1, 5)])
+    motor = MotorPyPDF2()
+
+    assert motor.contar_paginas(pdf) == 4
+    paginas = motor.extrair_paginas(pdf, 2, 3)
+    assert [p.strip() for p in paginas] == ["pagina 2", "pagina 3"]
+
+
+def test_pool_selecao_de_paginas():
+    """Testa primeira/última página e intervalo pelo pool"""
+    motor = MotorPaginado([f"pagina {i}" for i in range(1, 11)])
+    pool = PoolExtracaoTexto(motor, fallback_pdftotext=False)
+
+    assert pool.extrair(b"%PDF-", SelecaoPaginas("primeira")) == "pagina 1"
+    assert pool.extrair(b"%PDF-", SelecaoPaginas("ultima")) == "pagina 10"
+    assert pool.extrair_paginas(b"%PDF-", SelecaoPaginas.de_texto("-3:-2")) == [
+        "pagina 8",
+        "pagina 9",
+    ]
+    assert motor.pedidos == [(1, 1), (10, 10), (8, 9)]
+    pool.fechar()
+
+
+def test_pool_selecao_fora_do_documento():
+    """Testa que um intervalo além da última página não chega ao fallback"""
+    motor = MotorPaginado(["pagina 1", "pagina 2"])
+    pool = PoolExtracaoTexto(motor)
+    pool.fallback = MotorFixo(erro="fallback não deveria ser usado")
+
+    assert pool.extrair_paginas(b"%PDF-", SelecaoPaginas.de_texto("5-6")) == []
+    assert pool.extrair(b"%PDF-", SelecaoPaginas.de_texto("3")) == ""
+    assert motor.pedidos == []
+    pool.fechar()
+
+
+def test_pool_auto_para_na_linha_digitavel():
+    """Testa que a estratégia auto só converte páginas até achar a linha"""
+    paginas = [f"extrato pagina {i}" for i in range(1, 21)]
+    paginas[6] = f"Ficha de compensação\n{LINHA}"
+    motor = MotorPaginado(paginas)
+    pool = PoolExtracaoTexto(motor, fallback_pdftotext=False)
+
+    texto = pool.extrair_paginas(b"%PDF-", SelecaoPaginas("auto"))
+
+    # Primeira, última e blocos de 4 a partir da 2ª até encontrar a 7ª página
+    assert motor.pedidos == [(1, 1), (20, 20), (2, 5), (6, 9)]
+    assert texto == [paginas[i] for i in (0, 1, 2, 3, 4, 5, 6, 7, 8, 19)]
+    pool.fechar()
+
+
+def test_pool_do_ambiente(monkeypatch):
+    """Testa a configuração do pool padrão pelas variáveis BOLETO_EXTRACAO_*"""
+    for variavel in ("MOTOR", "WORKERS", "TIMEOUT", "PROCESSOS"):
+        monkeypatch.delenv(f"BOLETO_EXTRACAO_{variavel}", raising=False)
+    padrao = PoolExtracaoTexto.do_ambiente()
+    assert padrao.motor.nome == "pdftotext"
+    assert (padrao.max_workers, padrao.timeout) == (4, 30.0)
+    assert not padrao.usar_processos
+
+    monkeypatch.setenv("BOLETO_EXTRACAO_MOTOR", "pypdf2")
+    monkeypatch.setenv("BOLETO_EXTRACAO_WORKERS", "2")
+    monkeypatch.setenv("BOLETO_EXTRACAO_TIMEOUT", "0")
+    monkeypatch.setenv("BOLETO_EXTRACAO_PROCESSOS", "1")
+    pool = PoolExtracaoTexto.do_ambiente()
+    assert pool.motor.nome == "pypdf2"
+    assert (pool.max_workers, pool.timeout, pool.usar_processos) == (2, None, True)
+
+
+@pytest.mark.skipif(
+    shutil.which("pdftotext") is None, reason="pdftotext (poppler-utils) ausente"
+)
+def test_campos_iguais_entre_motores(pdf_boleto):
+    """Testa que PyPDF2 e pdftotext produzem os mesmos campos no boleto"""
+    resultados = []
+    for motor in ("pdftotext", "pypdf2"):
+        pool = PoolExtracaoTexto(motor, max_workers=1, fallback_pdftotext=False)
+        try:
+            dados = BoletoParser(extrator=pool).parse(pdf_boleto)
+        finally:
+            pool.fechar()
+        resultados.append(dados.model_dump(exclude={"texto_extraido"}))
+
+    assert resultados[0] == resultados[1]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Testes do índice de rótulos do documento
+"""
+
+from ..parser.extractors import InstrucoesExtractor, ValoresExtractor
+from ..parser.indice import IndiceDocumento
+
+TEXTO = """Recibo do Pagador
+Beneficiário EMPRESA EXEMPLO LTDA - 12.345.678/0001-90
+Nosso Número 12345678
+Ficha de Compensação
+Beneficiário EMPRESA EXEMPLO LTDA - 12.345.678/0001-90
+Nosso Número 12345678"""
+
+
+def test_ocorrencias_com_linha():
+    """Testa posições e números de linha dos rótulos repetidos"""
+    indice = IndiceDocumento(TEXTO)
+
+    assert "Beneficiário" in indice
+    assert "Pagador:" not in indice
+    assert [a.linha for a in indice.ocorrencias["Nosso Número"]] == [3, 6]
+    assert indice.to_dict()["Beneficiário"][1] == (
+        TEXTO.rindex("Beneficiário"),
+        5,
+    )
+    assert indice.buscar("beneficiario.nosso_numero").group(1) == "12345678"
+
+
+def test_janela_nao_avanca_sobre_outra_secao():
+    """Testa que o padrão fica restrito às linhas próximas do rótulo"""
+    texto = "Valor do documento\n\n\n\n\nR$ 1,00\nValor do documento R$ 389,36"
+
+    valores = ValoresExtractor(texto).extrair()
+
+    assert valores.valor_documento == 389.36
+
+
+def test_instrucoes_longas_vao_ate_o_fim_do_texto():
+    """Testa que instruções com mais de 20 linhas não são cortadas"""
+    linhas = [f"- não receber após {i} dias do vencimento" for i in range(1, 31)]
+    texto = "Local do Pagamento Qualquer banco\nInstruções\n" + "\n".join(linhas)
+
+    restricoes = InstrucoesExtractor(texto).extrair().restricoes
+
+    assert restricoes == "\n".join(linhas)
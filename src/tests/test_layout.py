@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Testes do layout compartilhado e da conversão entre linha digitável e
+código de barras
+"""
+
+from ..core.codigo_barras import (
+    CodigoBarras,
+    codigos_para_linhas,
+    linhas_para_codigos,
+)
+from ..core.digitavel import Digitavel, LinhaDigitavel
+from ..core.layout import (
+    codigo_barras_para_linha,
+    codigo_barras_sem_dv,
+    linha_para_codigo_barras,
+)
+from ..parser import BoletoDecoder
+
+LINHA = "03399161400700000191281556001014411370000038936"
+CODIGO_BARRAS = "03394113700000389369161407000001918155600101"
+
+
+def test_conversao_nos_dois_sentidos():
+    """Testa a conversão linha ↔ código de barras com str e bytes"""
+    assert linha_para_codigo_barras(LINHA) == CODIGO_BARRAS
+    assert codigo_barras_para_linha(CODIGO_BARRAS) == LINHA
+    assert linha_para_codigo_barras(LINHA.encode()) == CODIGO_BARRAS.encode()
+    assert codigo_barras_para_linha(CODIGO_BARRAS.encode()) == LINHA.encode()
+    assert codigo_barras_sem_dv(LINHA) == CODIGO_BARRAS[:4] + CODIGO_BARRAS[5:]
+
+
+def test_decoder_e_digitavel_concordam():
+    """Testa que decoder, Digitavel e LinhaDigitavel usam o mesmo layout"""
+    dados = BoletoDecoder().decodificar_digitavel(LINHA)
+    digitavel = Digitavel(LINHA)
+    linha = LinhaDigitavel(LINHA)
+
+    assert dados["valor"] == digitavel.valor_documento == linha.valor_documento
+    assert dados["vencimento"] == digitavel.data_vencimento == "09/07/2025"
+    assert dados["campo_livre"] == digitavel.campo_livre == linha.campo_livre
+    assert dados["codigo_barras"] == digitavel.codigo_barras == CODIGO_BARRAS
+    assert dados["digito_verificador"] == LINHA[32]
+
+
+def test_dv_geral_verificado():
+    """Testa que validar() confere o DV geral e corrigir_dv() o recalcula"""
+    errada = LINHA[:32] + "9" + LINHA[33:]
+
+    assert Digitavel(LINHA).validar()
+    assert not Digitavel(errada).validar()
+    assert Digitavel(errada).corrigir_dv() == LINHA
+    assert Digitavel(Digitavel.gerar_digitavel_valido(valor=150.0)).validar()
+
+
+def test_codigo_barras():
+    """Testa o valor CodigoBarras e a conversão em lote"""
+    codigo = CodigoBarras(CODIGO_BARRAS)
+    assert codigo.validar()
+    assert not CodigoBarras(CODIGO_BARRAS[:4] + "9" + CODIGO_BARRAS[5:]).validar()
+    assert codigo.linha_digitavel() == LINHA
+    assert CodigoBarras.da_linha_digitavel(LINHA) == codigo
+    assert codigo.valor_documento == 389.36
+    assert codigo.campo_livre == Digitavel(LINHA).campo_livre
+
+    assert codigos_para_linhas([CODIGO_BARRAS, "123", CODIGO_BARRAS]) == [
+        LINHA,
+        None,
+        LINHA,
+    ]
+    assert linhas_para_codigos([LINHA, ""]) == [CODIGO_BARRAS, None]
+
+
+def test_codigo_barras_como_entrada():
+    """Testa que Digitavel, validação em lote e decoder aceitam os 44 dígitos"""
+    assert Digitavel(CODIGO_BARRAS).valor == LINHA
+    assert LinhaDigitavel(CODIGO_BARRAS).valor == LINHA
+    assert list(Digitavel.validar_lote([CODIGO_BARRAS, LINHA]).validos) == [
+        True,
+        True,
+    ]
+
+    decoder = BoletoDecoder()
+    assert decoder.decodificar_digitavel(CODIGO_BARRAS) == (
+        decoder.decodificar_digitavel(LINHA)
+    )
+    assert decoder.decodificar_digitavel(CODIGO_BARRAS)["linha_digitavel"] == LINHA
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Testes do valor compacto LinhaDigitavel
+"""
+
+import pytest
+
+from ..core.digitavel import Digitavel, LinhaDigitavel
+
+LINHA_FORMATADA = "033991614.0 0700000191.2 8155600101.4 4 11370000038936"
+PROPRIEDADES = [
+    "banco",
+    "fator_vencimento",
+    "valor_centavos",
+    "valor_documento",
+    "data_vencimento",
+    "campo_livre",
+    "codigo_barras",
+]
+
+
+@pytest.mark.parametrize(
+    "entrada",
+    [
+        LINHA_FORMATADA,
+        LINHA_FORMATADA.replace("4 1137", "9 1137"),  # DV geral errado
+        LINHA_FORMATADA.replace(".", "")[:-1] + "a",
+        "12345",
+        "",
+        None,
+    ],
+)
+def test_propriedades_iguais_ao_digitavel(entrada):
+    """Testa que as propriedades coincidem com as do Digitavel"""
+    linha = LinhaDigitavel(entrada)
+    digitavel = Digitavel(entrada)
+
+    assert linha.valor == digitavel.valor
+    assert linha.validar() == digitavel.validar()
+    for propriedade in PROPRIEDADES:
+        assert getattr(linha, propriedade) == getattr(digitavel, propriedade)
+
+
+def test_imutavel_e_sem_dict():
+    """Testa que o valor é imutável e não possui __dict__"""
+    linha = LinhaDigitavel(LINHA_FORMATADA)
+
+    assert not hasattr(linha, "__dict__")
+    with pytest.raises(AttributeError):
+        linha.valor = "0" * 47
+    with pytest.raises(AttributeError):
+        del linha.valor
+
+
+def test_campos_derivados_em_cache():
+    """Testa que os campos derivados são calculados uma única vez"""
+    linha = LinhaDigitavel(LINHA_FORMATADA)
+
+    assert linha.codigo_barras is linha.codigo_barras
+    assert linha.data_vencimento is linha.data_vencimento
+
+
+def test_igualdade_e_hash():
+    """Testa igualdade por valor normalizado"""
+    formatada = LinhaDigitavel(LINHA_FORMATADA)
+    normalizada = LinhaDigitavel(LINHA_FORMATADA.replace(".", "").replace(" ", ""))
+
+    assert formatada == normalizada
+    assert len({formatada, normalizada}) == 1
+    assert str(formatada) == normalizada.valor
+
+
+def test_validar_campos_ignora_dv_geral():
+    """Testa que validar_campos() confere só os DVs dos campos"""
+    dv_geral_errado = LinhaDigitavel(LINHA_FORMATADA.replace("4 1137", "9 1137"))
+
+    assert not dv_geral_errado.validar()
+    assert dv_geral_errado.validar_campos()
+    assert LinhaDigitavel(LINHA_FORMATADA).validar()
+
+
+@pytest.mark.parametrize("entrada", ["²" * 47, "²" * 44, "٣" * 47])
+def test_digitos_nao_ascii_sao_invalidos(entrada):
+    """Testa que dígitos Unicode não ASCII invalidam a linha sem exceção"""
+    linha = LinhaDigitavel(entrada)
+
+    assert not linha.validar()
+    assert not linha.validar_campos()
+    assert not linha.codigo_barras
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Testes da localização da linha digitável no texto extraído
+"""
+
+from ..parser import BoletoParser
+from ..parser.extractors import DadosExtrasExtractor, InformacoesBancariasExtractor
+from ..parser.localizador import (
+    COMPLETA,
+    DVS_CAMPOS,
+    INVALIDA,
+    candidatos,
+    localizar_linha,
+    localizar_linhas,
+    pontuar,
+)
+
+LINHA = "03399161400700000191281556001014411370000038936"
+CODIGO_BARRAS = "03394113700000389369161407000001918155600101"
+# DVs dos campos corretos, DV geral (posição 33) errado
+LINHA_DV_GERAL_ERRADO = LINHA[:32] + "5" + LINHA[33:]
+
+
+def test_candidatos_com_separadores_e_codigo_barras():
+    """Testa linhas com pontos e espaços e códigos de barras de 44 dígitos"""
+    texto = (
+        "Nosso número 12345678\n"
+        "001-9 03399.16140 07000.001912 81556.001014 4 11370000038936\n"
+        f"Código de barras: {CODIGO_BARRAS}\n"
+        f"Conta 1234 {'9' * 44}\n"
+    )
+    encontrados = [linha for _, linha in candidatos(texto)]
+    assert encontrados == [LINHA, LINHA]
+
+
+def test_pontuacao_pelos_dvs():
+    """Testa a pontuação de linhas válidas, parciais e inválidas"""
+    assert pontuar(LINHA) == COMPLETA
+    assert pontuar(LINHA_DV_GERAL_ERRADO) == DVS_CAMPOS
+    assert pontuar(LINHA[:9] + "9" + LINHA[10:]) == 0
+
+
+def test_localizar_prefere_linha_completa():
+    """Testa que a linha com todos os DVs corretos vence, mesmo vindo depois"""
+    invalida = "1" * 47
+    texto = f"{invalida}\n{LINHA_DV_GERAL_ERRADO}\nrecibo\n{LINHA}\n{LINHA}"
+
+    assert localizar_linhas(texto) == [
+        (invalida, INVALIDA),
+        (LINHA_DV_GERAL_ERRADO, DVS_CAMPOS),
+        (LINHA, COMPLETA),
+    ]
+    assert localizar_linha(texto) == (LINHA, COMPLETA)
+    assert localizar_linha(f"{invalida}\n{LINHA_DV_GERAL_ERRADO}") == (
+        LINHA_DV_GERAL_ERRADO,
+        DVS_CAMPOS,
+    )
+    assert localizar_linha("sem código") is None
+
+
+def test_linha_quebrada_entre_linhas_e_espacamento_irregular():
+    """Testa linhas quebradas pelo pdftotext e com espaçamento irregular"""
+    quebrada = (
+        "Nosso Número\n12345678\n"
+        "03399.16140  07000.001912\n81556.001014   4\n11370000038936\nPagador"
+    )
+    espacada = "0339 9.16140 070 00.0019 12 81556 .001014 4 1137 0000038936"
+
+    assert localizar_linha(quebrada) == (LINHA, COMPLETA)
+    assert localizar_linha(espacada) == (LINHA, COMPLETA)
+
+
+def test_numeros_entre_linhas_exigem_dvs():
+    """Testa que cadeias atravessando linhas só valem com DVs corretos"""
+    tabela = "\n".join(["1234567890 12345678901"] * 3)
+    assert list(candidatos(tabela)) == []
+
+
+def test_todas_as_linhas_em_uma_passada():
+    """Testa um carnê com várias linhas digitáveis distintas"""
+    outra = "03391111141111111111511111111115516320000001000"
+    texto = f"Parcela 1\n{LINHA}\nParcela 2\n{outra[:24]}\n{outra[24:]}\n{LINHA}"
+
+    assert localizar_linhas(texto) == [(LINHA, COMPLETA), (outra, COMPLETA)]
+
+
+def test_extratores_usam_linha_localizada():
+    """Testa código de barras e dados extras a partir da linha localizada"""
+    texto = (
+        "BANCO SANTANDER S. A. 033-7\n"
+        "033991614.0 0700000191.2 8155600101.4 4 11370000038936\n"
+        "Vencimento: 09/07/2025\n"
+        "03399.16140 07000.001912\n81556.001014 4 11370000038936\n"
+    )
+    dados = BoletoParser().parse_texto(
+        texto, fields=["informacoes_bancarias", "dados_extras"]
+    )
+
+    assert dados.informacoes_bancarias.codigo_barras == CODIGO_BARRAS
+    assert dados.dados_extras["linha_digitavel"] == LINHA
+    assert dados.dados_extras["codigo_barras_digitavel"] == CODIGO_BARRAS
+
+
+def test_linha_com_dv_errado_na_propria_linha():
+    """Testa que a linha sozinha no trecho vale pelo formato, com DV errado"""
+    errada = LINHA[:31] + "5" + LINHA[32:]  # DV do campo 3 errado
+    texto = "BANCO 033-7  03399.16140 07000.001912 81556.001015 4 11370000038936\n"
+
+    assert localizar_linhas(texto) == [(errada, INVALIDA)]
+    assert localizar_linha(texto) == (errada, INVALIDA)
+    assert localizar_linha(f"{texto}{LINHA_DV_GERAL_ERRADO}") == (
+        LINHA_DV_GERAL_ERRADO,
+        DVS_CAMPOS,
+    )
+
+    dados = BoletoParser().parse_texto(
+        texto, fields=["informacoes_bancarias", "dados_extras"]
+    )
+    assert dados.informacoes_bancarias.codigo_barras == CODIGO_BARRAS
+    assert dados.dados_extras["linha_digitavel"] == errada
+
+
+def test_formato_dos_campos_de_codigo():
+    """Testa o formato dos campos de código gerados pelos extratores"""
+    texto = "Recibo\n03399.16140 07000.001912 81556.001014 4 11370000038936\n"
+
+    bancarias = InformacoesBancariasExtractor(texto).extrair()
+    extras = DadosExtrasExtractor(texto).extrair()
+
+    # Código de barras: 44 dígitos; linha digitável: 47 dígitos, sem separadores
+    assert bancarias.codigo_barras == CODIGO_BARRAS
+    assert extras["codigo_barras_digitavel"] == CODIGO_BARRAS
+    assert extras["linha_digitavel"] == LINHA
+    assert "codigo_barras" not in extras
+
+    vazio = InformacoesBancariasExtractor("sem código").extrair()
+    assert vazio.codigo_barras == ""
+    assert "linha_digitavel" not in DadosExtrasExtractor("sem código").extrair()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Testes do processamento em lote (prod parse-batch)
+"""
+
+import csv
+import json
+
+from typer.testing import CliRunner
+
+from ..cli.main import app
+from ..parser.lote import coletar_arquivos
+
+
+def _preparar_lote(diretorio, pdf_boleto):
+    """Cria dois PDFs válidos e um arquivo corrompido"""
+    (diretorio / "sub").mkdir()
+    (diretorio / "a.pdf").write_bytes(pdf_boleto)
+    (diretorio / "sub" / "b.pdf").write_bytes(pdf_boleto)
+    (diretorio / "corrompido.pdf").write_bytes(b"nao e pdf")
+    (diretorio / "ignorado.txt").write_text("x")
+
+
+def test_coletar_arquivos(tmp_path, pdf_boleto):
+    """Testa diretório, glob e manifesto"""
+    _preparar_lote(tmp_path, pdf_boleto)
+    manifesto = tmp_path / "lista.txt"
+    manifesto.write_text(f"# comentário\n{tmp_path / 'a.pdf'}\n\n")
+
+    assert len(coletar_arquivos(tmp_path)) == 3
+    assert coletar_arquivos(f"{tmp_path}/**/b*.pdf") == [str(tmp_path / "sub/b.pdf")]
+    assert coletar_arquivos(manifesto, manifesto=True) == [str(tmp_path / "a.pdf")]
+
+
+def test_parse_batch_jsonl_com_checkpoint(tmp_path, pdf_boleto):
+    """Testa o lote em JSONL e a retomada pelo checkpoint"""
+    _preparar_lote(tmp_path, pdf_boleto)
+    saida = tmp_path / "saida.jsonl"
+    checkpoint = tmp_path / "checkpoint.txt"
+    argumentos = ["prod", "parse-batch", str(tmp_path), "-o", str(saida)]
+    argumentos += ["--checkpoint", str(checkpoint), "-w", "2"]
+
+    resultado = CliRunner().invoke(app, argumentos)
+    assert resultado.exit_code == 0, resultado.output
+
+    registros = [json.loads(linha) for linha in saida.read_text().splitlines()]
+    assert len(registros) == 3
+    assert sum(r["sucesso"] for r in registros) == 2
+    valido = next(r for r in registros if r["sucesso"])
+    assert valido["dados"]["valores"]["valor_documento"] == 389.36
+
+    # Segunda execução: nada a fazer, saída preservada
+    resultado = CliRunner().invoke(app, argumentos)
+    assert "Nenhum arquivo a processar" in resultado.output
+    assert len(saida.read_text().splitlines()) == 3
+
+
+def test_parse_batch_parquet_sem_checkpoint(tmp_path, pdf_boleto):
+    """Testa que o checkpoint é recusado com saída parquet, que não é retomável"""
+    (tmp_path / "a.pdf").write_bytes(pdf_boleto)
+    saida = tmp_path / "saida.parquet"
+    argumentos = ["prod", "parse-batch", str(tmp_path), "-o", str(saida)]
+    argumentos += ["--checkpoint", str(tmp_path / "checkpoint.txt")]
+
+    resultado = CliRunner().invoke(app, argumentos)
+    assert resultado.exit_code == 1
+    assert "--checkpoint" in resultado.output
+    assert not saida.exists()
+
+
+def test_parse_batch_csv(tmp_path, pdf_boleto):
+    """Testa a saída CSV com colunas achatadas"""
+    (tmp_path / "a.pdf").write_bytes(pdf_boleto)
+    saida = tmp_path / "saida.csv"
+
+    resultado = CliRunner().invoke(
+        app, ["prod", "parse-batch", str(tmp_path), "-o", str(saida), "-w", "1"]
+    )
+    assert resultado.exit_code == 0, resultado.output
+
+    with open(saida, newline="", encoding="utf-8") as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    assert len(linhas) == 1
+    assert linhas[0]["valores.valor_documento"] == "389.36"
+    assert linhas[0]["pagador.nome"] == "FULANO DE TAL"
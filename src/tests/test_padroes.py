@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Testes do registro central de padrões regex
+"""
+
+import re
+
+import pytest
+
+from ..parser.padroes import RegistroPadroes, registro, rotulo_literal
+
+
+def test_compilacao_preguicosa_e_estatisticas():
+    """Testa que o padrão é compilado uma vez e as buscas são contabilizadas"""
+    padroes = RegistroPadroes(medir_tempo=True)
+    padroes.registrar("teste.numero", r"Número:\s*(\d+)")
+    assert "teste.numero" in padroes
+
+    compilado = padroes.obter("teste.numero")
+    assert padroes.obter("teste.numero") is compilado
+
+    assert padroes.buscar("teste.numero", "Número: 42").group(1) == "42"
+    assert padroes.buscar("teste.numero", "sem número") is None
+
+    estatistica = padroes.estatisticas()["teste.numero"]
+    assert estatistica["buscas"] == 2
+    assert estatistica["busca_s"] >= 0
+    assert estatistica["compilacao_s"] > 0
+
+    padroes.zerar_estatisticas()
+    assert padroes.estatisticas()["teste.numero"]["buscas"] == 0
+
+
+def test_medicao_desligada_por_padrao(monkeypatch):
+    """Testa que as buscas só são medidas quando habilitado"""
+    monkeypatch.delenv("BOLETO_MEDIR_PADROES", raising=False)
+    padroes = RegistroPadroes()
+    padroes.registrar("teste.numero", r"Número:\s*(\d+)")
+    padroes.buscar("teste.numero", "Número: 42")
+    assert padroes.estatisticas()["teste.numero"]["buscas"] == 0
+
+    monkeypatch.setenv("BOLETO_MEDIR_PADROES", "1")
+    assert RegistroPadroes().medir_tempo
+
+
+def test_registro_duplicado():
+    """Testa que uma chave não pode ser reutilizada com outro padrão"""
+    padroes = RegistroPadroes()
+    padroes.registrar("campo", r"a")
+    padroes.registrar("campo", r"a")
+    with pytest.raises(ValueError):
+        padroes.registrar("campo", r"b", re.IGNORECASE)
+
+
+def test_registro_padrao_compila_todos():
+    """Testa que todos os padrões dos extratores compilam"""
+    registro.compilar_todos()
+    assert "valores.documento" in registro
+    assert "extras.protocolo" in registro
+    assert registro.obter("extras.protocolo").flags & re.IGNORECASE
+
+
+@pytest.mark.parametrize(
+    "padrao, rotulo",
+    [
+        (r"Protocolo\s*:", "Protocolo"),
+        (r"Abc*\d", "Ab"),
+        (r"Abc?\d", "Ab"),
+        (r"Abc{0,2}\d", "Ab"),
+        (r"Abc+\d", "Abc"),
+        (r"A?bc", ""),
+        (r"\d+", ""),
+    ],
+)
+def test_rotulo_literal_sem_caractere_opcional(padrao, rotulo):
+    """Testa que o caractere tornado opcional por um quantificador fica fora do rótulo"""
+    assert rotulo_literal(padrao) == rotulo
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Testes das formas de entrada do BoletoParser (caminho, bytes e file-like)
+"""
+
+import io
+
+import pytest
+
+from ..parser import BoletoParser, CacheResultados, PoolExtracaoTexto
+
+
+@pytest.fixture
+def parser():
+    """Parser com extração em processo, sem fallback para pdftotext"""
+    pool = PoolExtracaoTexto("pypdf2", max_workers=1, fallback_pdftotext=False)
+    yield BoletoParser(extrator=pool)
+    pool.fechar()
+
+
+def test_parse_bytes_filelike_e_caminho(parser, pdf_boleto, tmp_path):
+    """Testa que caminho, bytes e file-like produzem o mesmo resultado"""
+    arquivo = tmp_path / "boleto.pdf"
+    arquivo.write_bytes(pdf_boleto)
+
+    por_caminho = parser.parse(str(arquivo))
+    por_bytes = parser.parse(pdf_boleto)
+    por_stream = parser.parse(io.BytesIO(pdf_boleto))
+
+    assert por_bytes == por_caminho == por_stream
+    assert por_bytes.valores.valor_documento == 389.36
+    assert por_bytes.pagador.nome == "FULANO DE TAL"
+
+
+def test_extrair_texto_de_bytes(parser, pdf_boleto):
+    """Testa extração de texto direto da memória"""
+    texto = parser.extrair_texto_pdf(bytearray(pdf_boleto))
+    assert "Nosso Número 12345678" in texto
+
+
+def test_extrair_texto_selecao_de_paginas(parser, gerar_pdf):
+    """Testa que o parser converte só as páginas escolhidas"""
+    pdf = gerar_pdf([["Extrato de conta"], ["Vencimento: 10/07/2025"]])
+    ultima = BoletoParser(extrator=parser.extrator, paginas="ultima")
+
+    assert "Extrato" in parser.extrair_texto_pdf(pdf)
+    texto = ultima.extrair_texto_pdf(pdf)
+    assert "Vencimento: 10/07/2025" in texto
+    assert "Extrato" not in texto
+
+
+def test_cache_separado_por_selecao_de_paginas(parser, pdf_boleto):
+    """Testa que seleções de páginas diferentes não compartilham o cache"""
+    cache = CacheResultados()
+    completo = BoletoParser(extrator=parser.extrator, cache=cache)
+    primeira = BoletoParser(extrator=parser.extrator, cache=cache, paginas="1")
+
+    completo.parse(pdf_boleto)
+    primeira.parse(pdf_boleto)
+    assert cache.estatisticas()["itens_memoria"] == 2
+
+
+def test_parse_pagamento(parser, gerar_pdf):
+    """Testa o modo pagamento em um extrato com o boleto na última página"""
+    pdf = gerar_pdf(
+        [
+            ["Extrato de conta", "Saldo 1.234,56"],
+            ["Lançamentos do período"],
+            [
+                "Ficha de compensação",
+                "03399.16140 07000.001912 81556.001014 4 11370000038936",
+            ],
+        ]
+    )
+    dados = parser.parse_pagamento(pdf)
+
+    assert dados.banco == "033"
+    assert dados.nome_banco == "Santander"
+    assert dados.valor == 389.36
+    assert dados.linha_digitavel == "03399161400700000191281556001014411370000038936"
+    assert dados.codigo_barras.startswith("0339411370000038936")
+    assert dados.dv_geral_valido
+
+    with pytest.raises(ValueError, match="Linha digitável"):
+        parser.parse_pagamento(gerar_pdf([["Extrato de conta"]]))
+
+
+def test_parse_bytes_nao_pdf(parser):
+    """Testa que bytes que não são PDF são rejeitados"""
+    with pytest.raises(ValueError, match="não é um PDF"):
+        parser.parse(b"GIF89a...")
+
+
+def test_parse_arquivo_inexistente(parser, tmp_path):
+    """Testa erro para caminho inexistente"""
+    with pytest.raises(FileNotFoundError):
+        parser.parse(str(tmp_path / "inexistente.pdf"))
+
+
+def test_parser_compartilhado_entre_threads(parser, gerar_pdf):
+    """Testa que uma única instância atende várias threads sem misturar dados"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    pdfs = {
+        f"{i:02d}/07/2025": gerar_pdf(
+            [[f"Beneficiário EMPRESA {i}", f"Vencimento: {i:02d}/07/2025"]]
+        )
+        for i in range(1, 9)
+    }
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resultados = dict(zip(pdfs, executor.map(parser.parse, pdfs.values())))
+
+    for vencimento, dados in resultados.items():
+        assert dados.vencimento == vencimento
+        assert vencimento in dados.texto_extraido
+    assert not hasattr(parser, "texto_extraido")
+
+
+def test_parse_texto(parser):
+    """Testa o parsing a partir de texto já extraído"""
+    dados = parser.parse_texto("Beneficiário X\nVencimento: 10/10/2025")
+    assert dados.tipo_boleto == "bancario"
+    assert dados.vencimento == "10/10/2025"
+
+
+@pytest.mark.parametrize("workers, ordered", [(1, False), (4, True), (4, False)])
+def test_parse_many(parser, gerar_pdf, workers, ordered):
+    """Testa resultados e erros por item, em ordem ou por término"""
+
+    origens = [
+        gerar_pdf([[f"Beneficiário EMPRESA {i}", f"Vencimento: {i:02d}/07/2025"]])
+        for i in range(1, 7)
+    ]
+    origens.insert(3, b"nao e pdf")
+
+    resultados = list(
+        parser.parse_many(origens, workers=workers, ordered=ordered, max_pendentes=2)
+    )
+
+    assert len(resultados) == len(origens)
+    if ordered or workers == 1:
+        assert [origem for origem, _ in resultados] == origens
+    erros = [r for _, r in resultados if isinstance(r, Exception)]
+    assert len(erros) == 1 and isinstance(erros[0], ValueError)
+    for origem, dados in resultados:
+        if origem != b"nao e pdf":
+            assert dados.vencimento in dados.texto_extraido
+
+
+def test_parse_many_sob_demanda(parser, pdf_boleto):
+    """Testa que as origens só são consumidas conforme o iterador avança"""
+    consumidas = []
+
+    def origens():
+        for i in range(100):
+            consumidas.append(i)
+            yield pdf_boleto
+
+    iterador = parser.parse_many(origens(), workers=2, max_pendentes=3)
+    next(iterador)
+    iterador.close()
+    assert len(consumidas) <= 4
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Testes da extração sob demanda (BoletoLazy) e da seleção de campos
+"""
+
+import pytest
+
+from ..parser import BoletoDataParcial, BoletoLazy, BoletoParser
+
+TEXTO = """Beneficiário EMPRESA EXEMPLO LTDA - 12.345.678/0001-90
+Vencimento: 09/07/2025
+Valor do documento R$ 389,36
+Protocolo: 5544"""
+
+
+def test_secoes_extraidas_no_primeiro_acesso():
+    """Testa que cada seção só é extraída quando acessada"""
+    resultado = BoletoLazy(TEXTO, "bancario")
+    assert resultado.extraidos == ()
+
+    assert resultado.valores.valor_documento == 389.36
+    assert resultado.extraidos == ("valores",)
+    assert resultado.valores is resultado.valores
+
+    assert resultado.model_dump(["vencimento"]) == {"vencimento": "09/07/2025"}
+    assert "dados_extras" not in resultado.extraidos
+    assert resultado.aluno is None
+
+
+def test_parse_com_campos(pdf_boleto):
+    """Testa parse() com seleção de campos e campo desconhecido"""
+    parser = BoletoParser()
+    completo = parser.parse_texto(TEXTO)
+    parcial = parser.parse_texto(TEXTO, fields="valores, vencimento")
+
+    assert parcial.valores == completo.valores
+    assert parcial.vencimento == completo.vencimento
+    assert "beneficiario" not in parcial.model_fields_set
+    assert isinstance(parcial, BoletoDataParcial)
+    assert BoletoLazy(TEXTO, "bancario").to_boleto_data() == completo
+
+    with pytest.raises(ValueError, match="inexistente"):
+        parser.parse(pdf_boleto, fields=["valores", "inexistente"])
+
+
+def test_parse_parcial_sem_valores_padrao():
+    """Testa que o resultado parcial não inventa as seções não pedidas"""
+    parser = BoletoParser()
+    completo = parser.parse_texto(TEXTO)
+    parcial = parser.parse_texto(TEXTO, fields="valores")
+
+    assert completo.tipo_boleto == "bancario"
+    assert parcial.tipo_boleto == completo.tipo_boleto
+    assert parcial.model_dump() == {
+        "valores": completo.valores.model_dump(),
+        "tipo_boleto": "bancario",
+    }
+    assert not hasattr(parcial, "beneficiario")
+    assert not hasattr(parcial, "dados_extras")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Testes dos escritores incrementais de resultados
+"""
+
+import json
+import sys
+
+import pytest
+
+from ..parser import BoletoParser
+from ..parser.saida import (
+    Projecao,
+    criar_escritor,
+    criar_registro,
+    gravar_resultados,
+)
+
+TEXTO = "Vencimento: 10/01/2025\nValor do documento R$ 389,36\n"
+
+
+def _boleto():
+    return BoletoParser().parse_texto(TEXTO)
+
+
+def test_projecao():
+    """Testa inclusão por seção/subcampo e exclusão"""
+    dados = _boleto()
+
+    sem_texto = Projecao(excluir="texto_extraido").aplicar_modelo(dados)
+    assert "texto_extraido" not in sem_texto
+    assert sem_texto["valores"]["valor_documento"] == 389.36
+
+    projecao = Projecao(incluir="vencimento,valores.valor_documento")
+    assert projecao.aplicar_modelo(dados) == {
+        "vencimento": "10/01/2025",
+        "valores": {"valor_documento": 389.36},
+    }
+    assert projecao.aplicar(dados.model_dump()) == projecao.aplicar_modelo(dados)
+    assert projecao.colunas() == ["vencimento", "valores.valor_documento"]
+
+    with pytest.raises(ValueError, match="Campos desconhecidos"):
+        Projecao(incluir="valores.inexistente")
+
+
+def test_buffer_e_ao_gravar(tmp_path):
+    """Testa que os registros só são gravados (e notificados) com o buffer cheio"""
+    saida = tmp_path / "saida.jsonl"
+    gravados = []
+
+    escritor = criar_escritor(
+        saida,
+        max_buffer=2,
+        fsync="buffer",
+        ao_gravar=lambda registros: gravados.extend(r["arquivo"] for r in registros),
+    )
+    escritor.escrever(criar_registro("a.pdf", _boleto()))
+    assert gravados == [] and saida.read_text() == ""
+
+    escritor.escrever(criar_registro("b.pdf", erro="falhou"))
+    assert gravados == ["a.pdf", "b.pdf"]
+    assert len(saida.read_text().splitlines()) == 2
+
+    escritor.escrever(criar_registro("c.pdf", _boleto()))
+    escritor.fechar()
+    assert gravados == ["a.pdf", "b.pdf", "c.pdf"]
+    assert escritor.escritos == 3
+
+
+def test_gravar_resultados_com_projecao(tmp_path):
+    """Testa a API de biblioteca consumindo um iterador"""
+    saida = tmp_path / "saida.csv"
+    registros = (criar_registro(f"{i}.pdf", _boleto()) for i in range(5))
+
+    total = gravar_resultados(
+        registros, saida, projecao=Projecao(excluir="texto_extraido,dados_extras")
+    )
+
+    assert total == 5
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert len(linhas) == 6
+    assert "texto_extraido" not in linhas[0]
+    assert "valores.valor_documento" in linhas[0]
+
+
+def test_parquet_sem_pyarrow(tmp_path, monkeypatch):
+    """Testa a mensagem quando o pacote opcional não está instalado"""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ValueError, match="pyarrow"):
+        criar_escritor(tmp_path / "saida.parquet")
+
+
+def test_formato_e_fsync_invalidos(tmp_path):
+    """Testa a validação das opções"""
+    with pytest.raises(ValueError, match="não suportado"):
+        criar_escritor(tmp_path / "saida.xml")
+    with pytest.raises(ValueError, match="fsync"):
+        criar_escritor(tmp_path / "saida.jsonl", fsync="sempre")
+    assert json.loads(json.dumps(criar_registro("x", erro="e")))["sucesso"] is False
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Testes da segmentação de PDFs com vários boletos
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.digitavel import Digitavel
+from ..parser import BoletoParser, PoolExtracaoTexto, segmentar
+from .auxiliares import gerar_pdf
+
+
+def _ficha(numero, valor):
+    linha = Digitavel.gerar_digitavel_valido(valor=valor)
+    # Na ficha de compensação a linha digitável fica no topo, ao lado do banco
+    return [
+        "001-9 "
+        + linha[:10]
+        + " "
+        + linha[10:21]
+        + " "
+        + linha[21:32]
+        + " "
+        + linha[32:],
+        f"Beneficiário ESCOLA EXEMPLO - parcela {numero}",
+        f"Vencimento: {numero:02d}/07/2025",
+        f"Valor do documento R$ {valor:.2f}".replace(".", ","),
+    ]
+
+
+def test_segmentar_por_pagina_e_na_mesma_pagina():
+    """Testa cortes por página e entre boletos na mesma página"""
+    recibo = ["Recibo do Pagador"]
+    paginas = [
+        "\n".join(recibo + _ficha(1, 10.0)),
+        "\n".join(_ficha(2, 20.0) + _ficha(3, 30.0)),
+    ]
+
+    segmentos = segmentar(paginas)
+
+    assert len(segmentos) == 3
+    assert segmentos[0].texto.startswith("Recibo do Pagador")
+    assert [s.paginas for s in segmentos] == [(0, 0), (1, 1), (1, 1)]
+    assert "parcela 3" in segmentos[2].texto
+    assert "parcela 3" not in segmentos[1].texto
+    assert "".join(s.texto for s in segmentos) == "\n".join(paginas)
+
+
+def test_segmentar_sem_linha_digitavel():
+    """Testa que um documento sem âncoras vira um único segmento"""
+    segmentos = segmentar(["Vencimento: 01/01/2025", "página 2"])
+    assert len(segmentos) == 1
+    assert segmentos[0].linha_digitavel is None
+
+
+def test_parse_multiplos():
+    """Testa o parsing de um carnê, com e sem executor"""
+    pdf = gerar_pdf([_ficha(i, 10.0 * i) for i in range(1, 5)])
+    pool = PoolExtracaoTexto("pypdf2", max_workers=1, fallback_pdftotext=False)
+    parser = BoletoParser(extrator=pool)
+    try:
+        boletos = parser.parse_multiplos(pdf)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            paralelo = parser.parse_multiplos(pdf, executor=executor)
+    finally:
+        pool.fechar()
+
+    assert [b.vencimento for b in boletos] == [f"0{i}/07/2025" for i in range(1, 5)]
+    assert [b.valores.valor_documento for b in boletos] == [10.0, 20.0, 30.0, 40.0]
+    assert paralelo == boletos
+
+
+def test_parse_multiplos_paralelo_por_padrao(mocker):
+    """Testa que, sem executor, os segmentos são processados em paralelo"""
+    pdf = gerar_pdf([_ficha(i, 10.0 * i) for i in range(1, 3)])
+    pool = PoolExtracaoTexto("pypdf2", max_workers=1, fallback_pdftotext=False)
+    parser = BoletoParser(extrator=pool)
+    # Cada segmento espera o outro: em sequência, a barreira estouraria
+    barreira = threading.Barrier(2, timeout=5)
+    original = parser.parse_texto
+
+    def parse_texto(texto, campos=None):
+        barreira.wait()
+        return original(texto, campos)
+
+    mocker.patch.object(parser, "parse_texto", side_effect=parse_texto)
+    try:
+        boletos = parser.parse_multiplos(pdf)
+    finally:
+        pool.fechar()
+
+    assert [b.vencimento for b in boletos] == ["01/07/2025", "02/07/2025"]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Testes da detecção de tipo de arquivo em processo
+"""
+
+import pytest
+
+from ..parser import BoletoParser
+from ..parser.tipo_arquivo import detectar_tipo, detectar_tipo_arquivo
+
+
+def test_detecta_pdf_em_memoria(pdf_boleto):
+    """Testa detecção de PDF pelo cabeçalho e marcador %%EOF"""
+    tipo = detectar_tipo(pdf_boleto)
+
+    assert tipo.is_pdf
+    assert tipo.mime == "application/pdf"
+    assert tipo.versao_pdf == "1.4"
+    assert tipo.possui_eof
+    assert "PDF" in str(tipo)
+
+
+def test_detecta_pdf_truncado():
+    """Testa PDF sem o marcador final"""
+    tipo = detectar_tipo(b"%PDF-1.7\n1 0 obj\n")
+    assert tipo.is_pdf
+    assert not tipo.possui_eof
+
+
+@pytest.mark.parametrize(
+    "conteudo, mime",
+    [
+        (b"\x89PNG\r\n\x1a\n0000", "image/png"),
+        (b"\xff\xd8\xff\xe0", "image/jpeg"),
+        (b"texto qualquer", "application/octet-stream"),
+        (b"", "application/x-empty"),
+    ],
+)
+def test_detecta_nao_pdf(conteudo, mime):
+    """Testa arquivos que não são PDF"""
+    tipo = detectar_tipo(conteudo)
+    assert not tipo.is_pdf
+    assert tipo.mime == mime
+
+
+def test_detecta_arquivo_em_disco(pdf_boleto, tmp_path):
+    """Testa detecção lendo apenas início e final do arquivo"""
+    arquivo = tmp_path / "boleto.pdf"
+    arquivo.write_bytes(pdf_boleto)
+    assert detectar_tipo_arquivo(arquivo) == detectar_tipo(pdf_boleto)
+
+
+def test_parser_rejeita_arquivo_nao_pdf(tmp_path):
+    """Testa que o parser rejeita arquivos que não são PDF"""
+    arquivo = tmp_path / "falso.pdf"
+    arquivo.write_bytes(b"nao sou pdf")
+
+    with pytest.raises(ValueError, match="não é um PDF"):
+        BoletoParser().parse(str(arquivo))
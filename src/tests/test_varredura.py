@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Testes da varredura de campos em uma única passada
+"""
+
+import re
+
+from ..parser.extractors import DadosExtrasExtractor
+from ..parser.padroes import PADROES_EXTRAS
+from ..parser.varredura import VarredorCampos
+
+TEXTO = """Protocolo: 998877
+Código do Responsável: 123
+Responsável: MARIA SILVA
+Espécie Doc
+DM
+Espécie R$
+Nosso Número 12345678
+Valor Cobrado R$ 10,50
+Telefone do campus: (11) 5555-0000
+033991614.0 0700000191.2 8155600101.4 4 11370000038936
+protocolo 111
+"""
+
+
+def test_varredura_equivale_a_buscas_individuais():
+    """Testa que a varredura encontra o mesmo que um re.search por campo"""
+    padroes = {c: re.compile(p, re.IGNORECASE) for c, p in PADROES_EXTRAS.items()}
+    esperado = {}
+    for campo, padrao in padroes.items():
+        match = padrao.search(TEXTO)
+        if match:
+            esperado[campo] = (match.start(), match.group(0))
+
+    achados = list(VarredorCampos(padroes).varrer(TEXTO))
+    obtido = {campo: (m.start(), m.group(0)) for campo, m in achados}
+
+    assert obtido == esperado
+    # Rótulo sobreposto e ordem do documento
+    assert obtido["responsavel"][1].startswith("Responsável")
+    posicoes = [m.start() for _, m in achados]
+    assert posicoes == sorted(posicoes)
+
+
+def test_dados_extras():
+    """Testa o extrator de dados extras com a varredura"""
+    dados = DadosExtrasExtractor(TEXTO).extrair()
+    assert dados["protocolo"] == "998877"
+    assert dados["codigo_responsavel"] == "123"
+    assert dados["especie_doc"] == "DM"
+    assert dados["valor_cobrado"] == "10,50"
+    assert dados["info_telefone_do_campus"] == "(11) 5555-0000"
+
+
+def test_varredura_rotulo_com_quantificador():
+    """Testa campos cujo rótulo termina em caractere opcional"""
+    padroes = {
+        "numero": re.compile(r"Nº?\s*(\d+)"),
+        "parcela": re.compile(r"Parcelas?\s*(\d+)"),
+    }
+    obtido = VarredorCampos(padroes).extrair("N 123 - Parcela 2")
+
+    assert obtido["numero"].group(1) == "123"
+    assert obtido["parcela"].group(1) == "2"
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Testes da conversão de fator de vencimento para data
+"""
+
+from datetime import date
+
+from ..utils.vencimento import (
+    fator_para_data,
+    fator_para_data_br,
+    fator_para_data_iso,
+    tabela_fator_vencimento,
+)
+
+REFERENCIA_2020 = date(2020, 1, 1)
+REFERENCIA_2026 = date(2026, 1, 1)
+
+
+def test_fator_antes_do_reinicio():
+    """Testa fatores do primeiro ciclo (base 07/10/1997)"""
+    assert fator_para_data(9999, REFERENCIA_2020) == date(2025, 2, 21)
+    assert fator_para_data_br("8000", REFERENCIA_2020) == "02/09/2019"
+    assert fator_para_data(500, REFERENCIA_2020) == date(1999, 2, 19)
+
+
+def test_reinicio_fevereiro_2025():
+    """Testa o reinício do fator em 1000 a partir de 22/02/2025"""
+    assert fator_para_data(1000, REFERENCIA_2026) == date(2025, 2, 22)
+    assert fator_para_data_iso(1137, REFERENCIA_2026) == "2025-07-09"
+    assert fator_para_data_br(1137, REFERENCIA_2026) == "09/07/2025"
+    assert fator_para_data(9999, REFERENCIA_2026) == date(2025, 2, 21)
+
+
+def test_fatores_invalidos():
+    """Testa fator zero (sem vencimento) e valores inválidos"""
+    assert fator_para_data(0, REFERENCIA_2026) is None
+    assert fator_para_data_br("abcd", REFERENCIA_2026) is None
+    assert fator_para_data_iso(10000, REFERENCIA_2026) is None
+    assert fator_para_data(None, REFERENCIA_2026) is None
+
+
+def test_tabela_memoizada():
+    """Testa que a tabela é reutilizada para a mesma data de referência"""
+    tabela = tabela_fator_vencimento(REFERENCIA_2026)
+
+    assert tabela is tabela_fator_vencimento(REFERENCIA_2026)
+    assert len(tabela.datas) == 10000
+    assert tabela.br(1137) == "09/07/2025"
@@ -1,6 +1,6 @@
 # Utils Module - Utilitários do sistema
 
-from .dv import modulo_10, modulo_11
+from .dv import modulo_10, modulo_10_many, modulo_11, modulo_11_many
 from .logger import (
     get_logger,
     logger,
@@ -8,6 +8,13 @@ from .logger import (
     setup_logging,
     setup_production_logging,
 )
+from .vencimento import (
+    TabelaFatorVencimento,
+    fator_para_data,
+    fator_para_data_br,
+    fator_para_data_iso,
+    tabela_fator_vencimento,
+)
 
 __all__ = [
     "get_logger",
@@ -17,4 +24,11 @@ __all__ = [
     "logger",
     "modulo_10",
     "modulo_11",
+    "modulo_10_many",
+    "modulo_11_many",
+    "TabelaFatorVencimento",
+    "tabela_fator_vencimento",
+    "fator_para_data",
+    "fator_para_data_iso",
+    "fator_para_data_br",
 ]
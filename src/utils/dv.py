@@ -1,49 +1,193 @@
 """
 Utilitários para cálculo de dígitos verificadores (DV) Módulo 10 e Módulo 11.
+
+Os cálculos são feitos sobre os bytes ASCII do número, usando tabelas
+pré-computadas de "dígito ponderado" indexadas pelo próprio byte. Cada
+posição (contada da direita para a esquerda) usa a tabela do seu peso, de
+modo que a soma é feita com ``bytes.translate`` + ``sum`` sem nenhuma
+conversão ``str`` → ``int`` por dígito.
 """
 
+from array import array
+from typing import Iterable, List, Tuple, Union
+
+NumeroDV = Union[str, bytes, bytearray, memoryview]
+
+_ZERO = ord("0")
+
+
+def _tabela_ponderada(peso: int, reduzir: bool = False) -> bytes:
+    """
+    Monta a tabela de tradução byte → dígito ponderado para um peso.
+    Args:
+        peso: Peso aplicado ao dígito.
+        reduzir: Se True, soma os algarismos do produto (regra do Módulo 10).
+    Returns:
+        Tabela de 256 bytes para uso com ``bytes.translate``.
+    """
+    tabela = bytearray(256)
+    for digito in range(10):
+        resultado = digito * peso
+        if reduzir and resultado > 9:
+            resultado = resultado // 10 + resultado % 10
+        tabela[_ZERO + digito] = resultado
+    return bytes(tabela)
+
+
+# Módulo 10: pesos 2, 1, 2, 1... a partir da direita
+_MOD10_PESO_2 = _tabela_ponderada(2, reduzir=True)
+_MOD10_PESO_1 = _tabela_ponderada(1)
+
+# Módulo 11: pesos 2 a 9 (cíclicos) a partir da direita
+_MOD11_TABELAS = tuple(_tabela_ponderada(peso) for peso in range(2, 10))
+
+# DV do Módulo 10 e do Módulo 11 indexados pelo resto da soma
+_MOD10_DV = bytes((10 - resto) % 10 for resto in range(10))
+_MOD11_DV = bytes(
+    1 if resto == 0 else 0 if resto == 1 else 11 - resto for resto in range(11)
+)
+
+
+def _como_bytes(numero: NumeroDV) -> bytes:
+    """
+    Converte o número para bytes ASCII, validando que contém apenas dígitos.
+    Args:
+        numero: String ou buffer numérico.
+    Returns:
+        Bytes ASCII do número.
+    Raises:
+        ValueError: Se houver caracteres não numéricos.
+    """
+    dados = numero.encode("ascii") if isinstance(numero, str) else bytes(numero)
+    if dados and not dados.isdigit():
+        raise ValueError(f"Número contém caracteres não numéricos: {numero!r}")
+    return dados
+
+
+def _soma_modulo_10(dados: bytes) -> int:
+    """Soma ponderada do Módulo 10 sobre bytes ASCII já validados"""
+    return sum(dados[-1::-2].translate(_MOD10_PESO_2)) + sum(
+        dados[-2::-2].translate(_MOD10_PESO_1)
+    )
+
+
+def _soma_modulo_11(dados: bytes) -> int:
+    """Soma ponderada do Módulo 11 sobre bytes ASCII já validados"""
+    soma = 0
+    for deslocamento, tabela in enumerate(_MOD11_TABELAS):
+        soma += sum(dados[-1 - deslocamento :: -8].translate(tabela))
+    return soma
+
+
+def parcelas_modulo_10(tamanho: int) -> List[Tuple[int, ...]]:
+    """
+    Parcela de cada dígito na soma do Módulo 10, posição a posição.
+    Permite atualizar a soma pela diferença quando um dígito muda.
+    Args:
+        tamanho: Quantidade de dígitos do número.
+    Returns:
+        Para cada posição (da esquerda para a direita), as parcelas dos
+        dígitos 0 a 9.
+    """
+    tabelas = (_MOD10_PESO_2, _MOD10_PESO_1)
+    return [
+        tuple(tabelas[(tamanho - 1 - i) % 2][_ZERO : _ZERO + 10])
+        for i in range(tamanho)
+    ]
+
 
-def modulo_10(numero: str) -> int:
+def pesos_modulo_11(tamanho: int) -> List[int]:
+    """
+    Peso de cada posição na soma do Módulo 11.
+    Args:
+        tamanho: Quantidade de dígitos do número.
+    Returns:
+        Pesos da esquerda para a direita (2 a 9, cíclicos a partir da direita).
+    """
+    return [(tamanho - 1 - i) % 8 + 2 for i in range(tamanho)]
+
+
+def dv_soma_modulo_10(soma: int) -> int:
+    """DV do Módulo 10 a partir da soma ponderada (ver parcelas_modulo_10)"""
+    return _MOD10_DV[soma % 10]
+
+
+def dv_soma_modulo_11(soma: int) -> int:
+    """DV do Módulo 11 a partir da soma ponderada (ver pesos_modulo_11)"""
+    return _MOD11_DV[soma % 11]
+
+
+def modulo_10(numero: NumeroDV) -> int:
     """
     Calcula o dígito verificador usando Módulo 10.
     Args:
-        numero: String numérica.
+        numero: String numérica (ou bytes ASCII).
     Returns:
         Dígito verificador (0-9).
     """
-    numero_invertido = numero[::-1]
-    soma = 0
-    for i, digito in enumerate(numero_invertido):
-        peso = 2 if i % 2 == 0 else 1
-        resultado = int(digito) * peso
-        if resultado > 9:
-            resultado = sum(int(d) for d in str(resultado))
-        soma += resultado
-    dv = 10 - (soma % 10)
-    if dv == 10:
-        dv = 0
-    return dv
+    return _MOD10_DV[_soma_modulo_10(_como_bytes(numero)) % 10]
 
 
-def modulo_11(numero: str) -> int:
+def modulo_11(numero: NumeroDV) -> int:
     """
     Calcula o dígito verificador usando Módulo 11.
     Args:
-        numero: String numérica.
+        numero: String numérica (ou bytes ASCII).
     Returns:
         Dígito verificador (0-9 ou 1).
     """
-    numero_invertido = numero[::-1]
-    soma = 0
-    for i, digito in enumerate(numero_invertido):
-        peso = (i % 8) + 2  # Pesos de 2 a 9 (cíclicos)
-        resultado = int(digito) * peso
-        soma += resultado
-    resto = soma % 11
-    if resto == 0:
-        dv = 1
-    elif resto == 1:
-        dv = 0
-    else:
-        dv = 11 - resto
-    return dv
+    return _MOD11_DV[_soma_modulo_11(_como_bytes(numero)) % 11]
+
+
+def _iterar_numeros(
+    numeros: Union[Iterable[NumeroDV], bytes, bytearray, memoryview]
+) -> Iterable[NumeroDV]:
+    """
+    Normaliza a entrada dos cálculos em lote.
+
+    Buffers (bytes, bytearray, memoryview) são tratados como vários números
+    separados por espaço em branco ou quebra de linha.
+    """
+    if isinstance(numeros, (bytes, bytearray, memoryview)):
+        return bytes(numeros).split()
+    return numeros
+
+
+def modulo_10_many(
+    numeros: Union[Iterable[NumeroDV], bytes, bytearray, memoryview]
+) -> array:
+    """
+    Calcula o Módulo 10 de vários números de uma vez.
+    Args:
+        numeros: Lista de strings numéricas ou buffer com números separados
+            por espaço em branco/quebra de linha.
+    Returns:
+        ``array('B')`` com um DV por número, na mesma ordem da entrada.
+    """
+    return array(
+        "B",
+        [
+            _MOD10_DV[_soma_modulo_10(_como_bytes(numero)) % 10]
+            for numero in _iterar_numeros(numeros)
+        ],
+    )
+
+
+def modulo_11_many(
+    numeros: Union[Iterable[NumeroDV], bytes, bytearray, memoryview]
+) -> array:
+    """
+    Calcula o Módulo 11 de vários números de uma vez.
+    Args:
+        numeros: Lista de strings numéricas ou buffer com números separados
+            por espaço em branco/quebra de linha.
+    Returns:
+        ``array('B')`` com um DV por número, na mesma ordem da entrada.
+    """
+    return array(
+        "B",
+        [
+            _MOD11_DV[_soma_modulo_11(_como_bytes(numero)) % 11]
+            for numero in _iterar_numeros(numeros)
+        ],
+    )
@@ -0,0 +1,142 @@
+"""
+Conversão do fator de vencimento para data, com tabela pré-computada.
+
+O fator de vencimento (4 dígitos) conta os dias desde a data base
+07/10/1997. Ao atingir 9999 em 21/02/2025, o fator reiniciou em 1000
+(22/02/2025), conforme FEBRABAN. Por isso o mesmo fator corresponde a mais
+de uma data e a escolha depende de uma data de referência: é usada a data
+que cai na janela [referência - 3000 dias, referência + 5500 dias].
+
+Como só existem 10.000 fatores, cada tabela guarda todas as datas já
+convertidas (date, ISO e dd/mm/aaaa), e as tabelas são memoizadas por data
+de referência.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+DATA_BASE = date(1997, 10, 7)
+
+# Fatores válidos reiniciam em 1000 a cada ciclo de 9000 dias
+FATOR_MINIMO = 1000
+FATOR_MAXIMO = 9999
+DIAS_CICLO = FATOR_MAXIMO - FATOR_MINIMO + 1
+
+# Janela de datas aceitas em torno da data de referência (FEBRABAN)
+DIAS_ANTES_REFERENCIA = 3000
+DIAS_DEPOIS_REFERENCIA = 5500
+
+Fator = Union[int, str]
+
+
+class TabelaFatorVencimento:
+    """Tabela fator → data pré-computada para uma data de referência"""
+
+    __slots__ = ("data_referencia", "datas", "datas_iso", "datas_br")
+
+    def __init__(self, data_referencia: date):
+        self.data_referencia = data_referencia
+        self.datas: Tuple[Optional[date], ...] = tuple(
+            self._calcular_data(fator) for fator in range(FATOR_MAXIMO + 1)
+        )
+        self.datas_iso: Tuple[Optional[str], ...] = tuple(
+            data.isoformat() if data else None for data in self.datas
+        )
+        self.datas_br: Tuple[Optional[str], ...] = tuple(
+            data.strftime("%d/%m/%Y") if data else None for data in self.datas
+        )
+
+    def _calcular_data(self, fator: int) -> Optional[date]:
+        """
+        Calcula a data de um fator considerando o reinício de 2025.
+
+        Args:
+            fator: Fator de vencimento (0-9999)
+
+        Returns:
+            Data de vencimento, ou None para o fator 0 (sem vencimento)
+        """
+        if fator == 0:
+            return None
+
+        data = DATA_BASE + timedelta(days=fator)
+        if fator < FATOR_MINIMO:
+            return data
+
+        inicio = self.data_referencia - timedelta(days=DIAS_ANTES_REFERENCIA)
+        fim = self.data_referencia + timedelta(days=DIAS_DEPOIS_REFERENCIA)
+        ciclo = timedelta(days=DIAS_CICLO)
+
+        candidatas = [data]
+        while candidatas[-1] < fim:
+            candidatas.append(candidatas[-1] + ciclo)
+        for candidata in candidatas:
+            if inicio <= candidata <= fim:
+                return candidata
+        return min(candidatas, key=lambda c: abs(c - self.data_referencia))
+
+    def _indice(self, fator: Fator) -> Optional[int]:
+        """Converte o fator para índice da tabela, ou None se inválido"""
+        try:
+            indice = int(fator)
+        except (ValueError, TypeError):
+            return None
+        return indice if 0 <= indice <= FATOR_MAXIMO else None
+
+    def data(self, fator: Fator) -> Optional[date]:
+        """Retorna a data de vencimento do fator"""
+        indice = self._indice(fator)
+        return self.datas[indice] if indice is not None else None
+
+    def iso(self, fator: Fator) -> Optional[str]:
+        """Retorna a data de vencimento do fator no formato aaaa-mm-dd"""
+        indice = self._indice(fator)
+        return self.datas_iso[indice] if indice is not None else None
+
+    def br(self, fator: Fator) -> Optional[str]:
+        """Retorna a data de vencimento do fator no formato dd/mm/aaaa"""
+        indice = self._indice(fator)
+        return self.datas_br[indice] if indice is not None else None
+
+
+@lru_cache(maxsize=8)
+def _tabela_para(data_referencia: date) -> TabelaFatorVencimento:
+    return TabelaFatorVencimento(data_referencia)
+
+
+def tabela_fator_vencimento(
+    data_referencia: Optional[date] = None,
+) -> TabelaFatorVencimento:
+    """
+    Obtém a tabela fator → data (memoizada por data de referência).
+
+    Args:
+        data_referencia: Data usada para resolver o ciclo do fator
+            (padrão: hoje)
+
+    Returns:
+        Tabela pré-computada
+    """
+    return _tabela_para(data_referencia or date.today())
+
+
+def fator_para_data(
+    fator: Fator, data_referencia: Optional[date] = None
+) -> Optional[date]:
+    """Converte fator de vencimento para date (None se inválido ou 0)"""
+    return tabela_fator_vencimento(data_referencia).data(fator)
+
+
+def fator_para_data_iso(
+    fator: Fator, data_referencia: Optional[date] = None
+) -> Optional[str]:
+    """Converte fator de vencimento para data no formato aaaa-mm-dd"""
+    return tabela_fator_vencimento(data_referencia).iso(fator)
+
+
+def fator_para_data_br(
+    fator: Fator, data_referencia: Optional[date] = None
+) -> Optional[str]:
+    """Converte fator de vencimento para data no formato dd/mm/aaaa"""
+    return tabela_fator_vencimento(data_referencia).br(fator)